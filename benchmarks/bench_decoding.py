@@ -0,0 +1,149 @@
+"""
+Micro-benchmark of the per-page cost of decoding consumption and product pages.
+
+The baseline decodes the response text with the standard library json module and builds a
+Consumption or Product object from each entry, as the client did before pages were decoded
+straight from the response bytes.  The Consumption model of that time, which kept the interval
+start and end as the strings from the API, is copied here as BaselineConsumption so the baseline
+does no more work than the original code did.  Each decoder available in this environment is
+then timed decoding the same bytes.
+
+Run with:
+
+    python benchmarks/bench_decoding.py
+"""
+
+from datetime import datetime, timedelta, timezone
+import json
+import timeit
+from octopus_energy.decoding import (
+    JsonPageDecoder,
+    MsgspecPageDecoder,
+    OrjsonPageDecoder,
+    PageDecoder,
+    msgspec,
+    orjson
+)
+from octopus_energy.model import ClientResponse, Product
+
+PAGE_SIZE: int = 100
+REPEAT: int = 5
+
+def create_consumption_page(entry_count: int) -> bytes:
+    """
+    Creates the body of a page of half-hourly consumption data.
+    """
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return json.dumps({
+        'count': entry_count * 10,
+        'next': 'https://api.octopus.energy/v1/electricity-meter-points/mpan/meters/serial/consumption/?page=2',
+        'previous': None,
+        'results': [
+            {
+                'consumption': round(0.1 + (index % 17) * 0.05, 3),
+                'interval_start': (start + timedelta(minutes=30 * index)).isoformat(),
+                'interval_end': (start + timedelta(minutes=30 * (index + 1))).isoformat()
+            }
+            for index in range(entry_count)
+        ]
+    }).encode()
+
+def create_products_page(entry_count: int) -> bytes:
+    """
+    Creates the body of a page of product data.
+    """
+    return json.dumps({
+        'count': entry_count,
+        'next': None,
+        'previous': None,
+        'results': [
+            {
+                'code': f'PRODUCT-{index}',
+                'direction': 'IMPORT',
+                'full_name': f'Product {index} Full Name',
+                'display_name': f'Product {index}',
+                'description': 'A product description that is a sentence or two long, as in the API.',
+                'is_variable': index % 2 == 0,
+                'is_green': index % 3 == 0,
+                'is_tracker': index % 5 == 0,
+                'is_prepay': False,
+                'is_business': index % 7 == 0,
+                'is_restricted': False,
+                'term': 12,
+                'available_from': '2024-01-01T00:00:00Z',
+                'available_to': None,
+                'links': [
+                    {
+                        'href': f'https://api.octopus.energy/v1/products/PRODUCT-{index}/',
+                        'method': 'GET',
+                        'rel': 'self'
+                    }
+                ],
+                'brand': 'OCTOPUS_ENERGY'
+            }
+            for index in range(entry_count)
+        ]
+    }).encode()
+
+class BaselineConsumption:
+    """
+    Represents consumption data for a given time interval, as the model did originally.
+    """
+    def __init__(self, consumption: float, interval_start, interval_end):
+        self.consumption: float = consumption
+        self.interval_start: str = interval_start
+        self.interval_end: str = interval_end
+
+def decode_consumption_baseline(content: bytes) -> ClientResponse[BaselineConsumption]:
+    """
+    Decodes a page of consumption data as the client did originally.
+    """
+    consumption_data = json.loads(content.decode())
+    return ClientResponse(consumption_data['count'],
+                          consumption_data['next'],
+                          consumption_data['previous'],
+                          [BaselineConsumption(**entry) for entry in consumption_data['results']])
+
+def decode_products_baseline(content: bytes) -> ClientResponse[Product]:
+    """
+    Decodes a page of product data as the client did originally.
+    """
+    product_data = json.loads(content.decode())
+    return ClientResponse(product_data['count'],
+                          product_data['next'],
+                          product_data['previous'],
+                          [Product(**entry) for entry in product_data['results']])
+
+def time_per_page(decode: callable, content: bytes) -> float:
+    """
+    Times the best per-page cost of a decode function in microseconds.
+    """
+    timer = timeit.Timer(lambda: decode(content))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=REPEAT, number=number)) / number * 1_000_000
+
+def main() -> None:
+    """
+    Runs the benchmark and prints the per-page decode cost for each decoder.
+    """
+    decoders: dict[str, PageDecoder] = {'json': JsonPageDecoder()}
+    if orjson is not None:
+        decoders['orjson'] = OrjsonPageDecoder()
+    if msgspec is not None:
+        decoders['msgspec'] = MsgspecPageDecoder()
+
+    consumption_page = create_consumption_page(PAGE_SIZE)
+    products_page = create_products_page(PAGE_SIZE)
+
+    print(f'Per-page decode cost for pages of {PAGE_SIZE} entries (microseconds)')
+    print(f'{"Decoder":<20}{"Consumption":>15}{"Products":>15}')
+    print(f'{"baseline":<20}'
+          f'{time_per_page(decode_consumption_baseline, consumption_page):>15.1f}'
+          f'{time_per_page(decode_products_baseline, products_page):>15.1f}')
+    for name, decoder in decoders.items():
+        print(f'{name:<20}'
+              f'{time_per_page(decoder.decode_consumption_page, consumption_page):>15.1f}'
+              f'{time_per_page(decoder.decode_products_page, products_page):>15.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,308 @@
+"""
+Benchmark suite for the data path, from decoding API pages through the repository to CLI output.
+
+Each benchmark is timed with timeit, taking the best and median of several repeats, and the
+results are written to a JSON file so they can be compared between runs to spot regressions.
+Data comes from the replay client's synthetic generator, so no network is needed.
+
+Run with:
+
+    python benchmarks/suite.py --output benchmark-results.json
+
+or, from the repository root:
+
+    make benchmark
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Callable
+
+os.environ['OEC_OCTOPUS_ENERGY_CLIENT_TYPE'] = 'REPLAY'
+os.environ['OEC_CACHE_ENABLED'] = 'false'
+for variable in ('OCTOPUS_ENERGY_API_KEY',
+                 'OCTOPUS_ENERGY_ACCOUNT_NUMBER',
+                 'OCTOPUS_ENERGY_METER_MPAN',
+                 'OCTOPUS_ENERGY_METER_SERIAL'):
+    os.environ.setdefault(variable, 'benchmark')
+
+# pylint: disable=wrong-import-position
+from energy.conversion import (
+    calculate_power_for_energy,
+    convert_to_co2,
+    convert_to_co2_many,
+    convert_value
+)
+from energy.factors import (
+    calculate_power_for_energy_value,
+    convert_unit_value,
+    convert_value_to_co2
+)
+from energy.units import Wh, hr, kW, kWh
+from octopus_energy.client import OctopusEnergyClient, build_consumption_uri
+from octopus_energy.dates import to_timestamp
+from octopus_energy.model import ConsumptionSeries
+from octopus_energy.replay import ReplayResponse, ReplaySession, create_synthetic_consumption
+from octopus_energy.repository import OctopusEnergyRepository
+from octopus_energy.scheduling import RequestScheduler
+
+DEFAULT_REPEAT: int = 5
+STARTUP_REPEAT: int = 3
+END_DATE: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)
+PERIODS: dict[str, timedelta] = {
+    '1-week': timedelta(weeks=1),
+    '1-year': timedelta(days=365),
+    '5-years': timedelta(days=5 * 365)
+}
+JMESPATH_QUERY: str = '[?consumption > `0.3`].{start: interval_start, kwh: consumption}'
+JMESPATH_MAX_QUERY: str = 'max_by(@, &consumption)'
+
+class StaticSession:
+    """
+    An HTTP session that responds to every request with the same response body, so only the
+    client's own work is timed.
+    """
+    def __init__(self, content: bytes):
+        self.response = ReplayResponse('', 200, content)
+
+    def get(self, url: str, auth=None, timeout=None) -> ReplayResponse:
+        """
+        Responds with the static response.
+        """
+        return self.response
+
+class SeriesClient:
+    """
+    A client that serves a fixed consumption series, so only the repository's own work is timed.
+    """
+    def __init__(self, consumption: ConsumptionSeries):
+        self.consumption = consumption
+
+    def get_consumption(self, from_date=None, to_date=None, grouping='half-hour') -> ConsumptionSeries:
+        """
+        Serves the fixed consumption series.
+        """
+        return self.consumption
+
+def create_unlimited_scheduler() -> RequestScheduler:
+    """
+    Creates a request scheduler that never delays or retries requests.
+    """
+    return RequestScheduler(rate_limit=1e9, burst=1_000_000_000, max_concurrency=1_000, max_retries=0)
+
+def time_function(function: Callable[[], object], repeat: int) -> dict[str, float | int]:
+    """
+    Times a function, returning the best and median time per call in seconds.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    timings = [timing / number for timing in timer.repeat(repeat=repeat, number=number)]
+    return {
+        'number': number,
+        'repeat': repeat,
+        'best_seconds': min(timings),
+        'median_seconds': statistics.median(timings)
+    }
+
+def benchmark_page_decode(repeat: int) -> list[dict]:
+    """
+    Benchmarks decoding a page of consumption data in the client's get_consumption_page.
+    """
+    results = []
+    for page_size in (100, 1000):
+        _, content = ReplaySession(page_size=page_size).respond(
+            build_consumption_uri('mpan', 'serial', END_DATE - timedelta(days=60), END_DATE))
+        client = OctopusEnergyClient('key', 'account', 'mpan', 'serial',
+                                     session=StaticSession(content),
+                                     scheduler=create_unlimited_scheduler())
+        results.append({'group': 'client', 'name': 'get_consumption_page', 'size': f'{page_size}-entries',
+                        **time_function(client.get_consumption_page, repeat)})
+    return results
+
+def benchmark_repository(repository_method: str, repeat: int) -> list[dict]:
+    """
+    Benchmarks a repository method over each period of synthetic half-hourly data.
+    """
+    results = []
+    for period_name, period in PERIODS.items():
+        from_date = END_DATE - period
+        consumption = create_synthetic_consumption(to_timestamp(from_date), to_timestamp(END_DATE))
+        repository = OctopusEnergyRepository(SeriesClient(consumption))
+        method = getattr(repository, repository_method)
+        results.append({'group': 'repository', 'name': repository_method, 'size': period_name,
+                        **time_function(lambda: method(from_date, END_DATE), repeat)})
+    return results
+
+def benchmark_json_output(repeat: int) -> list[dict]:
+    """
+    Benchmarks creating JSON output for a week and a year of consumption data, compact and
+    pretty, with and without a query.
+    """
+    from cli import create_json_output # pylint: disable=import-outside-toplevel
+
+    results = []
+    for period_name in ('1-week', '1-year'):
+        consumption = create_synthetic_consumption(to_timestamp(END_DATE - PERIODS[period_name]), to_timestamp(END_DATE))
+        results += [
+            {'group': 'output', 'name': 'create_json_output', 'size': period_name,
+             **time_function(lambda: create_json_output(consumption, pretty=False), repeat)},
+            {'group': 'output', 'name': 'create_json_output_pretty', 'size': period_name,
+             **time_function(lambda: create_json_output(consumption, pretty=True), repeat)},
+            {'group': 'output', 'name': 'create_json_output_with_query', 'size': period_name,
+             **time_function(lambda: create_json_output(consumption, JMESPATH_QUERY, pretty=False), repeat)},
+            {'group': 'output', 'name': 'create_json_output_with_max_query', 'size': period_name,
+             **time_function(lambda: create_json_output(consumption, JMESPATH_MAX_QUERY, pretty=False), repeat)}
+        ]
+    return results
+
+def benchmark_table_export(repeat: int) -> list[dict]:
+    """
+    Benchmarks exporting a year of consumption data in each export format, in weekly chunks.
+    """
+    import io # pylint: disable=import-outside-toplevel
+    from octopus_energy.export import EXPORT_FORMATS, create_table_writer # pylint: disable=import-outside-toplevel
+
+    consumption = create_synthetic_consumption(to_timestamp(END_DATE - PERIODS['1-year']), to_timestamp(END_DATE))
+    chunk_size = len(create_synthetic_consumption(to_timestamp(END_DATE - PERIODS['1-week']), to_timestamp(END_DATE)))
+
+    def export(export_format: str) -> None:
+        with create_table_writer(export_format, io.BytesIO()) as writer:
+            for start in range(0, len(consumption), chunk_size):
+                writer.write_consumption(consumption[start:start + chunk_size])
+
+    return [{'group': 'export', 'name': export_format, 'size': '1-year',
+             **time_function(lambda export_format=export_format: export(export_format), repeat)}
+            for export_format in EXPORT_FORMATS]
+
+def benchmark_conversions(repeat: int) -> list[dict]:
+    """
+    Benchmarks single-value unit conversions, through pint and through the precomputed factors.
+    """
+    return [
+        {'group': 'conversion', 'name': 'convert_value', 'size': '1-value',
+         **time_function(lambda: convert_value(1.5 * kWh, 1 * Wh), repeat)},
+        {'group': 'conversion', 'name': 'convert_unit_value', 'size': '1-value',
+         **time_function(lambda: convert_unit_value(1.5, 'kWh', 'Wh'), repeat)},
+        {'group': 'conversion', 'name': 'convert_to_co2', 'size': '1-value',
+         **time_function(lambda: convert_to_co2(1.5 * kWh), repeat)},
+        {'group': 'conversion', 'name': 'convert_value_to_co2', 'size': '1-value',
+         **time_function(lambda: convert_value_to_co2(1.5, 'kWh'), repeat)},
+        {'group': 'conversion', 'name': 'calculate_power_for_energy', 'size': '1-value',
+         **time_function(lambda: calculate_power_for_energy(1.5 * kWh, 0.5 * hr, 1 * kW), repeat)},
+        {'group': 'conversion', 'name': 'calculate_power_for_energy_value', 'size': '1-value',
+         **time_function(lambda: calculate_power_for_energy_value(1.5, 'kWh', 0.5, 'h', 'kW'), repeat)}
+    ]
+
+def benchmark_co2_conversion(repeat: int) -> list[dict]:
+    """
+    Benchmarks converting consumption to CO2 record by record and as a single array operation.
+    """
+    week = create_synthetic_consumption(to_timestamp(END_DATE - PERIODS['1-week']), to_timestamp(END_DATE))
+    year = create_synthetic_consumption(to_timestamp(END_DATE - PERIODS['1-year']), to_timestamp(END_DATE))
+    return [
+        {'group': 'conversion', 'name': 'convert_to_co2_per_record', 'size': '1-week',
+         **time_function(lambda: [round(convert_to_co2(value * kWh), 3) for value in week.consumption], repeat)},
+        {'group': 'conversion', 'name': 'convert_to_co2_many', 'size': '1-week',
+         **time_function(lambda: convert_to_co2_many(week.consumption).round(3), repeat)},
+        {'group': 'conversion', 'name': 'convert_to_co2_many', 'size': '1-year',
+         **time_function(lambda: convert_to_co2_many(year.consumption).round(3), repeat)}
+    ]
+
+STARTUP_COMMANDS: dict[str, list[str]] = {
+    'oec --help': ['-m', 'cli.main', '--help'],
+    'import energy': ['-c', 'import energy'],
+    'import energy.units': ['-c', 'import energy.units'],
+    'energy.UNIT_REGISTRY': ['-c', 'import energy; energy.UNIT_REGISTRY.kWh']
+}
+
+def benchmark_startup() -> list[dict]:
+    """
+    Benchmarks the startup time of the CLI with 'oec --help' and the time to import the energy
+    units and build the unit registry, each in a new process.
+    """
+    results = []
+    for name, arguments in STARTUP_COMMANDS.items():
+        timings = []
+        for _ in range(STARTUP_REPEAT):
+            start = timeit.default_timer()
+            completed = subprocess.run([sys.executable, *arguments], capture_output=True, check=False)
+            timings.append(timeit.default_timer() - start)
+            if completed.returncode != 0:
+                results.append({'group': 'cli', 'name': name, 'size': 'startup',
+                                'error': completed.stderr.decode(errors='replace').strip().splitlines()[-1]})
+                break
+        else:
+            results.append({'group': 'cli', 'name': name, 'size': 'startup', 'number': 1,
+                            'repeat': STARTUP_REPEAT, 'best_seconds': min(timings),
+                            'median_seconds': statistics.median(timings)})
+    return results
+
+def run(repeat: int, name_filter: str = None) -> list[dict]:
+    """
+    Runs every benchmark whose group or name contains the filter.
+    """
+    benchmarks: dict[str, Callable[[], list[dict]]] = {
+        'client.get_consumption_page': lambda: benchmark_page_decode(repeat),
+        'repository.get_max_consumption': lambda: benchmark_repository('get_max_consumption', repeat),
+        'repository.get_min_consumption': lambda: benchmark_repository('get_min_consumption', repeat),
+        'repository.get_total_consumption': lambda: benchmark_repository('get_total_consumption', repeat),
+        'output.create_json_output': lambda: benchmark_json_output(repeat),
+        'output.export': lambda: benchmark_table_export(repeat),
+        'conversion': lambda: benchmark_conversions(repeat),
+        'conversion.co2': lambda: benchmark_co2_conversion(repeat),
+        'cli.startup': benchmark_startup
+    }
+
+    results = []
+    for key, benchmark in benchmarks.items():
+        if name_filter is None or name_filter in key:
+            for result in benchmark():
+                print_result(result)
+                results.append(result)
+    return results
+
+def print_result(result: dict) -> None:
+    """
+    Prints a benchmark result as it completes.
+    """
+    label = f'{result['group']}.{result['name']}[{result['size']}]'
+    if 'error' in result:
+        print(f'{label:<55} error: {result['error']}')
+    else:
+        print(f'{label:<55}{result['best_seconds'] * 1_000_000:>15.1f} us'
+              f'{result['median_seconds'] * 1_000_000:>15.1f} us')
+
+def main() -> None:
+    """
+    Runs the benchmark suite and writes the results to a JSON file.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('-o', '--output', default='benchmark-results.json',
+                        help='The JSON file to write the results to.')
+    parser.add_argument('-r', '--repeat', type=int, default=DEFAULT_REPEAT,
+                        help='The number of times to repeat each timing.')
+    parser.add_argument('-k', '--filter', dest='name_filter', default=None,
+                        help='Only run benchmarks whose group or name contains this text.')
+    arguments = parser.parse_args()
+
+    print(f'{"Benchmark":<55}{"Best":>18}{"Median":>18}')
+    results = run(arguments.repeat, arguments.name_filter)
+
+    with open(arguments.output, 'w', encoding='utf-8') as output_file:
+        json.dump({
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'benchmarks': results
+        }, output_file, indent=2)
+    print(f'Results written to {arguments.output}')
+
+if __name__ == '__main__':
+    main()
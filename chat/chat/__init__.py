@@ -4,19 +4,48 @@ Chat module.
 
 import os
 from dotenv import load_dotenv
+from octopus_energy.cache import (
+    CONSUMPTION_CACHE_FILENAME,
+    DEFAULT_CACHE_DIRECTORY,
+    ConsumptionCache
+)
+from octopus_energy.catalogue import PRODUCT_CATALOGUE_FILENAME, ProductCatalogue
 from octopus_energy.client import OctopusEnergyClientFactory
+from octopus_energy.replay import DEFAULT_REPLAY_PAGE_SIZE
 from octopus_energy.repository import OctopusEnergyRepository
 
 load_dotenv()
 
 client_type = os.environ.get('OEC_OCTOPUS_ENERGY_CLIENT_TYPE')
 CONVERTED_CLIENT_TYPE = client_type if client_type is not None and client_type != '' else 'API'
+replay_directory = os.environ.get('OEC_REPLAY_DIRECTORY')
+CONVERTED_REPLAY_DIRECTORY = replay_directory if replay_directory is not None and replay_directory != '' else None
+replay_latency = os.environ.get('OEC_REPLAY_LATENCY')
+CONVERTED_REPLAY_LATENCY = float(replay_latency) if replay_latency is not None and replay_latency != '' else 0.0
+replay_page_size = os.environ.get('OEC_REPLAY_PAGE_SIZE')
+CONVERTED_REPLAY_PAGE_SIZE = int(replay_page_size) if replay_page_size is not None and replay_page_size != '' else DEFAULT_REPLAY_PAGE_SIZE
+
+cache_directory = os.environ.get('OEC_CACHE_DIRECTORY')
+CONVERTED_CACHE_DIRECTORY = cache_directory if cache_directory is not None and cache_directory != '' else DEFAULT_CACHE_DIRECTORY
+cache_enabled = os.environ.get('OEC_CACHE_ENABLED')
+IS_CACHE_ENABLED = cache_enabled is None or cache_enabled == '' or cache_enabled.lower() == 'true'
+
+CONSUMPTION_CACHE = (ConsumptionCache(os.path.join(CONVERTED_CACHE_DIRECTORY, CONSUMPTION_CACHE_FILENAME))
+                     if IS_CACHE_ENABLED else None)
+PRODUCT_CATALOGUE = (ProductCatalogue(os.path.join(CONVERTED_CACHE_DIRECTORY, PRODUCT_CATALOGUE_FILENAME))
+                     if IS_CACHE_ENABLED else None)
 
 OCTOPUS_ENERGY_CLIENT = OctopusEnergyClientFactory().create(
     client_type=CONVERTED_CLIENT_TYPE,
     api_key=os.environ.get('OCTOPUS_ENERGY_API_KEY'),
     account_number=os.environ.get('OCTOPUS_ENERGY_ACCOUNT_NUMBER'),
     meter_mpan=os.environ.get('OCTOPUS_ENERGY_METER_MPAN'),
-    meter_serial=os.environ.get('OCTOPUS_ENERGY_METER_SERIAL'))
+    meter_serial=os.environ.get('OCTOPUS_ENERGY_METER_SERIAL'),
+    fixture_directory=CONVERTED_REPLAY_DIRECTORY,
+    page_size=CONVERTED_REPLAY_PAGE_SIZE,
+    latency=CONVERTED_REPLAY_LATENCY)
 
-OCTOPUS_ENERGY_REPOSITORY = OctopusEnergyRepository(client=OCTOPUS_ENERGY_CLIENT)
+OCTOPUS_ENERGY_REPOSITORY = OctopusEnergyRepository(
+    client=OCTOPUS_ENERGY_CLIENT,
+    cache=CONSUMPTION_CACHE,
+    catalogue=PRODUCT_CATALOGUE)
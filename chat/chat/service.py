@@ -2,26 +2,44 @@
 A service to work with Octopus Energy and other data and functions via AI chat.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime
 import os
+import time
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
 from .tools import tools
+from .tools.memoisation import TOOL_RESULT_CACHE, CacheCounts
+
+DEFAULT_TOOL_TIMEOUT: float = 60.0
+DEFAULT_TOOL_WORKERS: int = 8
 
 class ChatService:
     """
     Works with Octopus Energy and other data and functions via AI chat.
     """
     def __init__(self,
-                 chat_model: BaseChatModel
+                 chat_model: BaseChatModel,
+                 tool_timeout: float = DEFAULT_TOOL_TIMEOUT,
+                 max_tool_workers: int = DEFAULT_TOOL_WORKERS
     ):
         """
         Initializes the Octopus Energy chat.
 
         Args:
             chat_model: The Open AI model.
+            tool_timeout: The maximum time in seconds to wait for each tool called by the model.
+                Defaults to DEFAULT_TOOL_TIMEOUT.
+            max_tool_workers: The maximum number of tools to run concurrently.
+                Defaults to DEFAULT_TOOL_WORKERS.
         """
+        if max_tool_workers < 1:
+            raise ValueError('The maximum number of tool workers must be at least 1.')
+
         self.chat_model = chat_model
+        self.tool_timeout: float = tool_timeout
+        self.max_tool_workers: int = max_tool_workers
 
         self.initialise()
 
@@ -29,7 +47,8 @@ class ChatService:
         """
         Initialises the chat infrastructure.
         """
-        self.runnable_chat = self.chat_model.bind_tools(tools().values())
+        self.tools = tools()
+        self.runnable_chat = self.chat_model.bind_tools(self.tools.values())
         main_chat_prompt_path = f'{os.path.dirname(__file__)}/assets/main_chat_prompt.txt'
         with open(main_chat_prompt_path, 'r', encoding='utf-8') as main_chat_prompt_file:
             self.main_chat_prompt = main_chat_prompt_file.read()
@@ -41,6 +60,11 @@ class ChatService:
         """
         Posts a message to the chat.
 
+        The tools called by the model are run concurrently, and their outputs are added to the
+        chat history in the order the model called them.  The debug messages yielded include the
+        outputs of the tools and the hits and misses of the tool result cache for the tools called
+        in the turn, as well as in total for the process.
+
         Args:
             message: The message to post.
         """
@@ -49,11 +73,87 @@ class ChatService:
         self.chat_history.append(ai_response)
         yield f'Tool Calls: {ai_response.tool_calls}'
 
-        for tool_call in ai_response.tool_calls:
-            selected_tool = tools()[tool_call['name']]
-            tool_output = selected_tool.invoke(tool_call['args'])
-            yield f'Tool {tool_call['name']} Output: {tool_output}'
-            self.chat_history.append(ToolMessage(tool_output, tool_call_id=tool_call['id']))
+        cache_counts = CacheCounts()
+        for tool_call, tool_message in zip(ai_response.tool_calls,
+                                           self.call_tools(ai_response.tool_calls, cache_counts)):
+            yield f'Tool {tool_call['name']} Output: {tool_message.content}'
+            self.chat_history.append(tool_message)
+
+        if ai_response.tool_calls:
+            yield (f'Tool Result Cache: {cache_counts.hits} hits, '
+                   f'{cache_counts.misses} misses this turn '
+                   f'({TOOL_RESULT_CACHE.hits} hits, {TOOL_RESULT_CACHE.misses} misses in total)')
 
         ai_response = self.runnable_chat.invoke(self.chat_history)
         self.chat_history.append(ai_response)
+
+    def call_tools(self, tool_calls: list[dict], cache_counts: CacheCounts = None) -> list[ToolMessage]:
+        """
+        Runs the tools called by the model concurrently.
+
+        A tool that fails, or does not finish within the tool timeout of being called, gives an
+        error message for the model rather than stopping the others.  A tool that times out is
+        left to finish in the background.
+
+        Args:
+            tool_calls: The tool calls, each with the name of the tool, its arguments and an ID.
+            cache_counts: The counts to add the tool result cache hits and misses of the tools
+                to.  Defaults to None, not counting them.
+
+        Returns:
+            list[ToolMessage]: The message with the output of each tool, in the order of the
+            tool calls.
+        """
+        if not tool_calls:
+            return []
+
+        executor = ThreadPoolExecutor(max_workers=min(self.max_tool_workers, len(tool_calls)))
+        try:
+            deadline = time.monotonic() + self.tool_timeout
+            futures = [executor.submit(self.call_tool, tool_call, cache_counts) for tool_call in tool_calls]
+            return [self.get_tool_message(tool_call, future, deadline)
+                    for tool_call, future in zip(tool_calls, futures)]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def call_tool(self, tool_call: dict, cache_counts: CacheCounts = None) -> str:
+        """
+        Runs a tool called by the model.
+
+        Args:
+            tool_call: The tool call.
+            cache_counts: The counts to add the tool result cache hits and misses of the tool to.
+                Defaults to None, not counting them.
+
+        Returns:
+            str: The output of the tool.
+        """
+        selected_tool = self.tools[tool_call['name']]
+        if cache_counts is None:
+            return selected_tool.invoke(tool_call['args'])
+
+        with TOOL_RESULT_CACHE.counting(cache_counts):
+            return selected_tool.invoke(tool_call['args'])
+
+    def get_tool_message(self, tool_call: dict, future: Future, deadline: float) -> ToolMessage:
+        """
+        Waits for the output of a tool and creates the message with it for the model.
+
+        Args:
+            tool_call: The tool call.
+            future: The future running the tool.
+            deadline: The monotonic time by which the tool must finish.
+
+        Returns:
+            ToolMessage: The message with the output of the tool, or the error running it.
+        """
+        try:
+            tool_output = future.result(timeout=max(deadline - time.monotonic(), 0))
+        except FutureTimeoutError:
+            return ToolMessage(f'Error: tool {tool_call['name']} did not finish within {self.tool_timeout} seconds.',
+                               tool_call_id=tool_call['id'],
+                               status='error')
+        except Exception as error: # pylint: disable=broad-exception-caught
+            return ToolMessage(f'Error: {error!r}', tool_call_id=tool_call['id'], status='error')
+
+        return ToolMessage(tool_output, tool_call_id=tool_call['id'])
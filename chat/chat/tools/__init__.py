@@ -4,6 +4,7 @@ AI tools module.
 
 from .account import get_account
 from .consumption import (
+    get_consumption_summary,
     get_max_consumption,
     get_min_consumption,
     get_period_for_grouping,
@@ -17,20 +18,24 @@ from .conversion import (
     convert_power
 )
 
+TOOLS: dict[str, callable] = {
+    'calculate_energy': calculate_energy,
+    'calculate_power': calculate_power,
+    'convert_energy': convert_energy,
+    'convert_energy_to_co2': convert_energy_to_co2,
+    'convert_power': convert_power,
+    'get_account': get_account,
+    'get_consumption_summary': get_consumption_summary,
+    'get_max_consumption': get_max_consumption,
+    'get_min_consumption': get_min_consumption,
+    'get_period_for_grouping': get_period_for_grouping,
+    'get_total_consumption': get_total_consumption
+}
+
 def tools() -> dict[str, callable]:
     """
     Returns:
-        dict[str, callable]: The tools available to the AI copilot.
+        dict[str, callable]: The tools available to the AI copilot, by name.  The same
+        dictionary is returned on every call.
     """
-    return {
-        'calculate_energy': calculate_energy,
-        'calculate_power': calculate_power,
-        'convert_energy': convert_energy,
-        'convert_energy_to_co2': convert_energy_to_co2,
-        'convert_power': convert_power,
-        'get_account': get_account,
-        'get_max_consumption': get_max_consumption,
-        'get_min_consumption': get_min_consumption,
-        'get_period_for_grouping': get_period_for_grouping,
-        'get_total_consumption': get_total_consumption
-    }
+    return TOOLS
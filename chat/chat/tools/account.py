@@ -3,13 +3,15 @@ AI tools for working with account data.
 """
 
 from dotenv import load_dotenv
-import jsonpickle
 from langchain_core.tools import tool
+from octopus_energy.serialization import encode_json
 from .. import OCTOPUS_ENERGY_REPOSITORY
+from .memoisation import TOOL_RESULT_CACHE
 
 load_dotenv()
 
 @tool
+@TOOL_RESULT_CACHE.memoise
 def get_account() -> str:
     """
     Gets the account details as a JSON object from the Octopus Energy API.
@@ -18,4 +20,4 @@ def get_account() -> str:
         str: The account details as a JSON object.
     """
     account = OCTOPUS_ENERGY_REPOSITORY.get_account()
-    return jsonpickle.encode(account)
+    return encode_json(account)
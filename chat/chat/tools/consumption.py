@@ -3,14 +3,16 @@ AI tools for working with consumption data.
 """
 
 from datetime import datetime, timedelta
-import jsonpickle
 from dotenv import load_dotenv
 from langchain_core.tools import tool
+from octopus_energy.serialization import encode_json
 from .. import OCTOPUS_ENERGY_REPOSITORY
+from .memoisation import TOOL_RESULT_CACHE
 
 load_dotenv()
 
 @tool
+@TOOL_RESULT_CACHE.memoise
 def get_max_consumption(from_date: str = None,
                         to_date: str = None,
                         period: str = 'half-hour'
@@ -37,9 +39,10 @@ def get_max_consumption(from_date: str = None,
     end_date = datetime.fromisoformat(to_date) if to_date else None
 
     max_consumption = OCTOPUS_ENERGY_REPOSITORY.get_max_consumption(start_date, end_date, period)
-    return jsonpickle.encode(max_consumption)
+    return encode_json(max_consumption)
 
 @tool
+@TOOL_RESULT_CACHE.memoise
 def get_min_consumption(from_date: str = None,
                         to_date: str = None,
                         period: str = 'half-hour'
@@ -66,9 +69,10 @@ def get_min_consumption(from_date: str = None,
     end_date = datetime.fromisoformat(to_date) if to_date else None
 
     min_consumption = OCTOPUS_ENERGY_REPOSITORY.get_min_consumption(start_date, end_date, period)
-    return jsonpickle.encode(min_consumption)
+    return encode_json(min_consumption)
 
 @tool
+@TOOL_RESULT_CACHE.memoise
 def get_total_consumption(from_date: str = None,
                           to_date: str = None
     ) -> str:
@@ -89,7 +93,36 @@ def get_total_consumption(from_date: str = None,
     end_date = datetime.fromisoformat(to_date) if to_date else None
 
     total_consumption = OCTOPUS_ENERGY_REPOSITORY.get_total_consumption(start_date, end_date)
-    return jsonpickle.encode(total_consumption)
+    return encode_json(total_consumption)
+
+@tool
+@TOOL_RESULT_CACHE.memoise
+def get_consumption_summary(from_date: str = None,
+                            to_date: str = None,
+                            period: str = 'half-hour'
+    ) -> str:
+    """
+    Gets summary statistics for consumption over a given period from the Octopus Energy API as a
+    JSON object, containing the count of periods, the total, mean, median and 95th percentile
+    consumption in kWh, the periods of maximum and minimum consumption and the start and end
+    dates.  Use this to answer several questions about the same period at once.  By default the
+    period is 30 minutes, provided as 'half-hour', but other possibilities include an hour
+    ('hour'), a day ('day'), a week ('week'), a month ('month') and a quarter ('quarter').
+
+    Args:
+        from_date: The start date for the period in ISO-8601 format excluding time zone information.
+        to_date: The end date for the period in ISO-8601 format excluding time zone information.
+        period: The period of time to group the consumption data by.
+            Possible Values: 'half-hour', 'hour', 'day', 'week', 'month', 'quarter'.
+
+    Returns:
+        str: The summary statistics for the consumption data as a JSON object.
+    """
+    start_date = datetime.fromisoformat(from_date) if from_date else None
+    end_date = datetime.fromisoformat(to_date) if to_date else None
+
+    consumption_summary = OCTOPUS_ENERGY_REPOSITORY.summarise_consumption(start_date, end_date, period)
+    return encode_json(consumption_summary)
 
 @tool
 def get_period_for_grouping(from_date: str = None,
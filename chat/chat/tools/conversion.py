@@ -3,17 +3,14 @@ AI tools for performing conversions of energy, power and related units.
 """
 
 from langchain_core.tools import tool
-from pint import Quantity
-from energy.conversion import (
-    calculate_energy_for_power,
-    calculate_power_for_energy,
-    convert_to_co2,
-    convert_value
-)
-from energy.units import (
-    DURATION_UNIT_MAP,
-    ENERGY_UNIT_MAP,
-    POWER_UNIT_MAP
+from energy.factors import (
+    ENERGY_DIMENSION,
+    POWER_DIMENSION,
+    calculate_energy_for_power_value,
+    calculate_power_for_energy_value,
+    convert_unit_value,
+    convert_value_to_co2,
+    get_unit_factor
 )
 
 @tool
@@ -47,7 +44,7 @@ def convert_energy(amount: float,
     Returns:
         float: The amount of energy in the new unit.
     """
-    return convert_amount(amount, from_unit, to_unit, ENERGY_UNIT_MAP)
+    return convert_amount(amount, from_unit, to_unit, ENERGY_DIMENSION)
 
 @tool
 def calculate_energy(power_amount: float,
@@ -89,14 +86,7 @@ def calculate_energy(power_amount: float,
     If no amount is provided then a default of 1 should be used.
     Please notify the user if a default unit or amount is used.
     """
-    sanitised_power_unit = POWER_UNIT_MAP[power_unit.lower()]
-    sanitised_time_unit = DURATION_UNIT_MAP[time_unit.lower()]
-    sanitised_energy_unit = ENERGY_UNIT_MAP[energy_unit.lower()]
-
-    input_power = power_amount * sanitised_power_unit
-    input_duration = time_amount * sanitised_time_unit
-
-    return calculate_energy_for_power(input_power, input_duration, sanitised_energy_unit)
+    return calculate_energy_for_power_value(power_amount, power_unit, time_amount, time_unit, energy_unit)
 
 @tool
 def convert_power(amount: float,
@@ -124,7 +114,7 @@ def convert_power(amount: float,
     Returns:
         float: The amount of power in the new unit.
     """
-    return convert_amount(amount, from_unit, to_unit, POWER_UNIT_MAP)
+    return convert_amount(amount, from_unit, to_unit, POWER_DIMENSION)
 
 @tool
 def calculate_power(energy_amount: float,
@@ -166,14 +156,7 @@ def calculate_power(energy_amount: float,
     If no amount is provided then a default of 1 should be used.
     Please notify the user if a default unit or amount is used.
     """
-    sanitised_energy_unit = ENERGY_UNIT_MAP[energy_unit.lower()]
-    sanitised_time_unit = DURATION_UNIT_MAP[time_unit.lower()]
-    sanitised_power_unit = POWER_UNIT_MAP[power_unit.lower()]
-
-    input_energy = energy_amount * sanitised_energy_unit
-    input_duration = time_amount * sanitised_time_unit
-
-    return calculate_power_for_energy(input_energy, input_duration, sanitised_power_unit)
+    return calculate_power_for_energy_value(energy_amount, energy_unit, time_amount, time_unit, power_unit)
 
 @tool
 def convert_energy_to_co2(energy: float, unit: str) -> float:
@@ -201,14 +184,12 @@ def convert_energy_to_co2(energy: float, unit: str) -> float:
     Returns:
         float: The consumption value converted to the mass of CO2 saved in kg.
     """
-    sanitised_unit = ENERGY_UNIT_MAP[unit.lower()]
-    converted_energy = energy * sanitised_unit
-    return convert_to_co2(converted_energy)
+    return convert_value_to_co2(energy, unit)
 
 def convert_amount(amount: float,
                    from_unit: str,
                    to_unit: str,
-                   unit_map: dict[str, Quantity]
+                   dimension: str
     ) -> float:
     """
     Converts an amount from one unit into another.
@@ -217,12 +198,10 @@ def convert_amount(amount: float,
         amount (float): The amount to convert.
         from_unit (str): The unit to convert from.
         to_unit (str): The unit to convert to.
-        unit_map (dict[str, Quantity]): The mapping of unit symbols to their
-            corresponding quantities.
+        dimension (str): The dimension both units must have, such as '[energy]'.
     """
-    sanitised_from_unit = unit_map[from_unit.lower()]
-    sanitised_to_unit = unit_map[to_unit.lower()]
+    for unit in (from_unit, to_unit):
+        if get_unit_factor(unit).dimension != dimension:
+            raise ValueError(f'Unit {unit} must have units of {dimension.strip('[]')}.')
 
-    input_amount = amount * sanitised_from_unit
-    converted_amount = convert_value(input_amount, sanitised_to_unit)
-    return converted_amount
+    return convert_unit_value(amount, from_unit, to_unit)
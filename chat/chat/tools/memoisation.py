@@ -0,0 +1,222 @@
+"""
+Memoisation of the results of AI tools that fetch Octopus Energy data.
+
+A conversation often asks about the same period more than once, such as for its consumption and
+then for the CO2 saved by it, so tool results are cached by the tool name and its arguments,
+normalised so equivalent calls share a result.  Results for a period that ended long enough ago
+for its data to be settled are kept for a long time, while results that include recent data,
+or have no end date, are only kept briefly.
+
+Hits and misses are counted in total, and can also be counted for a set of calls, such as the
+tools called in one chat turn, with ToolResultCache.counting.
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from functools import wraps
+import inspect
+import threading
+import time
+from typing import Any, Callable, Iterator
+from octopus_energy.cache import DEFAULT_SETTLEMENT_PERIOD
+from octopus_energy.dates import to_timestamp
+
+DEFAULT_SETTLED_TTL: timedelta = timedelta(days=1)
+DEFAULT_RECENT_TTL: timedelta = timedelta(minutes=5)
+DEFAULT_MAX_ENTRIES: int = 256
+
+class CacheCounts:
+    """
+    Represents the hits and misses of a cache during a set of calls.
+    """
+    def __init__(self):
+        """
+        Initialises an instance of the CacheCounts class.
+        """
+        self.hits: int = 0
+        self.misses: int = 0
+
+current_counts: ContextVar[CacheCounts | None] = ContextVar('current_counts', default=None)
+
+class ToolResultCache:
+    """
+    A cache of the results of AI tools, keyed by the tool name and its normalised arguments.
+    """
+    def __init__(self,
+                 settled_ttl: timedelta = DEFAULT_SETTLED_TTL,
+                 recent_ttl: timedelta = DEFAULT_RECENT_TTL,
+                 settlement_period: timedelta = DEFAULT_SETTLEMENT_PERIOD,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialises an instance of the ToolResultCache class.
+
+        Args:
+            settled_ttl (timedelta, optional): The time to keep results for periods whose data
+                is settled.  Defaults to DEFAULT_SETTLED_TTL.
+            recent_ttl (timedelta, optional): The time to keep results for periods including
+                recent data, or with no end date.  Defaults to DEFAULT_RECENT_TTL.
+            settlement_period (timedelta, optional): The time after the end of a period before
+                its data is considered settled.  Defaults to DEFAULT_SETTLEMENT_PERIOD.
+            max_entries (int, optional): The maximum number of results to keep, dropping the
+                least recently used first.  Defaults to DEFAULT_MAX_ENTRIES.
+            clock (Callable[[], float], optional): The current Unix timestamp in seconds.
+                Defaults to time.time.
+        """
+        self.settled_ttl: timedelta = settled_ttl
+        self.recent_ttl: timedelta = recent_ttl
+        self.settlement_period: timedelta = settlement_period
+        self.max_entries: int = max_entries
+        self.clock: Callable[[], float] = clock
+        self.entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def memoise(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps a tool function so its results are cached.
+
+        Apply it beneath the tool decorator, so the tool keeps the function's name, arguments
+        and description.
+
+        Args:
+            function (Callable[..., Any]): The tool function.
+
+        Returns:
+            Callable[..., Any]: The function, returning cached results where available.
+        """
+        signature = inspect.signature(function)
+
+        @wraps(function)
+        def memoised_function(*args, **kwargs) -> Any:
+            bound_arguments = signature.bind(*args, **kwargs)
+            bound_arguments.apply_defaults()
+            arguments = bound_arguments.arguments
+            key = (function.__name__, *((name, normalise_argument(value)) for name, value in arguments.items()))
+
+            is_found, result = self.get(key)
+            if is_found:
+                return result
+
+            result = function(*args, **kwargs)
+            self.set(key, result, self.get_ttl(arguments.get('to_date')))
+            return result
+
+        return memoised_function
+
+    def get(self, key: tuple) -> tuple[bool, Any]:
+        """
+        Gets a cached result, counting the hit or miss.
+
+        Args:
+            key (tuple): The key of the result.
+
+        Returns:
+            tuple[bool, Any]: A value indicating whether an unexpired result was found, and the
+            result if it was.
+        """
+        counts = current_counts.get()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                self.misses += 1
+                if counts is not None:
+                    counts.misses += 1
+                return False, None
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+            if counts is not None:
+                counts.hits += 1
+            return True, entry[1]
+
+    @contextmanager
+    def counting(self, counts: CacheCounts) -> Iterator[CacheCounts]:
+        """
+        Counts the hits and misses of the calls made in the context, in addition to the totals.
+
+        The counts only include calls made in the same thread, or in a context copied from it.
+
+        Args:
+            counts (CacheCounts): The counts to add the hits and misses to.
+
+        Yields:
+            CacheCounts: The counts.
+        """
+        token = current_counts.set(counts)
+        try:
+            yield counts
+        finally:
+            current_counts.reset(token)
+
+    def set(self, key: tuple, result: Any, ttl: timedelta) -> None:
+        """
+        Caches a result.
+
+        Args:
+            key (tuple): The key of the result.
+            result (Any): The result.
+            ttl (timedelta): The time to keep the result.
+        """
+        with self.lock:
+            self.entries[key] = (self.clock() + ttl.total_seconds(), result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def get_ttl(self, to_date: str = None) -> timedelta:
+        """
+        Gets the time to keep a result for a period.
+
+        Args:
+            to_date (str, optional): The end date of the period in ISO-8601 format excluding
+                time zone information.  Defaults to None, for a period up to now.
+
+        Returns:
+            timedelta: The settled TTL if the data for the period is settled, otherwise the
+            recent TTL.
+        """
+        if not to_date:
+            return self.recent_ttl
+
+        try:
+            end = to_timestamp(datetime.fromisoformat(to_date))
+        except ValueError:
+            return self.recent_ttl
+
+        is_settled = end + self.settlement_period.total_seconds() <= self.clock()
+        return self.settled_ttl if is_settled else self.recent_ttl
+
+    def clear(self) -> None:
+        """
+        Removes every cached result and resets the hit and miss counts.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+def normalise_argument(value: Any) -> Any:
+    """
+    Normalises a tool argument, so equivalent dates and times such as '2024-03-01' and
+    '2024-03-01T00:00:00' give the same cache key.
+
+    Args:
+        value (Any): The argument.
+
+    Returns:
+        Any: The normalised argument.
+    """
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).isoformat()
+        except ValueError:
+            return value
+
+    return value
+
+TOOL_RESULT_CACHE = ToolResultCache()
@@ -14,7 +14,6 @@ setup(
     description='Chat infrastructure for working with Octopus Energy and generic energy data.',
     include_package_data=True,
     install_requires=[
-        'jsonpickle',
         'langchain',
         'Pint',
         'python-dotenv',
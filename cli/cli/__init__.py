@@ -2,29 +2,145 @@
 CLI module.
 """
 
+from contextlib import contextmanager
 import os
-from typing import Any
+import sys
+from typing import Any, Callable, Iterator
 from dotenv import load_dotenv
-import jmespath
-import jsonpickle
-from octopus_energy.client import OctopusEnergyClientFactory
-from octopus_energy.repository import OctopusEnergyRepository
 
 load_dotenv()
 
 client_type = os.environ.get('OEC_OCTOPUS_ENERGY_CLIENT_TYPE')
 CONVERTED_CLIENT_TYPE = client_type if client_type is not None and client_type != '' else 'API'
+replay_directory = os.environ.get('OEC_REPLAY_DIRECTORY')
+CONVERTED_REPLAY_DIRECTORY = replay_directory if replay_directory is not None and replay_directory != '' else None
+replay_latency = os.environ.get('OEC_REPLAY_LATENCY')
+CONVERTED_REPLAY_LATENCY = float(replay_latency) if replay_latency is not None and replay_latency != '' else 0.0
+replay_page_size = os.environ.get('OEC_REPLAY_PAGE_SIZE')
 
-OCTOPUS_ENERGY_CLIENT = OctopusEnergyClientFactory().create(
-    client_type=CONVERTED_CLIENT_TYPE,
-    api_key=os.environ.get('OCTOPUS_ENERGY_API_KEY'),
-    account_number=os.environ.get('OCTOPUS_ENERGY_ACCOUNT_NUMBER'),
-    meter_mpan=os.environ.get('OCTOPUS_ENERGY_METER_MPAN'),
-    meter_serial=os.environ.get('OCTOPUS_ENERGY_METER_SERIAL'))
+cache_directory = os.environ.get('OEC_CACHE_DIRECTORY')
+cache_enabled = os.environ.get('OEC_CACHE_ENABLED')
+IS_CACHE_ENABLED = cache_enabled is None or cache_enabled == '' or cache_enabled.lower() == 'true'
 
-OCTOPUS_ENERGY_REPOSITORY = OctopusEnergyRepository(client=OCTOPUS_ENERGY_CLIENT)
+def create_converted_replay_page_size() -> int:
+    """
+    Creates the page size for the replay client from the environment.
+    """
+    from octopus_energy.replay import DEFAULT_REPLAY_PAGE_SIZE # pylint: disable=import-outside-toplevel
+    return int(replay_page_size) if replay_page_size is not None and replay_page_size != '' else DEFAULT_REPLAY_PAGE_SIZE
+
+def create_converted_cache_directory() -> str:
+    """
+    Creates the cache directory from the environment.
+    """
+    from octopus_energy.cache import DEFAULT_CACHE_DIRECTORY # pylint: disable=import-outside-toplevel
+    return cache_directory if cache_directory is not None and cache_directory != '' else DEFAULT_CACHE_DIRECTORY
+
+def create_consumption_cache():
+    """
+    Creates the consumption cache.
+    """
+    from octopus_energy.cache import CONSUMPTION_CACHE_FILENAME, ConsumptionCache # pylint: disable=import-outside-toplevel
+    return ConsumptionCache(os.path.join(get_lazy_attribute('CONVERTED_CACHE_DIRECTORY'), CONSUMPTION_CACHE_FILENAME))
+
+def create_product_catalogue():
+    """
+    Creates the product catalogue.
+    """
+    from octopus_energy.catalogue import PRODUCT_CATALOGUE_FILENAME, ProductCatalogue # pylint: disable=import-outside-toplevel
+    return ProductCatalogue(os.path.join(get_lazy_attribute('CONVERTED_CACHE_DIRECTORY'), PRODUCT_CATALOGUE_FILENAME))
+
+def create_request_scheduler():
+    """
+    Creates the request scheduler shared by the Octopus Energy clients.
+    """
+    from octopus_energy.scheduling import RequestScheduler # pylint: disable=import-outside-toplevel
+    return RequestScheduler()
+
+def create_octopus_energy_client(asynchronous: bool = False):
+    """
+    Creates an Octopus Energy client configured from the environment.
+
+    Args:
+        asynchronous (bool, optional): A value indicating whether to create an asynchronous
+            client.  Defaults to False.
+    """
+    from octopus_energy.client import OctopusEnergyClientFactory # pylint: disable=import-outside-toplevel
+    return OctopusEnergyClientFactory().create(
+        client_type=CONVERTED_CLIENT_TYPE,
+        api_key=os.environ.get('OCTOPUS_ENERGY_API_KEY'),
+        account_number=os.environ.get('OCTOPUS_ENERGY_ACCOUNT_NUMBER'),
+        meter_mpan=os.environ.get('OCTOPUS_ENERGY_METER_MPAN'),
+        meter_serial=os.environ.get('OCTOPUS_ENERGY_METER_SERIAL'),
+        fixture_directory=CONVERTED_REPLAY_DIRECTORY,
+        page_size=get_lazy_attribute('CONVERTED_REPLAY_PAGE_SIZE'),
+        latency=CONVERTED_REPLAY_LATENCY,
+        asynchronous=asynchronous,
+        scheduler=get_lazy_attribute('REQUEST_SCHEDULER'))
+
+def create_octopus_energy_repository():
+    """
+    Creates the Octopus Energy repository.
+    """
+    from octopus_energy.repository import OctopusEnergyRepository # pylint: disable=import-outside-toplevel
+    return OctopusEnergyRepository(
+        client=get_lazy_attribute('OCTOPUS_ENERGY_CLIENT'),
+        cache=get_lazy_attribute('CONSUMPTION_CACHE') if IS_CACHE_ENABLED else None,
+        catalogue=get_lazy_attribute('PRODUCT_CATALOGUE') if IS_CACHE_ENABLED else None)
+
+def create_octopus_energy_async_repository():
+    """
+    Creates the asynchronous Octopus Energy repository.
+    """
+    from octopus_energy.repository import AsyncOctopusEnergyRepository # pylint: disable=import-outside-toplevel
+    return AsyncOctopusEnergyRepository(
+        client=get_lazy_attribute('OCTOPUS_ENERGY_ASYNC_CLIENT'),
+        cache=get_lazy_attribute('CONSUMPTION_CACHE') if IS_CACHE_ENABLED else None,
+        catalogue=get_lazy_attribute('PRODUCT_CATALOGUE') if IS_CACHE_ENABLED else None)
+
+LAZY_ATTRIBUTES: dict[str, Callable[[], Any]] = {
+    'CONVERTED_REPLAY_PAGE_SIZE': create_converted_replay_page_size,
+    'CONVERTED_CACHE_DIRECTORY': create_converted_cache_directory,
+    'CONSUMPTION_CACHE': create_consumption_cache,
+    'PRODUCT_CATALOGUE': create_product_catalogue,
+    'REQUEST_SCHEDULER': create_request_scheduler,
+    'OCTOPUS_ENERGY_CLIENT': create_octopus_energy_client,
+    'OCTOPUS_ENERGY_REPOSITORY': create_octopus_energy_repository,
+    'OCTOPUS_ENERGY_ASYNC_CLIENT': lambda: create_octopus_energy_client(asynchronous=True),
+    'OCTOPUS_ENERGY_ASYNC_REPOSITORY': create_octopus_energy_async_repository
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Creates a module attribute that is only created when first used, such as the Octopus Energy
+    client and repositories, so commands that do not use them do not pay for creating them.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Any: The attribute.
+    """
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = LAZY_ATTRIBUTES[name]()
+    globals()[name] = value
+    return value
+
+def get_lazy_attribute(name: str) -> Any:
+    """
+    Gets a module attribute, creating it if it is lazy and has not been used yet.
+
+    Args:
+        name (str): The name of the attribute.
 
-def create_json_output(value: Any, query: str = None) -> str:
+    Returns:
+        Any: The attribute.
+    """
+    return globals()[name] if name in globals() else __getattr__(name)
+
+def create_json_output(value: Any, query: str = None, pretty: bool = None) -> str:
     """
     Creates a JSON string from an object, optionally filtered and structured with a JMESPath query.
 
@@ -32,21 +148,85 @@ def create_json_output(value: Any, query: str = None) -> str:
         value (Any): The object to serialize.
         query (str, optional): The JMESPath query to filter and structure the output.
             Defaults to None.
+        pretty (bool, optional): A value indicating whether to indent the JSON for reading.
+            Defaults to None, indenting it only if the standard output is a terminal.
     
     Returns:
         str: The filtered and structured JSON string.
     """
+    from octopus_energy.serialization import encode_json # pylint: disable=import-outside-toplevel
+    from .query import search # pylint: disable=import-outside-toplevel
+
+    if pretty is None:
+        pretty = sys.stdout.isatty()
+
     if query:
-        if isinstance(value, list):
-            sanitised_value = [item.__dict__ for item in value]
-        else:
-            sanitised_value = value.__dict__
+        value = search(query, value)
+
+    return encode_json(value, pretty)
+
+def create_json_line(value: Any, query: str = None) -> str:
+    """
+    Creates a compact, single-line JSON string from an object, optionally filtered and structured
+    with a JMESPath query, for newline-delimited JSON (NDJSON) output.
+
+    Args:
+        value (Any): The object to serialize.
+        query (str, optional): The JMESPath query to filter and structure the output.
+            Defaults to None.
+
+    Returns:
+        str: The filtered and structured JSON string.
+    """
+    from octopus_energy.serialization import encode_json # pylint: disable=import-outside-toplevel
+    from .query import search # pylint: disable=import-outside-toplevel
+
+    if query:
+        value = search(query, value)
+
+    return encode_json(value)
+
+def write_output(output: str, output_path: str = None) -> None:
+    """
+    Writes output to a file, or prints it if no file is given.
+
+    Args:
+        output (str): The output.
+        output_path (str, optional): The path of the file to write to.
+            Defaults to None, printing to standard output.
+    """
+    if output_path is None:
+        print(output)
+        return
+
+    with open(output_path, 'w', encoding='utf-8') as output_file:
+        output_file.write(f'{output}\n')
+
+@contextmanager
+def open_table_writer(output_format: str, output_path: str = None) -> Iterator[Any]:
+    """
+    Opens a writer of tables in an export format, such as CSV or Parquet, closing it and the
+    file it writes to when done.
+
+    Args:
+        output_format (str): The export format.
+        output_path (str, optional): The path of the file to write to.
+            Defaults to None, writing to standard output.
+
+    Yields:
+        TableWriter: The writer.
+    """
+    import click # pylint: disable=import-outside-toplevel
+    from octopus_energy.export import create_table_writer # pylint: disable=import-outside-toplevel
 
-        value_to_encode = jmespath.search(query, sanitised_value)
-    else:
-        value_to_encode = value
+    with click.open_file(output_path or '-', 'wb') as output_file:
+        try:
+            writer = create_table_writer(output_format, output_file)
+        except ValueError as error:
+            raise click.UsageError(str(error)) from error
 
-    return jsonpickle.encode(value_to_encode, indent=True)
+        with writer:
+            yield writer
 
 def update_client_credentials(api_key: str = None,
                               number: str = None,
@@ -62,11 +242,12 @@ def update_client_credentials(api_key: str = None,
         meter_mpan: The electricity meter MPAN.
         meter_serial: The electricity meter serial number.
     """
+    client = get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY').client
     if api_key is not None:
-        OCTOPUS_ENERGY_REPOSITORY.client.api_key = api_key
+        client.api_key = api_key
     if number is not None:
-        OCTOPUS_ENERGY_REPOSITORY.client.account_number = number
+        client.account_number = number
     if meter_mpan is not None:
-        OCTOPUS_ENERGY_REPOSITORY.client.meter_mpan = meter_mpan
+        client.meter_mpan = meter_mpan
     if meter_serial is not None:
-        OCTOPUS_ENERGY_REPOSITORY.client.meter_serial = meter_serial
+        client.meter_serial = meter_serial
@@ -6,7 +6,7 @@ from datetime import datetime
 import click
 from mcp.server.fastmcp import FastMCP
 from octopus_energy.model import ConsumptionGrouping
-from . import create_json_output, OCTOPUS_ENERGY_REPOSITORY
+from . import create_json_output, OCTOPUS_ENERGY_ASYNC_REPOSITORY
 
 MCP_SERVER: FastMCP = FastMCP()
 
@@ -25,20 +25,20 @@ def run_mcp_server():
     MCP_SERVER.run()
 
 @MCP_SERVER.tool('oec_get_account', 'Get Octopus Energy account details.')
-def get_account() -> str:
+async def get_account() -> str:
     """
     Gets the Octopus Energy account details.
 
     Returns:
         str: The account details as a JSON object.
     """
-    return create_json_output(OCTOPUS_ENERGY_REPOSITORY.get_account())
+    return create_json_output(await OCTOPUS_ENERGY_ASYNC_REPOSITORY.get_account())
 
 @MCP_SERVER.tool('oec_get_max_consumption',
                  'Get the period with the maximum consumption within a specified date-time range.')
-def get_max_consumption(from_date: str = None,
-                        to_date: str = None,
-                        period: ConsumptionGrouping = 'half-hour'
+async def get_max_consumption(from_date: str = None,
+                              to_date: str = None,
+                              period: ConsumptionGrouping = 'half-hour'
     ) -> str:
     """
     Gets the data for the period of maximum consumption as a JSON object,
@@ -61,14 +61,16 @@ def get_max_consumption(from_date: str = None,
     start_date = datetime.fromisoformat(from_date) if from_date else None
     end_date = datetime.fromisoformat(to_date) if to_date else None
 
-    max_consumption = OCTOPUS_ENERGY_REPOSITORY.get_max_consumption(start_date, end_date, period)
+    max_consumption = await OCTOPUS_ENERGY_ASYNC_REPOSITORY.get_max_consumption(start_date,
+                                                                                end_date,
+                                                                                period)
     return create_json_output(max_consumption)
 
 @MCP_SERVER.tool('oec_get_min_consumption',
                  'Get the period with the minimum consumption within a specified date-time range.')
-def get_min_consumption(from_date: str = None,
-                        to_date: str = None,
-                        period: ConsumptionGrouping = 'half-hour'
+async def get_min_consumption(from_date: str = None,
+                              to_date: str = None,
+                              period: ConsumptionGrouping = 'half-hour'
     ) -> str:
     """
     Gets the data for the period of minimum consumption as a JSON object,
@@ -91,13 +93,15 @@ def get_min_consumption(from_date: str = None,
     start_date = datetime.fromisoformat(from_date) if from_date else None
     end_date = datetime.fromisoformat(to_date) if to_date else None
 
-    min_consumption = OCTOPUS_ENERGY_REPOSITORY.get_min_consumption(start_date, end_date, period)
+    min_consumption = await OCTOPUS_ENERGY_ASYNC_REPOSITORY.get_min_consumption(start_date,
+                                                                                end_date,
+                                                                                period)
     return create_json_output(min_consumption)
 
 @MCP_SERVER.tool('oec_get_total_consumption',
                  'Get the total consumption within a specified date-time range.')
-def get_total_consumption(from_date: str = None,
-                          to_date: str = None
+async def get_total_consumption(from_date: str = None,
+                                to_date: str = None
     ) -> str:
     """
     Gets the total consumption for a given period from the Octopus Energy API as a JSON object,
@@ -115,5 +119,37 @@ def get_total_consumption(from_date: str = None,
     start_date = datetime.fromisoformat(from_date) if from_date else None
     end_date = datetime.fromisoformat(to_date) if to_date else None
 
-    total_consumption = OCTOPUS_ENERGY_REPOSITORY.get_total_consumption(start_date, end_date)
+    total_consumption = await OCTOPUS_ENERGY_ASYNC_REPOSITORY.get_total_consumption(start_date,
+                                                                                    end_date)
     return create_json_output(total_consumption)
+
+@MCP_SERVER.tool('oec_get_consumption_summary',
+                 'Get summary statistics for consumption within a specified date-time range.')
+async def get_consumption_summary(from_date: str = None,
+                                  to_date: str = None,
+                                  period: ConsumptionGrouping = 'half-hour'
+    ) -> str:
+    """
+    Gets summary statistics for consumption over a given period from the Octopus Energy API as a
+    JSON object, containing the count of periods, the total, mean, median and 95th percentile
+    consumption in kWh, the periods of maximum and minimum consumption and the start and end
+    dates.  By default the period is 30 minutes, provided as 'half-hour', but other possibilities
+    include an hour ('hour'), a day ('day'), a week ('week'), a month ('month') and a quarter
+    ('quarter').
+
+    Args:
+        from_date: The start date for the period in ISO-8601 format excluding time zone information.
+        to_date: The end date for the period in ISO-8601 format excluding time zone information.
+        period: The period of time to group the consumption data by.
+            Possible Values: 'half-hour', 'hour', 'day', 'week', 'month', 'quarter'.
+
+    Returns:
+        str: The summary statistics for the consumption data as a JSON object.
+    """
+    start_date = datetime.fromisoformat(from_date) if from_date else None
+    end_date = datetime.fromisoformat(to_date) if to_date else None
+
+    consumption_summary = await OCTOPUS_ENERGY_ASYNC_REPOSITORY.summarise_consumption(start_date,
+                                                                                      end_date,
+                                                                                      period)
+    return create_json_output(consumption_summary)
@@ -4,17 +4,22 @@ CLI commands for working with energy bills.
 
 import os
 import sys
+from typing import TYPE_CHECKING
 import click
 from dotenv import load_dotenv
-from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI
-from bill.extraction import BillExtractor
-from bill.model import EnergyBill
+from bill.model import EnergyBill, Tariff, Usage
+from octopus_energy.serialization import register_schema
 from . import create_json_output
-from .ui.bill import BillUiBuilder
+
+if TYPE_CHECKING:
+    from bill.extraction import BillExtractor
 
 load_dotenv()
 
+register_schema(Tariff, ('name', 'unit_rate', 'payment_method'))
+register_schema(Usage, ('consumption', 'cost', 'meter_reading_start', 'meter_reading_end'))
+register_schema(EnergyBill, ('bill_date', 'supplier', 'distributor', 'property_address', 'usage', 'tariff'))
+
 @click.group('bill')
 def bill_group():
     """
@@ -56,6 +61,10 @@ def read_bill(openai_api_key: str,
     """
     Reads an energy bill from a file.
     """
+    from langchain_core.language_models import BaseChatModel # pylint: disable=import-outside-toplevel
+    from langchain_openai import ChatOpenAI # pylint: disable=import-outside-toplevel
+    from bill.extraction import BillExtractor # pylint: disable=import-outside-toplevel
+
     llm_chat_model: BaseChatModel = ChatOpenAI(api_key=openai_api_key, model=model)
     bill_extractor: BillExtractor = BillExtractor(llm_chat_model)
 
@@ -64,15 +73,17 @@ def read_bill(openai_api_key: str,
     else:
         use_cli(bill_extractor, file, query)
 
-def use_web_ui(bill_extractor: BillExtractor, query: str, open_in_browser: bool):
+def use_web_ui(bill_extractor: 'BillExtractor', query: str, open_in_browser: bool):
     """
     Uses a web UI for the bill extraction.
     """
+    from .ui.bill import BillUiBuilder # pylint: disable=import-outside-toplevel
+
     bill_ui_builder = BillUiBuilder(bill_extractor, query)
     interface = bill_ui_builder.build_ui()
     interface.launch(inbrowser=open_in_browser)
 
-def use_cli(bill_extractor: BillExtractor, bill_file: str, query: str):
+def use_cli(bill_extractor: 'BillExtractor', bill_file: str, query: str):
     """
     Uses a CLI interface for the bill extraction.
     """
@@ -0,0 +1,105 @@
+"""
+CLI commands for working with the local data cache.
+"""
+
+from datetime import datetime
+import os
+import click
+from octopus_energy.cache import ConsumptionCache, MeterCacheSummary
+from octopus_energy.repository import OctopusEnergyRepository
+from . import create_json_output, get_lazy_attribute, IS_CACHE_ENABLED, update_client_credentials
+
+@click.group('cache')
+def cache_group():
+    """
+    Commands for working with the local data cache.
+    """
+
+@cache_group.command('info')
+@click.option('-q', '--query', 'query',
+              type=click.STRING,
+              default=None,
+              help='The JMESPath query to filter and structure the output.')
+def get_cache_info(query: str):
+    """
+    Shows the consumption data cached for each meter.
+    """
+    summaries: list[MeterCacheSummary] = get_consumption_cache().get_summaries()
+
+    output = create_json_output(summaries, query)
+    print(output)
+
+@cache_group.command('warm')
+@click.option('--api-key', 'api_key',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_API_KEY'],
+              help='The Octopus Energy API key (Not recommended).')
+@click.option('-m', '--meter-mpan', 'meter_mpan',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_METER_MPAN'],
+              help='The electricity meter MPAN.')
+@click.option('-s', '--meter-serial', 'meter_serial',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_METER_SERIAL'],
+              help='The electricity meter serial number.')
+@click.option('-f', '--from', 'from_date',
+              type=click.DateTime(),
+              required=True,
+              help='From date.')
+@click.option('-t', '--to', 'to_date',
+              type=click.DateTime(),
+              help='To date.')
+def warm_cache(api_key: str,
+               meter_mpan: str,
+               meter_serial: str,
+               from_date: datetime,
+               to_date: datetime = None
+    ):
+    """
+    Fetches any half-hourly consumption data missing from the cache between two dates.
+    """
+    consumption_cache: ConsumptionCache = get_consumption_cache()
+    update_client_credentials(api_key=api_key,
+                              meter_mpan=meter_mpan,
+                              meter_serial=meter_serial)
+
+    repository = OctopusEnergyRepository(client=get_lazy_attribute('OCTOPUS_ENERGY_CLIENT'), cache=consumption_cache)
+    repository.get_consumption(from_date=from_date, to_date=to_date)
+
+    summaries: list[MeterCacheSummary] = [summary for summary in consumption_cache.get_summaries()
+                                          if summary.meter_mpan == meter_mpan
+                                          and summary.meter_serial == meter_serial]
+    output = create_json_output(summaries)
+    print(output)
+
+@cache_group.command('purge')
+@click.option('-m', '--meter-mpan', 'meter_mpan',
+              type=click.STRING,
+              default=None,
+              help='The electricity meter MPAN to remove data for.  Defaults to all meters.')
+@click.option('-s', '--meter-serial', 'meter_serial',
+              type=click.STRING,
+              default=None,
+              help='The electricity meter serial number to remove data for.  Defaults to all meters.')
+def purge_cache(meter_mpan: str = None,
+                meter_serial: str = None
+    ):
+    """
+    Removes cached consumption data.
+    """
+    removed_slot_count: int = get_consumption_cache().purge(meter_mpan, meter_serial)
+
+    output = create_json_output(removed_slot_count)
+    print(output)
+
+def get_consumption_cache() -> ConsumptionCache:
+    """
+    Gets the consumption cache, opening it if it has not been used yet.
+
+    Returns:
+        ConsumptionCache: The consumption cache.
+    """
+    if not IS_CACHE_ENABLED:
+        raise click.UsageError('The cache is disabled.  Set OEC_CACHE_ENABLED to true to use the cache commands.')
+
+    return get_lazy_attribute('CONSUMPTION_CACHE')
@@ -3,12 +3,13 @@ CLI commands for AI chat.
 """
 
 import os
+from typing import TYPE_CHECKING
 import click
 from colorama import Fore, Style
 from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
-from chat.service import ChatService
-from .ui.chat import ChatUiBuilder
+
+if TYPE_CHECKING:
+    from chat.service import ChatService
 
 COPILOT_MSG = 'Copilot'
 
@@ -65,6 +66,9 @@ def chat(api_key: str,
     Work with Octopus Energy data via natural language chat.
     """
     update_env_credentials(api_key, number, meter_mpan, meter_serial, openai_api_key)
+    from langchain_openai import ChatOpenAI # pylint: disable=import-outside-toplevel
+    from chat.service import ChatService # pylint: disable=import-outside-toplevel
+
     llm_chat_model = ChatOpenAI(api_key=openai_api_key, model=model)
     chat_service = ChatService(llm_chat_model)
     print_chat(COPILOT_MSG, 'Welcome to the Octopus Energy Copilot!')
@@ -102,7 +106,7 @@ def update_env_credentials(api_key: str = None,
     if openai_api_key is not None:
         os.environ['OPENAI_API_KEY'] = openai_api_key
 
-def use_web_ui(chat_service: ChatService,
+def use_web_ui(chat_service: 'ChatService',
                debug: bool,
                open_in_browser: bool
     ) -> None:
@@ -113,11 +117,13 @@ def use_web_ui(chat_service: ChatService,
         chat_service (OctopusEnergyChatService): The chat service.
         debug (bool): A value indicating whether more verbose output should be displayed.
     """
+    from .ui.chat import ChatUiBuilder # pylint: disable=import-outside-toplevel
+
     chat_interface_builder = ChatUiBuilder(chat_service, debug)
     interface = chat_interface_builder.build_ui()
     interface.launch(inbrowser=open_in_browser)
 
-def use_cli(chat_service: ChatService, debug: bool) -> bool:
+def use_cli(chat_service: 'ChatService', debug: bool) -> bool:
     """
     Uses a CLI interface for the chat.
 
@@ -5,11 +5,31 @@ CLI commands for electricity consumption.
 from datetime import datetime
 import os
 import click
-from energy.conversion import convert_to_co2
-from energy.units import kWh
-from octopus_energy.model import Consumption, ConsumptionGrouping
-from . import create_json_output, OCTOPUS_ENERGY_REPOSITORY, update_client_credentials
-from .ui.consumption import ConsumptionUiBuilder
+import numpy as np
+from octopus_energy.cache import SyncResult
+from octopus_energy.export import EXPORT_FORMATS
+from octopus_energy.fleet import (
+    DEFAULT_FLEET_WORKERS,
+    MeterConsumption,
+    OctopusEnergyFleet,
+    load_meters
+)
+from octopus_energy.model import (
+    Consumption,
+    ConsumptionGrouping,
+    ConsumptionSeries,
+    ConsumptionSummary
+)
+from octopus_energy.repository import OctopusEnergyRepository
+from . import (
+    create_json_line,
+    create_json_output,
+    get_lazy_attribute,
+    IS_CACHE_ENABLED,
+    open_table_writer,
+    update_client_credentials,
+    write_output
+)
 
 @click.group('consumption')
 def consumption_group():
@@ -48,6 +68,18 @@ def consumption_group():
               type=click.BOOL,
               is_flag=True,
               help='Show consumption values in kg of CO2 saved.')
+@click.option('--stream', 'stream',
+              type=click.BOOL,
+              is_flag=True,
+              help='Stream consumption as newline-delimited JSON, one entry per line, as it arrives.  Any query is applied to each entry.')
+@click.option('--format', 'output_format',
+              type=click.Choice(['json', *EXPORT_FORMATS]),
+              default='json',
+              help='The format of the output.  Formats other than JSON are written in chunks as the consumption data arrives and cannot be queried.')
+@click.option('-o', '--output', 'output_path',
+              type=click.Path(dir_okay=False, writable=True),
+              default=None,
+              help='The file to write the output to.  Defaults to standard output.')
 def list_consumption(api_key: str,
                     meter_mpan: str,
                     meter_serial: str,
@@ -55,7 +87,10 @@ def list_consumption(api_key: str,
                     to_date: datetime = None,
                     grouping: ConsumptionGrouping = 'half-hour',
                     query: str = None,
-                    co2: bool = False
+                    co2: bool = False,
+                    stream: bool = False,
+                    output_format: str = 'json',
+                    output_path: str = None
     ):
     """
     Lists electricity consumption between two dates.
@@ -63,17 +98,41 @@ def list_consumption(api_key: str,
     update_client_credentials(api_key=api_key,
                               meter_mpan=meter_mpan,
                               meter_serial=meter_serial)
+    repository: OctopusEnergyRepository = get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY')
 
-    consumption: list[Consumption] = OCTOPUS_ENERGY_REPOSITORY.get_consumption(
+    if output_format != 'json':
+        check_export_options(query, stream=stream)
+        with open_table_writer(output_format, output_path) as writer:
+            for consumption_chunk in repository.iter_consumption(from_date=from_date,
+                                                                 to_date=to_date,
+                                                                 grouping=grouping):
+                if co2:
+                    consumption_chunk = convert_consumption_series_to_co2(consumption_chunk)
+                writer.write_consumption(consumption_chunk)
+        return
+
+    if stream:
+        with click.open_file(output_path or '-', 'w', encoding='utf-8') as output_file:
+            for consumption_chunk in repository.iter_consumption(from_date=from_date,
+                                                                 to_date=to_date,
+                                                                 grouping=grouping):
+                if co2:
+                    consumption_chunk = convert_consumption_series_to_co2(consumption_chunk)
+                output_file.writelines(f'{create_json_line(consumption_entry, query)}\n'
+                                       for consumption_entry in consumption_chunk)
+                output_file.flush()
+        return
+
+    consumption: ConsumptionSeries = repository.get_consumption(
         from_date=from_date,
         to_date=to_date,
         grouping=grouping)
 
     if co2:
-        consumption = [convert_consumption_to_co2(c) for c in consumption]
+        consumption = convert_consumption_series_to_co2(consumption)
 
     output = create_json_output(consumption, query)
-    print(output)
+    write_output(output, output_path)
 
 @consumption_group.command('max')
 @click.option('--api-key', 'api_key',
@@ -122,7 +181,7 @@ def get_max_consumption(api_key: str,
                               meter_mpan=meter_mpan,
                               meter_serial=meter_serial)
 
-    max_consumption: Consumption = OCTOPUS_ENERGY_REPOSITORY.get_max_consumption(
+    max_consumption: Consumption = get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY').get_max_consumption(
         from_date=from_date,
         to_date=to_date,
         grouping=grouping)
@@ -180,7 +239,7 @@ def get_min_consumption(api_key: str,
                               meter_mpan=meter_mpan,
                               meter_serial=meter_serial)
 
-    min_consumption: Consumption = OCTOPUS_ENERGY_REPOSITORY.get_min_consumption(
+    min_consumption: Consumption = get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY').get_min_consumption(
         from_date=from_date,
         to_date=to_date,
         grouping=grouping)
@@ -233,7 +292,7 @@ def get_total_consumption(api_key: str,
                               meter_mpan=meter_mpan,
                               meter_serial=meter_serial)
 
-    total_consumption: Consumption = OCTOPUS_ENERGY_REPOSITORY.get_total_consumption(
+    total_consumption: Consumption = get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY').get_total_consumption(
         from_date=from_date,
         to_date=to_date)
 
@@ -243,6 +302,177 @@ def get_total_consumption(api_key: str,
     output = create_json_output(total_consumption, query)
     print(output)
 
+@consumption_group.command('summary')
+@click.option('--api-key', 'api_key',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_API_KEY'],
+              help='The Octopus Energy API key (Not recommended).')
+@click.option('-m', '--meter-mpan', 'meter_mpan',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_METER_MPAN'],
+              help='The electricity meter MPAN.')
+@click.option('-s', '--meter-serial', 'meter_serial',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_METER_SERIAL'],
+              help='The electricity meter serial number.')
+@click.option('-f', '--from', 'from_date',
+              type=click.DateTime(),
+              help='From date.')
+@click.option('-t', '--to', 'to_date',
+              type=click.DateTime(),
+              help='To date.')
+@click.option('-g', '--group', 'grouping',
+              type=click.Choice(['half-hour', 'hour', 'day', 'week', 'month', 'quarter']),
+              default='half-hour',
+              help='The grouping of the consumption data.')
+@click.option('-q', '--query', 'query',
+              type=click.STRING,
+              default=None,
+              help='The JMESPath query to filter and structure the output.')
+def summarise_consumption(api_key: str,
+                          meter_mpan: str,
+                          meter_serial: str,
+                          from_date: datetime = None,
+                          to_date: datetime = None,
+                          grouping: ConsumptionGrouping = 'half-hour',
+                          query: str = None
+    ):
+    """
+    Summarises electricity consumption between two dates.
+    """
+    update_client_credentials(api_key=api_key,
+                              meter_mpan=meter_mpan,
+                              meter_serial=meter_serial)
+
+    consumption_summary: ConsumptionSummary = get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY').summarise_consumption(
+        from_date=from_date,
+        to_date=to_date,
+        grouping=grouping)
+
+    output = create_json_output(consumption_summary, query)
+    print(output)
+
+@consumption_group.command('sync')
+@click.option('--api-key', 'api_key',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_API_KEY'],
+              help='The Octopus Energy API key (Not recommended).')
+@click.option('-m', '--meter-mpan', 'meter_mpan',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_METER_MPAN'],
+              help='The electricity meter MPAN.')
+@click.option('-s', '--meter-serial', 'meter_serial',
+              type=click.STRING,
+              default=os.environ['OCTOPUS_ENERGY_METER_SERIAL'],
+              help='The electricity meter serial number.')
+@click.option('-f', '--from', 'from_date',
+              type=click.DateTime(),
+              help='From date.  Required for the first sync of a meter, otherwise the earliest date to backfill gaps from.')
+@click.option('-t', '--to', 'to_date',
+              type=click.DateTime(),
+              help='To date.')
+@click.option('-q', '--query', 'query',
+              type=click.STRING,
+              default=None,
+              help='The JMESPath query to filter and structure the output.')
+def sync_consumption(api_key: str,
+                     meter_mpan: str,
+                     meter_serial: str,
+                     from_date: datetime = None,
+                     to_date: datetime = None,
+                     query: str = None
+    ):
+    """
+    Syncs new electricity consumption into the local cache and backfills any gaps.
+    """
+    update_client_credentials(api_key=api_key,
+                              meter_mpan=meter_mpan,
+                              meter_serial=meter_serial)
+
+    repository = OctopusEnergyRepository(client=get_lazy_attribute('OCTOPUS_ENERGY_CLIENT'),
+                                         cache=get_lazy_attribute('CONSUMPTION_CACHE'))
+    sync_result: SyncResult = repository.sync_consumption(from_date=from_date, to_date=to_date)
+
+    output = create_json_output(sync_result, query)
+    print(output)
+
+@consumption_group.command('fleet')
+@click.option('--meters', 'meters_path',
+              type=click.Path(exists=True, dir_okay=False),
+              required=True,
+              help='The CSV file of meters, with api_key, account_number, meter_mpan and meter_serial columns.')
+@click.option('-f', '--from', 'from_date',
+              type=click.DateTime(),
+              help='From date.')
+@click.option('-t', '--to', 'to_date',
+              type=click.DateTime(),
+              help='To date.')
+@click.option('-g', '--group', 'grouping',
+              type=click.Choice(['half-hour', 'hour', 'day', 'week', 'month', 'quarter']),
+              default='half-hour',
+              help='The grouping of the consumption data.')
+@click.option('-w', '--workers', 'max_workers',
+              type=click.IntRange(min=1),
+              default=DEFAULT_FLEET_WORKERS,
+              help='The maximum number of meters to fetch concurrently.')
+@click.option('--combined', 'combined',
+              type=click.BOOL,
+              is_flag=True,
+              help='Output a single table of columns for every meter instead of a result per meter.')
+@click.option('-q', '--query', 'query',
+              type=click.STRING,
+              default=None,
+              help='The JMESPath query to filter and structure the output.')
+@click.option('--format', 'output_format',
+              type=click.Choice(['json', *EXPORT_FORMATS]),
+              default='json',
+              help='The format of the output.  Formats other than JSON are written as a single table with a row per interval per meter, meter by meter, and cannot be queried.')
+@click.option('-o', '--output', 'output_path',
+              type=click.Path(dir_okay=False, writable=True),
+              default=None,
+              help='The file to write the output to.  Defaults to standard output.')
+def get_fleet_consumption(meters_path: str,
+                          from_date: datetime = None,
+                          to_date: datetime = None,
+                          grouping: ConsumptionGrouping = 'half-hour',
+                          max_workers: int = DEFAULT_FLEET_WORKERS,
+                          combined: bool = False,
+                          query: str = None,
+                          output_format: str = 'json',
+                          output_path: str = None
+    ):
+    """
+    Lists electricity consumption between two dates for a fleet of meters.
+    """
+    if output_format != 'json':
+        check_export_options(query)
+
+    meters = load_meters(meters_path)
+    with OctopusEnergyFleet(max_workers=max_workers,
+                            cache=get_lazy_attribute('CONSUMPTION_CACHE') if IS_CACHE_ENABLED else None) as fleet:
+        if output_format != 'json':
+            results = fleet.get_consumption(meters, from_date, to_date, grouping)
+            with open_table_writer(output_format, output_path) as writer:
+                for result in results:
+                    if result.error is not None:
+                        click.echo(f'Could not get consumption for meter {result.meter.meter_mpan}: {result.error}',
+                                   err=True)
+                        continue
+                    writer.write_consumption(result.consumption,
+                                             {'meter_mpan': result.meter.meter_mpan,
+                                              'meter_serial': result.meter.meter_serial})
+            return
+
+        if combined:
+            output = create_json_output(fleet.get_consumption_table(meters, from_date, to_date, grouping).to_columns(),
+                                        query)
+        else:
+            output = create_json_output([create_meter_consumption_output(result)
+                                         for result in fleet.get_consumption(meters, from_date, to_date, grouping)],
+                                        query)
+
+    write_output(output, output_path)
+
 @consumption_group.command('ui')
 @click.option('--api-key', 'api_key',
               type=click.STRING,
@@ -271,10 +501,46 @@ def use_consumption_ui(api_key: str,
                               meter_mpan=meter_mpan,
                               meter_serial=meter_serial)
 
-    consumption_ui_builder = ConsumptionUiBuilder(api_key, meter_mpan, meter_serial, OCTOPUS_ENERGY_REPOSITORY)
+    from .ui.consumption import ConsumptionUiBuilder # pylint: disable=import-outside-toplevel
+
+    consumption_ui_builder = ConsumptionUiBuilder(api_key, meter_mpan, meter_serial,
+                                                  get_lazy_attribute('OCTOPUS_ENERGY_REPOSITORY'))
     interface = consumption_ui_builder.build_ui()
     interface.launch(inbrowser=open_in_browser)
 
+def check_export_options(query: str = None, stream: bool = False) -> None:
+    """
+    Checks that options only used with JSON output are not used with an export format.
+
+    Args:
+        query (str, optional): The JMESPath query. Defaults to None.
+        stream (bool, optional): A value indicating whether streaming was requested.
+            Defaults to False.
+    """
+    if query:
+        raise click.UsageError('A query can only be used with JSON output.')
+
+    if stream:
+        raise click.UsageError('Streaming only applies to JSON output; other formats are always written in chunks.')
+
+def create_meter_consumption_output(result: MeterConsumption) -> dict:
+    """
+    Creates the output for a meter's consumption in a fleet, leaving out its API key.
+
+    Args:
+        result (MeterConsumption): The consumption data for the meter, or the error fetching it.
+
+    Returns:
+        dict: The account number, meter MPAN and serial number, with the consumption data or error.
+    """
+    return {
+        'account_number': result.meter.account_number,
+        'meter_mpan': result.meter.meter_mpan,
+        'meter_serial': result.meter.meter_serial,
+        'consumption': list(result.consumption) if result.consumption is not None else None,
+        'error': str(result.error) if result.error is not None else None
+    }
+
 def convert_consumption_to_co2(consumption: Consumption) -> Consumption:
     """
     Converts consumption in kWh to kg of CO2.
@@ -285,8 +551,25 @@ def convert_consumption_to_co2(consumption: Consumption) -> Consumption:
     Returns:
         Consumption: The consumption data in kg of CO2.
     """
-    consumption_in_kwh = consumption.consumption * kWh
-    consumption_in_co2 = round(convert_to_co2(consumption_in_kwh), 3)
+    from energy.factors import convert_value_to_co2 # pylint: disable=import-outside-toplevel
+
+    consumption_in_co2 = round(convert_value_to_co2(consumption.consumption, 'kWh'), 3)
     return Consumption(consumption_in_co2,
                        consumption.interval_start,
                        consumption.interval_end)
+
+def convert_consumption_series_to_co2(consumption: ConsumptionSeries) -> ConsumptionSeries:
+    """
+    Converts a series of consumption in kWh to kg of CO2 in a single operation.
+
+    Args:
+        consumption (ConsumptionSeries): The consumption in kWh.
+
+    Returns:
+        ConsumptionSeries: The consumption data in kg of CO2.
+    """
+    from energy.conversion import convert_to_co2_many # pylint: disable=import-outside-toplevel
+
+    return ConsumptionSeries(np.round(convert_to_co2_many(consumption.consumption), 3),
+                             consumption.interval_starts,
+                             consumption.interval_ends)
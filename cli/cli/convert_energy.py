@@ -3,19 +3,15 @@ CLI commands for working with energy and related values.
 """
 
 import click
-from pint import Quantity
-from energy.conversion import (
-    calculate_power_for_energy,
-    convert_value,
-    convert_to_co2
+from energy.factors import (
+    calculate_power_for_energy_value,
+    convert_unit_value,
+    convert_value_to_co2
 )
 from energy.units import (
     ENERGY_UNITS,
-    ENERGY_UNIT_MAP,
     DURATION_UNITS,
-    DURATION_UNIT_MAP,
-    POWER_UNITS,
-    POWER_UNIT_MAP
+    POWER_UNITS
 )
 from . import create_json_output
 
@@ -43,12 +39,7 @@ def interconvert_energy(from_unit: str,
     """
     Convert an amount of energy from one unit to another.
     """
-    sanitised_from_unit: Quantity = ENERGY_UNIT_MAP[from_unit.lower()]
-    sanitised_to_unit: Quantity = ENERGY_UNIT_MAP[to_unit.lower()]
-
-    input_amount: Quantity = amount * sanitised_from_unit
-    converted_amount: float = convert_value(input_amount,
-                                             sanitised_to_unit)
+    converted_amount: float = convert_unit_value(amount, from_unit, to_unit)
 
     print(create_json_output(converted_amount))
 
@@ -65,10 +56,7 @@ def convert_to_co2_equivalent(unit: str,
     """
     Convert an amount of energy to its equivalent mass of CO2.
     """
-    sanitised_unit: Quantity = ENERGY_UNIT_MAP[unit.lower()]
-
-    input_amount: Quantity = amount * sanitised_unit
-    converted_amount: float = convert_to_co2(input_amount)
+    converted_amount: float = convert_value_to_co2(amount, unit)
 
     print(create_json_output(converted_amount))
 
@@ -98,13 +86,10 @@ def convert_to_power(energy_unit: str,
     """
     Calculate the power for a given amount of energy and duration.
     """
-    sanitised_energy_unit: Quantity = ENERGY_UNIT_MAP[energy_unit.lower()]
-    sanitised_duration_unit: Quantity = DURATION_UNIT_MAP[duration_unit.lower()]
-    sanitised_power_unit: Quantity = POWER_UNIT_MAP[power_unit.lower()]
-
-    input_energy: Quantity = energy_amount * sanitised_energy_unit
-    input_duration: Quantity = duration_amount * sanitised_duration_unit
-
-    power: float = calculate_power_for_energy(input_energy, input_duration, sanitised_power_unit)
+    power: float = calculate_power_for_energy_value(energy_amount,
+                                                    energy_unit,
+                                                    duration_amount,
+                                                    duration_unit,
+                                                    power_unit)
 
     print(create_json_output(power))
@@ -3,15 +3,11 @@ CLI commands for working with power and related values.
 """
 
 import click
-from pint import Quantity
-from energy.conversion import calculate_energy_for_power, convert_value
+from energy.factors import calculate_energy_for_power_value, convert_unit_value
 from energy.units import (
     ENERGY_UNITS,
-    ENERGY_UNIT_MAP,
     DURATION_UNITS,
-    DURATION_UNIT_MAP,
-    POWER_UNITS,
-    POWER_UNIT_MAP
+    POWER_UNITS
 )
 from . import create_json_output
 
@@ -39,12 +35,7 @@ def interconvert_energy(from_unit: str,
     """
     Convert an amount of power from one unit to another.
     """
-    sanitised_from_unit: Quantity = POWER_UNIT_MAP[from_unit.lower()]
-    sanitised_to_unit: Quantity = POWER_UNIT_MAP[to_unit.lower()]
-
-    input_amount: Quantity = amount * sanitised_from_unit
-    converted_amount: float = convert_value(input_amount,
-                                             sanitised_to_unit)
+    converted_amount: float = convert_unit_value(amount, from_unit, to_unit)
 
     print(create_json_output(converted_amount))
 
@@ -74,13 +65,10 @@ def convert_to_power(power_unit: str,
     """
     Calculate the energy for a given amount of power and duration.
     """
-    sanitised_power_unit: Quantity = POWER_UNIT_MAP[power_unit.lower()]
-    sanitised_duration_unit: Quantity = DURATION_UNIT_MAP[duration_unit.lower()]
-    sanitised_energy_unit: Quantity = ENERGY_UNIT_MAP[energy_unit.lower()]
-
-    input_power: Quantity = power_amount * sanitised_power_unit
-    input_duration: Quantity = duration_amount * sanitised_duration_unit
-
-    power: float = calculate_energy_for_power(input_power, input_duration, sanitised_energy_unit)
+    power: float = calculate_energy_for_power_value(power_amount,
+                                                    power_unit,
+                                                    duration_amount,
+                                                    duration_unit,
+                                                    energy_unit)
 
     print(create_json_output(power))
@@ -0,0 +1,65 @@
+"""
+Lazy loading of CLI commands.
+"""
+
+import importlib
+import click
+
+class LazyGroup(click.Group):
+    """
+    A command group whose subcommands are only imported when they are run or their own help is
+    shown, so heavy dependencies of one command do not slow down the start of every command.
+
+    Each lazy subcommand is given as the import path of the module and the name of the command
+    in it, separated by a colon, with a short help text so the group's help can be shown without
+    importing any subcommand.
+    """
+
+    def __init__(self, *args, lazy_commands: dict[str, tuple[str, str]] = None, **kwargs):
+        """
+        Initialises an instance of the LazyGroup class.
+
+        Args:
+            lazy_commands (dict[str, tuple[str, str]], optional): The import path and short help
+                of each lazy subcommand, by name.  Defaults to None, for no lazy subcommands.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: dict[str, tuple[str, str]] = lazy_commands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(super().list_commands(ctx) + list(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            self.add_command(load_command(self.lazy_commands[cmd_name][0]), cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        rows: list[tuple[str, str]] = []
+        for name in self.list_commands(ctx):
+            if name in self.lazy_commands and name not in self.commands:
+                rows.append((name, self.lazy_commands[name][1]))
+                continue
+
+            command = self.get_command(ctx, name)
+            if command is not None and not command.hidden:
+                rows.append((name, command.get_short_help_str(formatter.width - 6 - len(name))))
+
+        if rows:
+            with formatter.section('Commands'):
+                formatter.write_dl(rows)
+
+def load_command(import_path: str) -> click.Command:
+    """
+    Imports a command from its import path.
+
+    Args:
+        import_path (str): The import path of the module and the name of the command in it,
+            separated by a colon.
+
+    Returns:
+        click.Command: The command.
+    """
+    module_name, command_name = import_path.split(':')
+    return getattr(importlib.import_module(module_name), command_name)
@@ -3,15 +3,18 @@ Main program entry point.
 """
 
 import click
-from .account import account_group
-from .bill import bill_group
-from .chat import chat
-from .consumption import consumption_group
-from .convert import convert_group
-from .agent import agent_group
-from .product import product_group
+from .lazy import LazyGroup
 
-@click.group()
+@click.group(cls=LazyGroup, lazy_commands={
+    'account': ('cli.account:account_group', 'Commands for working with your account.'),
+    'agent': ('cli.agent:agent_group', 'Commands for the AI agent server.'),
+    'bill': ('cli.bill:bill_group', 'Commands for working with energy bills.'),
+    'cache': ('cli.cache:cache_group', 'Commands for working with the local data cache.'),
+    'chat': ('cli.chat:chat', 'Work with Octopus Energy data via natural language chat.'),
+    'consumption': ('cli.consumption:consumption_group', 'Commands for electricity consumption.'),
+    'convert': ('cli.convert:convert_group', 'Commands for performing conversions between different units.'),
+    'product': ('cli.product:product_group', 'Commands for energy product information.')
+})
 @click.version_option('0.1.0', prog_name='Octopus Energy Copilot CLI')
 @click.help_option('-h', '--help')
 def main():
@@ -19,13 +22,5 @@ def main():
     Root command for the Octopus Energy Copilot CLI.
     """
 
-main.add_command(account_group)
-main.add_command(agent_group)
-main.add_command(bill_group)
-main.add_command(consumption_group)
-main.add_command(chat)
-main.add_command(convert_group)
-main.add_command(product_group)
-
 if __name__ == '__main__':
     main()
@@ -5,8 +5,15 @@ CLI commands for products.
 from datetime import datetime
 import os
 import click
+from octopus_energy.export import EXPORT_FORMATS
 from octopus_energy.model import Product, ProductFiltering
-from . import create_json_output, OCTOPUS_ENERGY_REPOSITORY, update_client_credentials
+from . import (
+    create_json_output,
+    OCTOPUS_ENERGY_REPOSITORY,
+    open_table_writer,
+    update_client_credentials,
+    write_output
+)
 
 @click.group('product')
 def product_group():
@@ -46,6 +53,14 @@ def product_group():
               type=click.STRING,
               default=None,
               help='The JMESPath query to filter and structure the output.')
+@click.option('--format', 'output_format',
+              type=click.Choice(['json', *EXPORT_FORMATS]),
+              default='json',
+              help='The format of the output.  Formats other than JSON are written as a table with a row per product, with links as JSON in CSV, and cannot be queried.')
+@click.option('-o', '--output', 'output_path',
+              type=click.Path(dir_okay=False, writable=True),
+              default=None,
+              help='The file to write the output to.  Defaults to standard output.')
 def list_products(api_key: str,
                   is_variable: bool,
                   is_green: bool,
@@ -53,7 +68,9 @@ def list_products(api_key: str,
                   is_prepay: bool,
                   is_business: bool,
                   available_at: datetime,
-                  query: str):
+                  query: str,
+                  output_format: str = 'json',
+                  output_path: str = None):
     """
     List products.
     """
@@ -71,7 +88,17 @@ def list_products(api_key: str,
     if is_business:
         filtering = filtering | ProductFiltering.BUSINESS
 
+    if output_format != 'json' and query:
+        raise click.UsageError('A query can only be used with JSON output.')
+
     products: list[Product] = OCTOPUS_ENERGY_REPOSITORY.get_products(available_at, filtering)
 
+    if output_format != 'json':
+        from octopus_energy.serialization import to_plain_value # pylint: disable=import-outside-toplevel
+
+        with open_table_writer(output_format, output_path) as writer:
+            writer.write_records(to_plain_value(products))
+        return
+
     output = create_json_output(products, query)
-    print(output)
+    write_output(output, output_path)
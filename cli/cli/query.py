@@ -0,0 +1,268 @@
+"""
+JMESPath queries over CLI output.
+
+Compiled queries are cached, so a query used repeatedly, such as by each request to the web UI,
+is only parsed once.  When a query is run over a consumption series, the parts of it that only
+filter, select, sort or find the maximum or minimum of the consumption data are run directly
+on the series' arrays, and only what remains of the query is run over plain values.
+"""
+
+from functools import lru_cache
+import operator
+from typing import Any, Callable
+import jmespath
+from jmespath.parser import ParsedResult
+import numpy as np
+from octopus_energy.dates import format_timestamps
+from octopus_energy.model import ConsumptionSeries
+from octopus_energy.serialization import to_plain_value
+
+QUERY_CACHE_SIZE: int = 128
+
+COMPARATORS: dict[str, Callable[[Any, Any], Any]] = {
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'lt': operator.lt,
+    'lte': operator.le,
+    'gt': operator.gt,
+    'gte': operator.ge
+}
+REVERSED_COMPARATORS: dict[str, str] = {
+    'eq': 'eq',
+    'ne': 'ne',
+    'lt': 'gt',
+    'lte': 'gte',
+    'gt': 'lt',
+    'gte': 'lte'
+}
+
+NOT_PUSHED_DOWN = object()
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(query: str) -> ParsedResult:
+    """
+    Compiles a JMESPath query, reusing the compiled query if it has been compiled recently.
+
+    Args:
+        query (str): The JMESPath query.
+
+    Returns:
+        ParsedResult: The compiled query.
+    """
+    return jmespath.compile(query)
+
+def search(query: str, value: Any) -> Any:
+    """
+    Runs a JMESPath query over an object.
+
+    Args:
+        query (str): The JMESPath query.
+        value (Any): The object to query.
+
+    Returns:
+        Any: The result of the query, which may be a consumption series or consumption data
+            rather than plain values if the query was run on a consumption series.
+    """
+    return evaluate(compile_query(query).parsed, value)
+
+def evaluate(node: dict, value: Any) -> Any:
+    """
+    Evaluates a node of a compiled JMESPath query over an object, running it directly on the
+    object if it is a consumption series and the node can be pushed down to it.
+
+    Args:
+        node (dict): The node of the compiled query.
+        value (Any): The object to query.
+
+    Returns:
+        Any: The result of the query.
+    """
+    if isinstance(value, ConsumptionSeries):
+        result = push_down(node, value)
+        if result is not NOT_PUSHED_DOWN:
+            return result
+
+    return ParsedResult('', node).search(to_plain_value(value))
+
+def push_down(node: dict, series: ConsumptionSeries) -> Any:
+    """
+    Evaluates a node of a compiled JMESPath query directly on a consumption series.
+
+    Args:
+        node (dict): The node of the compiled query.
+        series (ConsumptionSeries): The consumption series.
+
+    Returns:
+        Any: The result of the query, or NOT_PUSHED_DOWN if the node cannot be evaluated
+            directly on the series.
+    """
+    node_type = node['type']
+    children = node['children']
+
+    if node_type in ('identity', 'current'):
+        return series
+
+    if node_type == 'flatten':
+        # Flattening a list of objects rather than lists leaves it unchanged.
+        return push_down(children[0], series)
+
+    if node_type in ('projection', 'filter_projection'):
+        source = push_down(children[0], series)
+        if not isinstance(source, ConsumptionSeries):
+            return NOT_PUSHED_DOWN
+
+        if node_type == 'filter_projection':
+            mask = create_mask(children[2], source)
+            if mask is None:
+                return NOT_PUSHED_DOWN
+            source = ConsumptionSeries(source.consumption[mask], source.interval_starts[mask], source.interval_ends[mask])
+
+        return project(children[1], source)
+
+    if node_type == 'function_expression' and node['value'] in ('max_by', 'min_by', 'sort_by'):
+        source = push_down(children[0], series)
+        if not isinstance(source, ConsumptionSeries) or not is_consumption_reference(children[1]):
+            return NOT_PUSHED_DOWN
+
+        if node['value'] == 'sort_by':
+            order = np.argsort(source.consumption, kind='stable')
+            return ConsumptionSeries(source.consumption[order], source.interval_starts[order], source.interval_ends[order])
+
+        if len(source) == 0:
+            return None
+
+        return source[int(np.argmax(source.consumption) if node['value'] == 'max_by' else np.argmin(source.consumption))]
+
+    if node_type == 'index_expression':
+        source = push_down(children[0], series)
+        if not isinstance(source, ConsumptionSeries):
+            return NOT_PUSHED_DOWN
+
+        index = children[1]
+        if index['type'] == 'slice':
+            return source[slice(*index['children'])]
+
+        if index['type'] == 'index':
+            return source[index['value']] if -len(source) <= index['value'] < len(source) else None
+
+        return NOT_PUSHED_DOWN
+
+    if node_type in ('subexpression', 'pipe'):
+        source = push_down(children[0], series)
+        if source is NOT_PUSHED_DOWN:
+            return NOT_PUSHED_DOWN
+
+        if source is None and node_type == 'subexpression':
+            return None
+
+        return evaluate(children[1], source)
+
+    return NOT_PUSHED_DOWN
+
+def project(node: dict, series: ConsumptionSeries) -> Any:
+    """
+    Evaluates the right-hand side of a projection for each interval in a consumption series.
+
+    Args:
+        node (dict): The node of the compiled query to evaluate for each interval.
+        series (ConsumptionSeries): The consumption series.
+
+    Returns:
+        Any: The result of the projection.
+    """
+    if node['type'] == 'identity':
+        return series
+
+    if is_field(node, 'consumption'):
+        return series.consumption.tolist()
+
+    if is_field(node, 'interval_start'):
+        return format_timestamps(series.interval_starts)
+
+    if is_field(node, 'interval_end'):
+        return format_timestamps(series.interval_ends)
+
+    return ParsedResult('', {'type': 'projection',
+                             'children': [{'type': 'identity', 'children': []}, node]}).search(to_plain_value(series))
+
+def create_mask(node: dict, series: ConsumptionSeries) -> np.ndarray | None:
+    """
+    Creates a mask selecting the intervals of a consumption series that match a filter made of
+    comparisons between the consumption and numbers.
+
+    Args:
+        node (dict): The node of the compiled query for the filter.
+        series (ConsumptionSeries): The consumption series.
+
+    Returns:
+        np.ndarray | None: The mask, or None if the filter is not made only of comparisons
+            between the consumption and numbers.
+    """
+    node_type = node['type']
+    children = node['children']
+
+    if node_type in ('and_expression', 'or_expression'):
+        left = create_mask(children[0], series)
+        right = create_mask(children[1], series)
+        if left is None or right is None:
+            return None
+
+        return left & right if node_type == 'and_expression' else left | right
+
+    if node_type == 'not_expression':
+        mask = create_mask(children[0], series)
+        return None if mask is None else ~mask
+
+    if node_type != 'comparator':
+        return None
+
+    comparator = node['value']
+    left, right = children
+    if is_field(right, 'consumption'):
+        left, right = right, left
+        comparator = REVERSED_COMPARATORS[comparator]
+
+    if not is_field(left, 'consumption') or not is_number(right):
+        return None
+
+    return COMPARATORS[comparator](series.consumption, right['value'])
+
+def is_consumption_reference(node: dict) -> bool:
+    """
+    Gets a value indicating whether a node of a compiled JMESPath query is a reference to the
+    consumption field, as used by functions such as max_by.
+
+    Args:
+        node (dict): The node of the compiled query.
+
+    Returns:
+        bool: A value indicating whether the node is a reference to the consumption field.
+    """
+    return node['type'] == 'expref' and is_field(node['children'][0], 'consumption')
+
+def is_field(node: dict, name: str) -> bool:
+    """
+    Gets a value indicating whether a node of a compiled JMESPath query selects a field.
+
+    Args:
+        node (dict): The node of the compiled query.
+        name (str): The name of the field.
+
+    Returns:
+        bool: A value indicating whether the node selects the field.
+    """
+    return node['type'] == 'field' and node['value'] == name
+
+def is_number(node: dict) -> bool:
+    """
+    Gets a value indicating whether a node of a compiled JMESPath query is a number literal.
+
+    Args:
+        node (dict): The node of the compiled query.
+
+    Returns:
+        bool: A value indicating whether the node is a number literal.
+    """
+    return (node['type'] == 'literal'
+            and isinstance(node['value'], (int, float))
+            and not isinstance(node['value'], bool))
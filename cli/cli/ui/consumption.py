@@ -50,7 +50,8 @@ class ConsumptionUiBuilder(BaseUiBuilder):
                                   'List',
                                   'Maximum',
                                   'Minimum',
-                                  'Total'
+                                  'Total',
+                                  'Summary'
                               ]),
                               Textbox(label='From Date', value=self.DEFAULT_FROM_DATE.isoformat()),
                               Textbox(label='To Date', value=self.DEFAULT_TO_DATE.isoformat()),
@@ -118,6 +119,8 @@ def map_ui_data_to_retrieve_to_function(data_to_retrieve: str, repository: Octop
             return repository.get_min_consumption
         case 'Total':
             return repository.get_total_consumption
+        case 'Summary':
+            return repository.summarise_consumption
         case _:
             return repository.get_consumption
 
@@ -131,4 +134,4 @@ def map_ui_grouping_to_consumption_grouping(grouping: str) -> ConsumptionGroupin
     Returns:
         ConsumptionGrouping: The consumption grouping.
     """
-    return '' if grouping == 'Half-Hour' else grouping.lower()
+    return grouping.lower()
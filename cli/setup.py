@@ -23,7 +23,6 @@ setup(
         'colorama',
         'gradio',
         'jmespath',
-        'jsonpickle',
         'langchain',
         'langchain-openai',
         'mcp',
@@ -1,7 +1,63 @@
 """
 Energy module.
+
+The pint unit registry is built on first use of UNIT_REGISTRY, rather than on import, as
+parsing pint's definitions is slow and most uses of this package do not need it.  The parsed
+definitions are cached on disk so later processes build the registry faster.  The registry is
+shared by every package in the process and is also set as pint's application registry, so
+quantities created with pint.Quantity are compatible with it.
 """
 
-from pint import UnitRegistry
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pint import UnitRegistry
+
+UNIT_REGISTRY_CACHE_FOLDER: str = ':auto:'
+UNIT_REGISTRY_CACHE_FOLDER_VARIABLE: str = 'OEC_UNIT_REGISTRY_CACHE_FOLDER'
+
+unit_registry_lock: threading.Lock = threading.Lock()
+
+def create_unit_registry() -> 'UnitRegistry':
+    """
+    Creates the unit registry and sets it as pint's application registry.
+
+    The registry is built from the cached, pre-parsed definitions if they can be read, or
+    written if not.  The cache folder is read from the OEC_UNIT_REGISTRY_CACHE_FOLDER
+    environment variable, defaulting to pint's user cache folder.  If the cache folder cannot be
+    used, the definitions are parsed without it.
+
+    Returns:
+        UnitRegistry: The unit registry.
+    """
+    from pint import UnitRegistry, set_application_registry # pylint: disable=import-outside-toplevel
+
+    cache_folder = os.environ.get(UNIT_REGISTRY_CACHE_FOLDER_VARIABLE) or UNIT_REGISTRY_CACHE_FOLDER
+    try:
+        unit_registry = UnitRegistry(cache_folder=cache_folder)
+    except OSError:
+        unit_registry = UnitRegistry()
+
+    set_application_registry(unit_registry)
+    return unit_registry
+
+def __getattr__(name: str) -> Any:
+    """
+    Creates the shared unit registry when it is first used.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Any: The attribute.
+    """
+    if name != 'UNIT_REGISTRY':
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    with unit_registry_lock:
+        if name not in globals():
+            globals()[name] = create_unit_registry()
 
-UNIT_REGISTRY = UnitRegistry()
+    return globals()[name]
@@ -2,17 +2,18 @@
 Interconversion of energy values and related quantities.
 """
 
+import numpy as np
+from numpy.typing import ArrayLike
 from pint import Quantity
-from .units import kg, kWh
-
-CO2_EMISSION_FACTOR_MAGNITUDE = 0.20707
+from . import units
+from .factors import CO2_EMISSION_FACTOR_MAGNITUDE, convert_unit_value, convert_value_to_co2
 
 def co2_emission_factor() -> Quantity:
     """
     Returns:
         Quantity: The CO2 emission factor for electricity in kg/kWh.
     """
-    return CO2_EMISSION_FACTOR_MAGNITUDE * kg / kWh
+    return CO2_EMISSION_FACTOR_MAGNITUDE * units.kg / units.kWh
 
 def convert_value(amount: Quantity,
                   to_unit: Quantity
@@ -79,6 +80,49 @@ def convert_to_co2(energy: Quantity) -> float:
     if not energy.check('[energy]'):
         raise ValueError('Energy must have units of energy.')
 
-    energy_in_kwh = energy.to(kWh)
+    energy_in_kwh = energy.to(units.kWh)
     mass_co2 = energy_in_kwh * co2_emission_factor()
     return mass_co2.magnitude
+
+def convert_values(values: ArrayLike | Quantity,
+                   from_unit: str,
+                   to_unit: str
+    ) -> np.ndarray:
+    """
+    Converts an array of values from one unit to another in a single operation.
+
+    Args:
+        values (ArrayLike | Quantity): The values to convert, either as plain numbers in the
+            unit to convert from or as a pint array quantity carrying its own unit.
+        from_unit (str): The unit to convert from, if the values are plain numbers.  Ignored
+            for a pint quantity.
+        to_unit (str): The unit to convert to.
+
+    Returns:
+        np.ndarray: The converted values.
+    """
+    if isinstance(values, Quantity):
+        return np.asarray(values.to(to_unit).magnitude, dtype=np.float64)
+
+    return np.asarray(values, dtype=np.float64) * convert_unit_value(1.0, from_unit, to_unit)
+
+def convert_to_co2_many(energy: ArrayLike | Quantity, unit: str = 'kWh') -> np.ndarray:
+    """
+    Converts an array of energy values to the masses of CO2 saved in kg in a single operation.
+
+    Args:
+        energy (ArrayLike | Quantity): The energy values to convert, either as plain numbers in
+            the given unit or as a pint array quantity carrying its own unit.
+        unit (str, optional): The unit of energy, if the values are plain numbers.  Ignored for
+            a pint quantity.  Defaults to 'kWh'.
+
+    Returns:
+        np.ndarray: The energy values converted to the masses of CO2 saved in kg.
+    """
+    if isinstance(energy, Quantity):
+        if not energy.check('[energy]'):
+            raise ValueError('Energy must have units of energy.')
+
+        return np.asarray(energy.to(units.kWh).magnitude, dtype=np.float64) * CO2_EMISSION_FACTOR_MAGNITUDE
+
+    return np.asarray(energy, dtype=np.float64) * convert_value_to_co2(1.0, unit)
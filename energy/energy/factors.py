@@ -0,0 +1,229 @@
+"""
+Fast conversion of values between the units used by the CLI and chat tools.
+
+Each known unit has a precomputed factor to its SI unit, so values are converted with plain
+float arithmetic rather than by building pint quantities and checking their dimensionality on
+every call.  The factors match pint's definitions; pint is still used for arbitrary units by the
+conversion module.
+"""
+
+CO2_EMISSION_FACTOR_MAGNITUDE = 0.20707
+
+ENERGY_DIMENSION: str = '[energy]'
+MASS_DIMENSION: str = '[mass]'
+POWER_DIMENSION: str = '[power]'
+TIME_DIMENSION: str = '[time]'
+
+JOULES_PER_KILOWATT_HOUR: float = 3.6e6
+
+class UnitFactor:
+    """
+    Represents the dimension of a unit and its factor to the SI unit of that dimension.
+    """
+    def __init__(self, symbol: str, dimension: str, factor: float):
+        """
+        Initialises an instance of the UnitFactor class.
+
+        Args:
+            symbol (str): The pint symbol of the unit.
+            dimension (str): The dimension of the unit, such as '[energy]'.
+            factor (float): The value of one of the unit in the SI unit of its dimension.
+        """
+        self.symbol: str = symbol
+        self.dimension: str = dimension
+        self.factor: float = factor
+
+SECOND = UnitFactor('s', TIME_DIMENSION, 1.0)
+MINUTE = UnitFactor('min', TIME_DIMENSION, 60.0)
+HOUR = UnitFactor('h', TIME_DIMENSION, 3600.0)
+
+CALORIE = UnitFactor('cal', ENERGY_DIMENSION, 4.184)
+ELECTRON_VOLT = UnitFactor('eV', ENERGY_DIMENSION, 1.602176634e-19)
+JOULE = UnitFactor('J', ENERGY_DIMENSION, 1.0)
+KILOJOULE = UnitFactor('kJ', ENERGY_DIMENSION, 1e3)
+MEGAJOULE = UnitFactor('MJ', ENERGY_DIMENSION, 1e6)
+WATT_HOUR = UnitFactor('Wh', ENERGY_DIMENSION, 3600.0)
+KILOWATT_HOUR = UnitFactor('kWh', ENERGY_DIMENSION, JOULES_PER_KILOWATT_HOUR)
+MEGAWATT_HOUR = UnitFactor('MWh', ENERGY_DIMENSION, 3.6e9)
+
+KILOGRAM = UnitFactor('kg', MASS_DIMENSION, 1.0)
+TONNE = UnitFactor('t', MASS_DIMENSION, 1e3)
+
+HORSEPOWER = UnitFactor('hp', POWER_DIMENSION, 745.6998715822701)
+WATT = UnitFactor('W', POWER_DIMENSION, 1.0)
+KILOWATT = UnitFactor('kW', POWER_DIMENSION, 1e3)
+MEGAWATT = UnitFactor('MW', POWER_DIMENSION, 1e6)
+
+UNIT_FACTORS: dict[str, UnitFactor] = {
+    's': SECOND,
+    'sec': SECOND,
+    'second': SECOND,
+    'm': MINUTE,
+    'min': MINUTE,
+    'minute': MINUTE,
+    'h': HOUR,
+    'hr': HOUR,
+    'hour': HOUR,
+    'cal': CALORIE,
+    'calorie': CALORIE,
+    'ev': ELECTRON_VOLT,
+    'electronvolt': ELECTRON_VOLT,
+    'j': JOULE,
+    'joule': JOULE,
+    'kj': KILOJOULE,
+    'kilojoule': KILOJOULE,
+    'mj': MEGAJOULE,
+    'megajoule': MEGAJOULE,
+    'wh': WATT_HOUR,
+    'watt-hour': WATT_HOUR,
+    'kwh': KILOWATT_HOUR,
+    'kilowatt-hour': KILOWATT_HOUR,
+    'mwh': MEGAWATT_HOUR,
+    'megawatt-hour': MEGAWATT_HOUR,
+    'kg': KILOGRAM,
+    'kilogram': KILOGRAM,
+    'tonne': TONNE,
+    'hp': HORSEPOWER,
+    'horsepower': HORSEPOWER,
+    'w': WATT,
+    'watt': WATT,
+    'kw': KILOWATT,
+    'kilowatt': KILOWATT,
+    'mw': MEGAWATT,
+    'megawatt': MEGAWATT,
+}
+
+def get_unit_factor(unit: str) -> UnitFactor:
+    """
+    Gets the conversion factor for a known unit.
+
+    Args:
+        unit (str): The unit, case-insensitively, such as 'kWh' or 'kilowatt-hour'.
+
+    Returns:
+        UnitFactor: The conversion factor for the unit.
+    """
+    unit_factor = UNIT_FACTORS.get(unit.lower())
+    if unit_factor is None:
+        raise ValueError(f'Unknown unit: {unit}')
+
+    return unit_factor
+
+def convert_unit_value(amount: float,
+                       from_unit: str,
+                       to_unit: str
+    ) -> float:
+    """
+    Converts an amount from one known unit to another.
+
+    Args:
+        amount (float): The amount to convert.
+        from_unit (str): The unit to convert from.
+        to_unit (str): The unit to convert to.
+
+    Returns:
+        float: The amount in the unit to convert to.
+    """
+    from_factor = get_unit_factor(from_unit)
+    to_factor = get_unit_factor(to_unit)
+    if from_factor.dimension != to_factor.dimension:
+        # Raised as pint would, so callers handle both conversion paths the same way.
+        from pint.errors import DimensionalityError # pylint: disable=import-outside-toplevel
+        raise DimensionalityError(from_factor.symbol,
+                                  to_factor.symbol,
+                                  from_factor.dimension,
+                                  to_factor.dimension)
+
+    if from_factor is to_factor:
+        return amount
+
+    return amount * from_factor.factor / to_factor.factor
+
+def calculate_power_for_energy_value(energy: float,
+                                     energy_unit: str,
+                                     duration: float,
+                                     duration_unit: str,
+                                     power_unit: str
+    ) -> float:
+    """
+    Converts an amount of energy in a known unit to power with a given duration.
+
+    Args:
+        energy (float): The amount of energy.
+        energy_unit (str): The unit of energy.
+        duration (float): The duration.
+        duration_unit (str): The unit of duration.
+        power_unit (str): The unit of power to convert to.
+
+    Returns:
+        float: The power in the unit of power.
+    """
+    energy_factor = get_unit_factor(energy_unit)
+    duration_factor = get_unit_factor(duration_unit)
+    power_factor = get_unit_factor(power_unit)
+
+    if energy_factor.dimension != ENERGY_DIMENSION:
+        raise ValueError('Energy must have units of energy.')
+
+    if duration_factor.dimension != TIME_DIMENSION:
+        raise ValueError('Duration must have units of time.')
+
+    if duration == 0:
+        raise ValueError('Duration must have a value greater than 0.')
+
+    if power_factor.dimension != POWER_DIMENSION:
+        raise ValueError('Unit to convert to must have units of power.')
+
+    return (energy * energy_factor.factor) / (duration * duration_factor.factor) / power_factor.factor
+
+def calculate_energy_for_power_value(power: float,
+                                     power_unit: str,
+                                     duration: float,
+                                     duration_unit: str,
+                                     energy_unit: str
+    ) -> float:
+    """
+    Converts an amount of power in a known unit to energy with a given duration.
+
+    Args:
+        power (float): The amount of power.
+        power_unit (str): The unit of power.
+        duration (float): The duration.
+        duration_unit (str): The unit of duration.
+        energy_unit (str): The unit of energy to convert to.
+
+    Returns:
+        float: The energy in the unit of energy.
+    """
+    power_factor = get_unit_factor(power_unit)
+    duration_factor = get_unit_factor(duration_unit)
+    energy_factor = get_unit_factor(energy_unit)
+
+    if power_factor.dimension != POWER_DIMENSION:
+        raise ValueError('Power must have units of power.')
+
+    if duration_factor.dimension != TIME_DIMENSION:
+        raise ValueError('Duration must have units of time.')
+
+    if energy_factor.dimension != ENERGY_DIMENSION:
+        raise ValueError('Unit to convert to must have units of energy.')
+
+    return (power * power_factor.factor) * (duration * duration_factor.factor) / energy_factor.factor
+
+def convert_value_to_co2(energy: float, unit: str) -> float:
+    """
+    Converts an amount of energy in a known unit to the mass of CO2 saved in kg.
+
+    Args:
+        energy (float): The amount of energy.
+        unit (str): The unit of energy.
+
+    Returns:
+        float: The energy converted to the mass of CO2 saved in kg.
+    """
+    energy_factor = get_unit_factor(unit)
+    if energy_factor.dimension != ENERGY_DIMENSION:
+        raise ValueError('Energy must have units of energy.')
+
+    energy_in_kwh = energy * energy_factor.factor / JOULES_PER_KILOWATT_HOUR
+    return energy_in_kwh * CO2_EMISSION_FACTOR_MAGNITUDE
@@ -1,33 +1,39 @@
 """
 Defines constants for energy units.
+
+The unit constants and unit maps use the shared unit registry, so they are only created when
+first used.  The lists of unit names do not, so they can be used, such as for validating
+options, without building the registry.
 """
 
-from . import UNIT_REGISTRY
-
-# Duration
-s = UNIT_REGISTRY.second
-min = UNIT_REGISTRY.minute
-hr = UNIT_REGISTRY.hour
-
-# Energy
-cal = UNIT_REGISTRY.calorie
-eV = UNIT_REGISTRY.electron_volt
-J = UNIT_REGISTRY.joule
-kJ = UNIT_REGISTRY.kilojoule
-MJ = UNIT_REGISTRY.megajoule
-Wh = UNIT_REGISTRY.watt_hour
-kWh = UNIT_REGISTRY.kilowatt_hour
-MWh = UNIT_REGISTRY.megawatt_hour
-
-# Mass
-kg = UNIT_REGISTRY.kilogram
-tonne = UNIT_REGISTRY.tonne
-
-# Power
-hp = UNIT_REGISTRY.horsepower
-W = UNIT_REGISTRY.watt
-kW = UNIT_REGISTRY.kilowatt
-MW = UNIT_REGISTRY.megawatt
+from typing import Any
+
+UNIT_NAMES: dict[str, str] = {
+    # Duration
+    's': 'second',
+    'min': 'minute',
+    'hr': 'hour',
+
+    # Energy
+    'cal': 'calorie',
+    'eV': 'electron_volt',
+    'J': 'joule',
+    'kJ': 'kilojoule',
+    'MJ': 'megajoule',
+    'Wh': 'watt_hour',
+    'kWh': 'kilowatt_hour',
+    'MWh': 'megawatt_hour',
+
+    # Mass
+    'kg': 'kilogram',
+    'tonne': 'tonne',
+
+    # Power
+    'hp': 'horsepower',
+    'W': 'watt',
+    'kW': 'kilowatt',
+    'MW': 'megawatt',
+}
 
 DURATION_UNITS = [
     's', 'sec', 'second',
@@ -35,16 +41,16 @@ DURATION_UNITS = [
     'h', 'hr', 'hour'
 ]
 
-DURATION_UNIT_MAP = {
-    's': s,
-    'sec': s,
-    'second': s,
-    'm': min,
-    'min': min,
-    'minute': min,
-    'h': hr,
-    'hr': hr,
-    'hour': hr,
+DURATION_UNIT_CONSTANTS: dict[str, str] = {
+    's': 's',
+    'sec': 's',
+    'second': 's',
+    'm': 'min',
+    'min': 'min',
+    'minute': 'min',
+    'h': 'hr',
+    'hr': 'hr',
+    'hour': 'hr',
 }
 
 ENERGY_UNITS = [
@@ -58,17 +64,17 @@ ENERGY_UNITS = [
     'mwh', 'MWh', 'megawatt-hour',
 ]
 
-ENERGY_UNIT_MAP = {
-    'cal': cal,
-    'calorie': cal,
-    'ev': eV,
-    'electronvolt': eV,
-    'j': J,
-    'kj': kJ,
-    'mj': MJ,
-    'wh': Wh,
-    'kwh': kWh,
-    'mwh': MWh,
+ENERGY_UNIT_CONSTANTS: dict[str, str] = {
+    'cal': 'cal',
+    'calorie': 'cal',
+    'ev': 'eV',
+    'electronvolt': 'eV',
+    'j': 'J',
+    'kj': 'kJ',
+    'mj': 'MJ',
+    'wh': 'Wh',
+    'kwh': 'kWh',
+    'mwh': 'MWh',
 }
 
 POWER_UNITS = [
@@ -78,9 +84,37 @@ POWER_UNITS = [
     'mw', 'MW', 'megawatt',
 ]
 
-POWER_UNIT_MAP = {
-    'hp': hp,
-    'w': W,
-    'kw': kW,
-    'mw': MW,
+POWER_UNIT_CONSTANTS: dict[str, str] = {
+    'hp': 'hp',
+    'w': 'W',
+    'kw': 'kW',
+    'mw': 'MW',
 }
+
+UNIT_MAP_CONSTANTS: dict[str, dict[str, str]] = {
+    'DURATION_UNIT_MAP': DURATION_UNIT_CONSTANTS,
+    'ENERGY_UNIT_MAP': ENERGY_UNIT_CONSTANTS,
+    'POWER_UNIT_MAP': POWER_UNIT_CONSTANTS,
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Creates a unit constant, such as kWh, or a unit map, such as ENERGY_UNIT_MAP, from the shared
+    unit registry when it is first used.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        Any: The attribute.
+    """
+    if name in UNIT_NAMES:
+        from . import UNIT_REGISTRY # pylint: disable=import-outside-toplevel
+        value = getattr(UNIT_REGISTRY, UNIT_NAMES[name])
+    elif name in UNIT_MAP_CONSTANTS:
+        value = {unit: __getattr__(constant) for unit, constant in UNIT_MAP_CONSTANTS[name].items()}
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    globals()[name] = value
+    return value
@@ -10,6 +10,7 @@ setup(
     author='Benedict W. Hazel',
     description='Energy data units and operations.',
     install_requires=[
+        'numpy',
         'Pint'
     ]
 )
@@ -0,0 +1,542 @@
+"""
+A persistent cache for consumption data from the Octopus Energy API.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Iterable
+from .dates import (
+    HALF_HOUR_SECONDS,
+    ceil_half_hour,
+    format_timestamp
+)
+from .model import ConsumptionSeries
+
+DEFAULT_CACHE_DIRECTORY: str = os.path.join(os.path.expanduser('~'), '.cache', 'octopus-energy-copilot')
+CONSUMPTION_CACHE_FILENAME: str = 'consumption.sqlite3'
+DEFAULT_SETTLEMENT_PERIOD: timedelta = timedelta(days=2)
+DEFAULT_REFRESH_INTERVAL: timedelta = timedelta(hours=1)
+MAX_FETCH_GAP_SLOTS: int = 48
+
+class MeterCacheSummary:
+    """
+    Represents a summary of the consumption data cached for a meter.
+    """
+    def __init__(self,
+                 meter_mpan: str,
+                 meter_serial: str,
+                 slot_count: int,
+                 empty_slot_count: int,
+                 interval_start: str,
+                 interval_end: str,
+                 last_fetched_at: str
+        ):
+        """
+        Initialises an instance of the MeterCacheSummary class.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            slot_count (int): The number of half-hour slots cached.
+            empty_slot_count (int): The number of cached half-hour slots with no data.
+            interval_start (str): The start of the earliest cached slot.
+            interval_end (str): The end of the latest cached slot.
+            last_fetched_at (str): The date and time data was last fetched for the meter.
+        """
+        self.meter_mpan: str = meter_mpan
+        self.meter_serial: str = meter_serial
+        self.slot_count: int = slot_count
+        self.empty_slot_count: int = empty_slot_count
+        self.interval_start: str = interval_start
+        self.interval_end: str = interval_end
+        self.last_fetched_at: str = last_fetched_at
+
+class SyncResult:
+    """
+    Represents the result of an incremental sync of consumption data for a meter.
+    """
+    def __init__(self,
+                 meter_mpan: str,
+                 meter_serial: str,
+                 new_slot_count: int,
+                 updated_slot_count: int,
+                 backfilled_slot_count: int,
+                 high_water_mark: str
+        ):
+        """
+        Initialises an instance of the SyncResult class.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            new_slot_count (int): The number of half-hour slots with data added after the previous
+                high-water mark.
+            updated_slot_count (int): The number of cached half-hour slots with changed data.
+            backfilled_slot_count (int): The number of half-hour slots with data added to gaps
+                before the previous high-water mark.
+            high_water_mark (str): The end of the latest synced slot with data.
+        """
+        self.meter_mpan: str = meter_mpan
+        self.meter_serial: str = meter_serial
+        self.new_slot_count: int = new_slot_count
+        self.updated_slot_count: int = updated_slot_count
+        self.backfilled_slot_count: int = backfilled_slot_count
+        self.high_water_mark: str = high_water_mark
+
+class ConsumptionCache:
+    """
+    A persistent SQLite cache of half-hourly consumption data keyed by meter and half-hour slot.
+
+    Every slot in a fetched range is recorded, including slots the API had no data for, so only
+    ranges that have never been fetched are requested again.  Slots fetched before the end of
+    the settlement period may still change, so they are treated as stale and fetched again once
+    the refresh interval has passed.  Slots fetched after the end of the settlement period are
+    final, even if they had no data.
+    """
+
+    def __init__(self,
+                 path: str,
+                 settlement_period: timedelta = DEFAULT_SETTLEMENT_PERIOD,
+                 refresh_interval: timedelta = DEFAULT_REFRESH_INTERVAL,
+                 clock: Callable[[], float] = time.time
+        ):
+        """
+        Initialises an instance of the ConsumptionCache class.
+
+        Args:
+            path (str): The path of the cache database file.
+            settlement_period (timedelta, optional): The time after the end of a slot before its
+                data is considered final.  Defaults to DEFAULT_SETTLEMENT_PERIOD.
+            refresh_interval (timedelta, optional): The time after which unsettled slots are
+                fetched again.  Defaults to DEFAULT_REFRESH_INTERVAL.
+            clock (Callable[[], float], optional): The current Unix timestamp in seconds, used
+                when no time is given.  Defaults to time.time.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.path: str = path
+        self.settlement_period: timedelta = settlement_period
+        self.refresh_interval: timedelta = refresh_interval
+        self.clock: Callable[[], float] = clock
+        self.lock: threading.Lock = threading.Lock()
+        self.connection: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self.initialise()
+
+    def initialise(self) -> None:
+        """
+        Creates the cache tables if they do not exist.
+        """
+        with self.lock, self.connection:
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS consumption (
+                    meter_mpan TEXT NOT NULL,
+                    meter_serial TEXT NOT NULL,
+                    interval_start INTEGER NOT NULL,
+                    interval_end INTEGER NOT NULL,
+                    consumption REAL,
+                    fetched_at INTEGER NOT NULL,
+                    PRIMARY KEY (meter_mpan, meter_serial, interval_start)
+                ) WITHOUT ROWID
+            ''')
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    meter_mpan TEXT NOT NULL,
+                    meter_serial TEXT NOT NULL,
+                    high_water_mark INTEGER NOT NULL,
+                    synced_at INTEGER NOT NULL,
+                    PRIMARY KEY (meter_mpan, meter_serial)
+                ) WITHOUT ROWID
+            ''')
+
+    def close(self) -> None:
+        """
+        Closes the connection to the cache database.
+        """
+        self.connection.close()
+
+    def get_consumption(self,
+                        meter_mpan: str,
+                        meter_serial: str,
+                        from_timestamp: int,
+                        to_timestamp: int
+        ) -> ConsumptionSeries:
+        """
+        Gets the cached consumption data for the half-hour slots between two times.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            from_timestamp (int): The Unix timestamp to get slots from, inclusive.
+            to_timestamp (int): The Unix timestamp to get slots to, exclusive.
+
+        Returns:
+            ConsumptionSeries: The cached consumption data in time order.
+        """
+        with self.lock:
+            rows = self.connection.execute('''
+                SELECT consumption, interval_start, interval_end
+                FROM consumption
+                WHERE meter_mpan = ? AND meter_serial = ?
+                    AND interval_start >= ? AND interval_start < ?
+                    AND consumption IS NOT NULL
+                ORDER BY interval_start
+            ''', (meter_mpan, meter_serial, ceil_half_hour(from_timestamp), to_timestamp)).fetchall()
+
+        if not rows:
+            return ConsumptionSeries()
+
+        consumption, interval_starts, interval_ends = zip(*rows)
+        return ConsumptionSeries(consumption, interval_starts, interval_ends)
+
+    def find_missing_ranges(self,
+                            meter_mpan: str,
+                            meter_serial: str,
+                            from_timestamp: int,
+                            to_timestamp: int,
+                            now: int = None
+        ) -> list[tuple[int, int]]:
+        """
+        Finds the ranges of half-hour slots between two times that are not cached or are stale.
+
+        Nearby ranges are merged so that a scattering of stale slots is fetched in a few
+        requests rather than one per slot.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            from_timestamp (int): The Unix timestamp to check slots from, inclusive.
+            to_timestamp (int): The Unix timestamp to check slots to, exclusive.
+            now (int, optional): The current Unix timestamp.
+                Defaults to None, using the current time.
+
+        Returns:
+            list[tuple[int, int]]: The start, inclusive, and end, exclusive, Unix timestamps of
+            each range to fetch.
+        """
+        now = now if now is not None else int(self.clock())
+        first_slot = ceil_half_hour(from_timestamp)
+        end_slot = ceil_half_hour(to_timestamp)
+
+        with self.lock:
+            rows = self.connection.execute('''
+                SELECT interval_start, interval_end, fetched_at
+                FROM consumption
+                WHERE meter_mpan = ? AND meter_serial = ?
+                    AND interval_start >= ? AND interval_start < ?
+            ''', (meter_mpan, meter_serial, first_slot, end_slot)).fetchall()
+
+        fresh_slots = {interval_start for interval_start, interval_end, fetched_at in rows
+                       if not self.is_stale(interval_end, fetched_at, now)}
+
+        return group_slots(slot for slot in range(first_slot, end_slot, HALF_HOUR_SECONDS)
+                           if slot not in fresh_slots)
+
+    def find_gaps(self,
+                  meter_mpan: str,
+                  meter_serial: str,
+                  from_timestamp: int,
+                  to_timestamp: int
+        ) -> list[tuple[int, int]]:
+        """
+        Finds the ranges of half-hour slots between two times without any cached data.
+
+        Unlike missing ranges, gaps include slots that were fetched but had no data at the time,
+        as the data may have arrived since, unless they were fetched after the end of their
+        settlement period, when no more data is expected.  Nearby gaps are merged as for missing
+        ranges.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            from_timestamp (int): The Unix timestamp to check slots from, inclusive.
+            to_timestamp (int): The Unix timestamp to check slots to, exclusive.
+
+        Returns:
+            list[tuple[int, int]]: The start, inclusive, and end, exclusive, Unix timestamps of
+            each gap.
+        """
+        first_slot = ceil_half_hour(from_timestamp)
+        end_slot = ceil_half_hour(to_timestamp)
+
+        with self.lock:
+            rows = self.connection.execute('''
+                SELECT interval_start, interval_end, consumption, fetched_at
+                FROM consumption
+                WHERE meter_mpan = ? AND meter_serial = ?
+                    AND interval_start >= ? AND interval_start < ?
+            ''', (meter_mpan, meter_serial, first_slot, end_slot)).fetchall()
+
+        filled_slots = {interval_start for interval_start, interval_end, consumption, fetched_at in rows
+                        if consumption is not None or self.is_settled(interval_end, fetched_at)}
+        return group_slots(slot for slot in range(first_slot, end_slot, HALF_HOUR_SECONDS)
+                           if slot not in filled_slots)
+
+    def is_stale(self, interval_end: int, fetched_at: int, now: int) -> bool:
+        """
+        Determines whether a cached slot should be fetched again.
+
+        A slot is stale if it was fetched before the end of its settlement period and the refresh
+        interval has passed since.
+
+        Args:
+            interval_end (int): The Unix timestamp of the end of the slot.
+            fetched_at (int): The Unix timestamp the slot was fetched at.
+            now (int): The current Unix timestamp.
+
+        Returns:
+            bool: A value indicating whether the slot is stale.
+        """
+        return (not self.is_settled(interval_end, fetched_at)
+                and now - fetched_at >= self.refresh_interval.total_seconds())
+
+    def is_settled(self, interval_end: int, fetched_at: int) -> bool:
+        """
+        Determines whether a cached slot was fetched after the end of its settlement period, so
+        its data, or lack of it, is final.
+
+        Args:
+            interval_end (int): The Unix timestamp of the end of the slot.
+            fetched_at (int): The Unix timestamp the slot was fetched at.
+
+        Returns:
+            bool: A value indicating whether the slot is settled.
+        """
+        return fetched_at >= interval_end + self.settlement_period.total_seconds()
+
+    def store_consumption(self,
+                          meter_mpan: str,
+                          meter_serial: str,
+                          from_timestamp: int,
+                          to_timestamp: int,
+                          consumption_data: ConsumptionSeries,
+                          fetched_at: int = None
+        ) -> tuple[int, int]:
+        """
+        Stores the half-hourly consumption data fetched for a range in the cache.
+
+        Slots in the range without any data are recorded as empty so they are not fetched again
+        until they become stale.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            from_timestamp (int): The Unix timestamp the data was fetched from, inclusive.
+            to_timestamp (int): The Unix timestamp the data was fetched to, exclusive.
+            consumption_data (ConsumptionSeries): The half-hourly consumption data.
+            fetched_at (int, optional): The Unix timestamp the data was fetched at.
+                Defaults to None, using the current time.
+
+        Returns:
+            tuple[int, int]: The number of slots that previously had no data and the number of
+            slots whose data changed.
+        """
+        fetched_at = fetched_at if fetched_at is not None else int(self.clock())
+        slots: dict[int, tuple] = {
+            slot: (meter_mpan, meter_serial, slot, slot + HALF_HOUR_SECONDS, None, fetched_at)
+            for slot in range(ceil_half_hour(from_timestamp), ceil_half_hour(to_timestamp), HALF_HOUR_SECONDS)
+        }
+        for consumption, interval_start, interval_end in zip(consumption_data.consumption.tolist(),
+                                                             consumption_data.interval_starts.tolist(),
+                                                             consumption_data.interval_ends.tolist()):
+            slots[interval_start] = (meter_mpan, meter_serial, interval_start, interval_end,
+                                     consumption, fetched_at)
+
+        with self.lock, self.connection:
+            previous_rows = self.connection.execute('''
+                SELECT interval_start, consumption
+                FROM consumption
+                WHERE meter_mpan = ? AND meter_serial = ?
+                    AND interval_start >= ? AND interval_start <= ?
+                    AND consumption IS NOT NULL
+            ''', (meter_mpan, meter_serial, min(slots, default=0), max(slots, default=0))).fetchall()
+            self.connection.executemany('''
+                INSERT OR REPLACE INTO consumption
+                    (meter_mpan, meter_serial, interval_start, interval_end, consumption, fetched_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', slots.values())
+
+        previous_consumption: dict[int, float] = dict(previous_rows)
+        new_slot_count: int = 0
+        updated_slot_count: int = 0
+        for slot, (_, _, _, _, consumption, _) in slots.items():
+            if consumption is None:
+                continue
+            if slot not in previous_consumption:
+                new_slot_count += 1
+            elif previous_consumption[slot] != consumption:
+                updated_slot_count += 1
+
+        return new_slot_count, updated_slot_count
+
+    def get_first_interval_start(self, meter_mpan: str, meter_serial: str) -> int | None:
+        """
+        Gets the start of the earliest cached slot with data for a meter.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+
+        Returns:
+            int | None: The Unix timestamp of the start of the slot, or None if there is no data.
+        """
+        with self.lock:
+            row = self.connection.execute('''
+                SELECT MIN(interval_start)
+                FROM consumption
+                WHERE meter_mpan = ? AND meter_serial = ? AND consumption IS NOT NULL
+            ''', (meter_mpan, meter_serial)).fetchone()
+
+        return row[0]
+
+    def get_last_interval_end(self, meter_mpan: str, meter_serial: str) -> int | None:
+        """
+        Gets the end of the latest cached slot with data for a meter.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+
+        Returns:
+            int | None: The Unix timestamp of the end of the slot, or None if there is no data.
+        """
+        with self.lock:
+            row = self.connection.execute('''
+                SELECT MAX(interval_end)
+                FROM consumption
+                WHERE meter_mpan = ? AND meter_serial = ? AND consumption IS NOT NULL
+            ''', (meter_mpan, meter_serial)).fetchone()
+
+        return row[0]
+
+    def get_high_water_mark(self, meter_mpan: str, meter_serial: str) -> int | None:
+        """
+        Gets the high-water mark of the last sync for a meter.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+
+        Returns:
+            int | None: The Unix timestamp of the end of the latest synced slot with data, or None
+            if the meter has not been synced.
+        """
+        with self.lock:
+            row = self.connection.execute('''
+                SELECT high_water_mark
+                FROM sync_state
+                WHERE meter_mpan = ? AND meter_serial = ?
+            ''', (meter_mpan, meter_serial)).fetchone()
+
+        return row[0] if row else None
+
+    def set_high_water_mark(self,
+                            meter_mpan: str,
+                            meter_serial: str,
+                            high_water_mark: int,
+                            synced_at: int = None
+        ) -> None:
+        """
+        Sets the high-water mark of the last sync for a meter.
+
+        Args:
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+            high_water_mark (int): The Unix timestamp of the end of the latest synced slot with data.
+            synced_at (int, optional): The Unix timestamp of the sync.
+                Defaults to None, using the current time.
+        """
+        synced_at = synced_at if synced_at is not None else int(self.clock())
+        with self.lock, self.connection:
+            self.connection.execute('''
+                INSERT OR REPLACE INTO sync_state
+                    (meter_mpan, meter_serial, high_water_mark, synced_at)
+                VALUES (?, ?, ?, ?)
+            ''', (meter_mpan, meter_serial, high_water_mark, synced_at))
+
+    def get_summaries(self) -> list[MeterCacheSummary]:
+        """
+        Gets a summary of the consumption data cached for each meter.
+
+        Returns:
+            list[MeterCacheSummary]: The summary for each meter.
+        """
+        with self.lock:
+            rows = self.connection.execute('''
+                SELECT meter_mpan,
+                       meter_serial,
+                       COUNT(*),
+                       SUM(consumption IS NULL),
+                       MIN(interval_start),
+                       MAX(interval_end),
+                       MAX(fetched_at)
+                FROM consumption
+                GROUP BY meter_mpan, meter_serial
+                ORDER BY meter_mpan, meter_serial
+            ''').fetchall()
+
+        return [MeterCacheSummary(meter_mpan,
+                                  meter_serial,
+                                  slot_count,
+                                  empty_slot_count,
+                                  format_timestamp(interval_start),
+                                  format_timestamp(interval_end),
+                                  format_timestamp(last_fetched_at))
+                for (meter_mpan, meter_serial, slot_count, empty_slot_count,
+                     interval_start, interval_end, last_fetched_at) in rows]
+
+    def purge(self, meter_mpan: str = None, meter_serial: str = None) -> int:
+        """
+        Removes cached consumption data.
+
+        Args:
+            meter_mpan (str, optional): The MPAN of the meter to remove data for.
+                Defaults to None, removing data for all meters.
+            meter_serial (str, optional): The serial number of the meter to remove data for.
+                Defaults to None, removing data for all meters.
+
+        Returns:
+            int: The number of half-hour slots removed.
+        """
+        conditions: list[str] = []
+        parameters: list[str] = []
+        if meter_mpan:
+            conditions.append('meter_mpan = ?')
+            parameters.append(meter_mpan)
+        if meter_serial:
+            conditions.append('meter_serial = ?')
+            parameters.append(meter_serial)
+
+        where_clause = f' WHERE {' AND '.join(conditions)}' if conditions else ''
+        with self.lock, self.connection:
+            cursor = self.connection.execute(f'DELETE FROM consumption{where_clause}', parameters)
+            self.connection.execute(f'DELETE FROM sync_state{where_clause}', parameters)
+
+        return cursor.rowcount
+
+def group_slots(slots: Iterable[int]) -> list[tuple[int, int]]:
+    """
+    Groups half-hour slots, in time order, into ranges to fetch.
+
+    Ranges separated by fewer than MAX_FETCH_GAP_SLOTS slots are merged so that scattered slots
+    are fetched in a few requests rather than one per slot.
+
+    Args:
+        slots (Iterable[int]): The Unix timestamps of the start of each slot in time order.
+
+    Returns:
+        list[tuple[int, int]]: The start, inclusive, and end, exclusive, Unix timestamps of
+        each range.
+    """
+    ranges: list[tuple[int, int]] = []
+    for slot in slots:
+        if ranges and slot - ranges[-1][1] < MAX_FETCH_GAP_SLOTS * HALF_HOUR_SECONDS:
+            ranges[-1] = (ranges[-1][0], slot + HALF_HOUR_SECONDS)
+        else:
+            ranges.append((slot, slot + HALF_HOUR_SECONDS))
+
+    return ranges
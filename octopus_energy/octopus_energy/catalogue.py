@@ -0,0 +1,211 @@
+"""
+A cached and indexed catalogue of products from the Octopus Energy API.
+"""
+
+from datetime import datetime, timedelta
+import json
+import os
+import threading
+import time
+import numpy as np
+from .dates import parse_timestamp, to_timestamp
+from .model import Product, ProductFiltering
+
+PRODUCT_CATALOGUE_FILENAME: str = 'products.json'
+DEFAULT_CATALOGUE_TTL: timedelta = timedelta(days=1)
+FILTERING_FLAGS: dict[ProductFiltering, str] = {
+    ProductFiltering.VARIABLE: 'is_variable',
+    ProductFiltering.GREEN: 'is_green',
+    ProductFiltering.TRACKER: 'is_tracker',
+    ProductFiltering.PREPAY: 'is_prepay',
+    ProductFiltering.BUSINESS: 'is_business'
+}
+
+class ProductCatalogue:
+    """
+    A catalogue of every product from the Octopus Energy API, fetched once and kept for a time
+    to live, optionally persisted to disk so it is shared between processes.
+
+    Each filtering flag is indexed as a bitset of the products with the flag set, so every
+    combination of filtering is answered by intersecting bitsets.  Availability is answered
+    from the available from and to dates of each product.  As the catalogue holds the products
+    available when it was fetched, products withdrawn before then are not included, so it only
+    covers availability dates from the time it was fetched.
+    """
+
+    def __init__(self, path: str = None, ttl: timedelta = DEFAULT_CATALOGUE_TTL):
+        """
+        Initialises an instance of the ProductCatalogue class.
+
+        Args:
+            path (str, optional): The path of the catalogue file.
+                Defaults to None, keeping the catalogue in memory only.
+            ttl (timedelta, optional): The time after which the catalogue is fetched again.
+                Defaults to DEFAULT_CATALOGUE_TTL.
+        """
+        self.path: str = path
+        self.ttl: timedelta = ttl
+        self.lock: threading.Lock = threading.Lock()
+        self.products: list[Product] = []
+        self.fetched_at: int = None
+        self.flag_indexes: dict[ProductFiltering, int] = {}
+        self.available_from: np.ndarray = np.empty(0, dtype=np.int64)
+        self.available_to: np.ndarray = np.empty(0, dtype=np.int64)
+        self.load()
+
+    def is_fresh(self, now: int = None) -> bool:
+        """
+        Determines whether the catalogue has been fetched within its time to live.
+
+        Args:
+            now (int, optional): The current Unix timestamp.
+                Defaults to None, using the current time.
+
+        Returns:
+            bool: A value indicating whether the catalogue is fresh.
+        """
+        now = now if now is not None else int(time.time())
+        return self.fetched_at is not None and now - self.fetched_at < self.ttl.total_seconds()
+
+    def covers(self, availability_date: datetime = None) -> bool:
+        """
+        Determines whether the catalogue can answer a query for products available on a date.
+
+        Args:
+            availability_date (datetime, optional): The date the products must be available on.
+                Defaults to None, using the current time.
+
+        Returns:
+            bool: A value indicating whether the date is not before the catalogue was fetched.
+        """
+        return availability_date is None or to_timestamp(availability_date) >= self.fetched_at
+
+    def update(self, products: list[Product], fetched_at: int = None) -> None:
+        """
+        Replaces the products in the catalogue and rebuilds its indexes.
+
+        Args:
+            products (list[Product]): Every product from the API.
+            fetched_at (int, optional): The Unix timestamp the products were fetched at.
+                Defaults to None, using the current time.
+        """
+        with self.lock:
+            self.index(products, fetched_at if fetched_at is not None else int(time.time()))
+            self.save()
+
+    def find_products(self,
+                      availability_date: datetime = None,
+                      filtering: ProductFiltering = ProductFiltering.DEFAULT
+        ) -> list[Product]:
+        """
+        Finds the products in the catalogue matching a filtering and available on a date.
+
+        Args:
+            availability_date (datetime, optional): The date the products must be available on.
+                Defaults to None, using the current time.
+            filtering (ProductFiltering, optional): The flags the products must have set.
+                Defaults to ProductFiltering.DEFAULT, not filtering by flags.
+
+        Returns:
+            list[Product]: The matching products in catalogue order.
+        """
+        timestamp = to_timestamp(availability_date) if availability_date else int(time.time())
+        with self.lock:
+            matches = (1 << len(self.products)) - 1
+            for flag, index in self.flag_indexes.items():
+                if filtering and flag in filtering:
+                    matches &= index
+
+            is_available = (self.available_from <= timestamp) & (timestamp < self.available_to)
+            matches &= to_bitset(is_available)
+            return [self.products[position] for position in iterate_bitset(matches)]
+
+    def index(self, products: list[Product], fetched_at: int) -> None:
+        """
+        Builds the flag and availability indexes for the products.
+
+        Args:
+            products (list[Product]): The products.
+            fetched_at (int): The Unix timestamp the products were fetched at.
+        """
+        self.products = list(products)
+        self.fetched_at = fetched_at
+        self.flag_indexes = {
+            flag: to_bitset(np.fromiter((bool(getattr(product, attribute)) for product in self.products),
+                                        bool,
+                                        len(self.products)))
+            for flag, attribute in FILTERING_FLAGS.items()
+        }
+        self.available_from = np.fromiter(
+            (parse_timestamp(product.available_from) if product.available_from else np.iinfo(np.int64).min
+             for product in self.products),
+            np.int64,
+            len(self.products))
+        self.available_to = np.fromiter(
+            (parse_timestamp(product.available_to) if product.available_to else np.iinfo(np.int64).max
+             for product in self.products),
+            np.int64,
+            len(self.products))
+
+    def load(self) -> None:
+        """
+        Loads the catalogue from disk, if it has been persisted.
+        """
+        if self.path is None or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as catalogue_file:
+                catalogue_data = json.load(catalogue_file)
+            products = [Product(**product_data) for product_data in catalogue_data['products']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        with self.lock:
+            self.index(products, catalogue_data['fetched_at'])
+
+    def save(self) -> None:
+        """
+        Persists the catalogue to disk, if it has a path.
+        """
+        if self.path is None:
+            return
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        temporary_path = f'{self.path}.tmp'
+        with open(temporary_path, 'w', encoding='utf-8') as catalogue_file:
+            json.dump({
+                'fetched_at': self.fetched_at,
+                'products': [vars(product) for product in self.products]
+            }, catalogue_file)
+        os.replace(temporary_path, self.path)
+
+def to_bitset(values: np.ndarray) -> int:
+    """
+    Converts an array of booleans to a bitset with a bit set for each true value.
+
+    Args:
+        values (np.ndarray): The booleans.
+
+    Returns:
+        int: The bitset, with the bit at each position set if the value at that position is true.
+    """
+    return int.from_bytes(np.packbits(values, bitorder='little').tobytes(), 'little')
+
+def iterate_bitset(bitset: int):
+    """
+    Iterates over the positions of the set bits in a bitset in ascending order.
+
+    Args:
+        bitset (int): The bitset.
+
+    Yields:
+        int: The position of the next set bit.
+    """
+    while bitset:
+        lowest_bit = bitset & -bitset
+        yield lowest_bit.bit_length() - 1
+        bitset ^= lowest_bit
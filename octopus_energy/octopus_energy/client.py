@@ -3,46 +3,70 @@ A client and types for interacting with the Octopus Energy API.
 """
 
 from abc import ABCMeta, abstractmethod
-import json
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import math
 from datetime import datetime
-from typing import Literal, TypeVar
-from requests import get, Response
+from collections.abc import Iterator
+from typing import Awaitable, Callable, Literal, TypeVar
+from urllib.parse import quote
+import httpx
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from .decoding import DecoderType, PageDecoder, create_decoder
 from .model import (
     Account,
-    Consumption,
+    ClientResponse,
     ConsumptionGrouping,
+    ConsumptionSeries,
     Product,
     ProductFiltering
 )
+from .replay import DEFAULT_REPLAY_PAGE_SIZE, ReplaySession, create_replay_http_client
+from .scheduling import RequestScheduler
 
 BASE_URI: str = 'https://api.octopus.energy/v1'
+DEFAULT_MAX_WORKERS: int = 4
+DEFAULT_PAGE_SIZE: int = 100
+DEFAULT_POOL_SIZE: int = 10
+DEFAULT_TIMEOUT: int = 10
 T = TypeVar('T')
 TRUE = str(True).lower()
 
-class ClientResponse[T]:
+class OctopusEnergyClientBase(metaclass=ABCMeta):
     """
-    Represents a response from the Octopus Energy API.
+    Base class for clients for the Octopus Energy API.
+
+    Clients can be used as context managers to release any resources they hold on exit.  The
+    page size and maximum number of workers give how much data a client fetches at once, for
+    callers that fetch in chunks.
     """
+    page_size: int = DEFAULT_PAGE_SIZE
+    max_workers: int = 1
 
-    def __init__(self, count: int, next: str, previous: str, results: list[T]):
+    def __enter__(self):
         """
-        Initialises an instance of the ClientResponse class.
+        Enters the client context.
 
-        Args:
-            count (int): The count of entries in the response.
-            next (str): The URL for the next page of data if available, otherwise None.
-            previous (str): The URL for the previous page of data if available, otherwise None.
-            results (list[T]): The data entries.
+        Returns:
+            OctopusEnergyClientBase: The client.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the client context, releasing any resources held by the client.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the client.
+
+        By default there is nothing to release.
         """
-        self.count: int = count
-        self.next: str = next
-        self.previous: str = previous
-        self.results: list[T] = results
 
-class OctopusEnergyClientBase(metaclass=ABCMeta):
-    """
-    Base class for clients for the Octopus Energy API.
-    """
     @abstractmethod
     def get_account(self) -> Account:
         """
@@ -57,7 +81,7 @@ class OctopusEnergyClientBase(metaclass=ABCMeta):
                         from_date: datetime = None,
                         to_date: datetime = None,
                         grouping: ConsumptionGrouping = 'half-hour'
-        ) -> list[Consumption]:
+        ) -> ConsumptionSeries:
         """
         Retrieves consumption data from the Octopus Energy API.
 
@@ -70,9 +94,32 @@ class OctopusEnergyClientBase(metaclass=ABCMeta):
                 Defaults to 'half-hour'.
 
         Returns:
-            list[Consumption]: A list of consumption data.
+            ConsumptionSeries: The consumption data.
         """
 
+    def iter_consumption(self,
+                         from_date: datetime = None,
+                         to_date: datetime = None,
+                         grouping: ConsumptionGrouping = 'half-hour'
+        ) -> Iterator[ConsumptionSeries]:
+        """
+        Retrieves consumption data from the Octopus Energy API in chunks as it arrives.
+
+        By default all the consumption data is retrieved and yielded as a single chunk.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Yields:
+            ConsumptionSeries: The next chunk of consumption data.
+        """
+        yield self.get_consumption(from_date, to_date, grouping)
+
     @abstractmethod
     def get_products(self,
                      availability_date: datetime = None,
@@ -88,13 +135,24 @@ class OctopusEnergyClientBase(metaclass=ABCMeta):
 class OctopusEnergyClient(OctopusEnergyClientBase):
     """
     A client for interacting with the Octopus Energy API.
+
+    Requests are sent through a pooled HTTP session so connections are kept alive and reused
+    across pages.  The client should be closed, or used as a context manager, when finished with.
+
+    When more than one worker is configured, data spanning multiple pages is fetched in parallel
+    once the first page has given the total number of pages.
     """
 
     def __init__(self,
                  api_key: str,
                  account_number: str = None,
                  meter_mpan: str = None,
-                 meter_serial: str = None
+                 meter_serial: str = None,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 session: Session = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 decoder: PageDecoder = None,
+                 scheduler: RequestScheduler = None
     ):
         """
         Initializes an instance of the OctopusEnergyClient class.
@@ -107,11 +165,38 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
                 Defaults to None.
             meter_serial (str, optional): The serial number for the meter.
                 Defaults to None.
+            pool_size (int, optional): The maximum number of connections to keep alive in the pool.
+                Defaults to DEFAULT_POOL_SIZE.
+            session (Session, optional): An existing HTTP session to send requests through.
+                The session is not closed with the client.  Defaults to None, creating a new
+                pooled session owned by the client.
+            max_workers (int, optional): The maximum number of pages to fetch concurrently.
+                A value of 1 fetches pages one at a time.  Defaults to DEFAULT_MAX_WORKERS.
+            decoder (PageDecoder, optional): The decoder for response bodies.
+                Defaults to None, using the fastest installed JSON library.
+            scheduler (RequestScheduler, optional): The scheduler to send requests through,
+                which can be shared between clients to share its limits.  Defaults to None,
+                creating a scheduler with the default limits.
         """
+        if max_workers < 1:
+            raise ValueError('The maximum number of workers must be at least 1.')
+
         self.api_key: str = api_key
         self.meter_mpan: str = meter_mpan
         self.meter_serial: str = meter_serial
         self.account_number: str = account_number
+        self.owns_session: bool = session is None
+        self.session: Session = session if session is not None else create_session(pool_size)
+        self.max_workers: int = max_workers
+        self.decoder: PageDecoder = decoder if decoder is not None else create_decoder()
+        self.scheduler: RequestScheduler = scheduler if scheduler is not None else RequestScheduler()
+
+    def close(self) -> None:
+        """
+        Closes the HTTP session and its pooled connections if it is owned by the client.
+        """
+        if self.owns_session:
+            self.session.close()
 
     def get_account(self) -> Account:
         """
@@ -120,17 +205,14 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
         Returns:
             Account: The account data.
         """
-        response: Response = self.get(f'{BASE_URI}/accounts/{self.account_number}')
-        account_data = json.loads(response.text)
-        account: Account = Account(**account_data)
-
-        return account
+        response: Response = self.get(build_account_uri(self.account_number))
+        return Account(**self.decoder.decode(response.content))
 
     def get_consumption(self,
                         from_date: datetime = None,
                         to_date: datetime = None,
                         grouping: ConsumptionGrouping = 'half-hour'
-        ) -> list[Consumption]:
+        ) -> ConsumptionSeries:
         """
         Retrieves consumption data from the Octopus Energy API.
 
@@ -143,22 +225,35 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
                 Defaults to 'half-hour'.
 
         Returns:
-            list[Consumption]: A list of consumption data.
+            ConsumptionSeries: The consumption data.
         """
-        consumption_data: list[Consumption] = []
-        is_next: bool = True
-        page: int = 1
-        while is_next:
-            consumption: ClientResponse = self.get_consumption_page(from_date,
-                                                                    to_date,
-                                                                    grouping,
-                                                                    page)
-            consumption_data += consumption.results
-            page += 1
-            if consumption.next is None:
-                is_next = False
+        return ConsumptionSeries.concatenate(self.iter_consumption(from_date, to_date, grouping))
 
-        return consumption_data
+    def iter_consumption(self,
+                         from_date: datetime = None,
+                         to_date: datetime = None,
+                         grouping: ConsumptionGrouping = 'half-hour'
+        ) -> Iterator[ConsumptionSeries]:
+        """
+        Retrieves consumption data from the Octopus Energy API a page at a time, yielding each
+        page as soon as it arrives.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Yields:
+            ConsumptionSeries: The consumption data from the next page.
+        """
+        for page in self.iter_pages(lambda page: self.get_consumption_page(from_date,
+                                                                           to_date,
+                                                                           grouping,
+                                                                           page)):
+            yield page.results
 
     def get_consumption_page(self,
                              from_date: datetime = None,
@@ -180,36 +275,15 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
                 Defaults to 1.
 
         Returns:
-            ClientResponse[Consumption]: The specified page of consumption data.
+            ClientResponse[ConsumptionSeries]: The specified page of consumption data.
         """
-        base_request_uri: str = f'{BASE_URI}/electricity-meter-points/{self.meter_mpan}/meters/{self.meter_serial}/consumption'
-        parameters: dict[str, str] = {}
-        if from_date:
-            parameters['period_from'] = from_date.isoformat()
-        if to_date:
-            parameters['period_to'] = to_date.isoformat()
-        if page:
-            parameters['page'] = page
-        if grouping != 'half-hour':
-            parameters['group_by'] = grouping
-
-        url_parameters: str = ''
-        if len(parameters) > 0:
-            url_parameters = self.build_query_string(parameters)
-
-        response: Response = self.get(f'{base_request_uri}{url_parameters}')
-
-        consumption_data = json.loads(response.text)
-        results_data = consumption_data['results']
-        results = [Consumption(**result_entry) for result_entry in results_data]
-
-        consumption: ClientResponse = ClientResponse(
-            consumption_data['count'],
-            consumption_data['next'],
-            consumption_data['previous'],
-            results)
-
-        return consumption
+        response: Response = self.get(build_consumption_uri(self.meter_mpan,
+                                                            self.meter_serial,
+                                                            from_date,
+                                                            to_date,
+                                                            grouping,
+                                                            page))
+        return self.decoder.decode_consumption_page(response.content)
 
     def get_products(self,
                      availability_date: datetime = None,
@@ -221,19 +295,10 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
         Returns:
             list[Product]: A list of product data.
         """
-        product_data: list[Product] = []
-        is_next: bool = True
-        page: int = 1
-        while is_next:
-            products: ClientResponse = self.get_proucts_page(availability_date,
-                                                             filtering,
-                                                             page)
-            product_data += products.results
-            page += 1
-            if products.next is None:
-                is_next = False
-
-        return product_data
+        pages = self.get_all_pages(lambda page: self.get_proucts_page(availability_date,
+                                                                      filtering,
+                                                                      page))
+        return [product for page in pages for product in page.results]
 
     def get_proucts_page(self,
                          availability_date: datetime = None,
@@ -260,40 +325,59 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
         Returns:
             ClientResponse[Product]: The specified page of product data.
         """
-        base_request_uri: str = f'{BASE_URI}/products'
-        parameters: dict[str, str] = {}
-        if filtering and ProductFiltering.VARIABLE in filtering:
-            parameters['is_variable'] = TRUE
-        if filtering and ProductFiltering.GREEN in filtering:
-            parameters['is_green'] = TRUE
-        if filtering and ProductFiltering.TRACKER in filtering:
-            parameters['is_tracker'] = TRUE
-        if filtering and ProductFiltering.PREPAY in filtering:
-            parameters['is_prepay'] = TRUE
-        if filtering and ProductFiltering.BUSINESS in filtering:
-            parameters['is_business'] = TRUE
-        if availability_date:
-            parameters['available_at'] = availability_date.isoformat()
-        if page:
-            parameters['page'] = page
-
-        url_parameters: str = ''
-        if len(parameters) > 0:
-            url_parameters = self.build_query_string(parameters)
-
-        response: Response = self.get(f'{base_request_uri}{url_parameters}')
-
-        product_data = json.loads(response.text)
-        results_data = product_data['results']
-        results = [Product(**result_entry) for result_entry in results_data]
-
-        products: ClientResponse = ClientResponse(
-            product_data['count'],
-            product_data['next'],
-            product_data['previous'],
-            results)
-
-        return products
+        response: Response = self.get(build_products_uri(availability_date, filtering, page))
+        return self.decoder.decode_products_page(response.content)
+
+    def get_all_pages(self, get_page: Callable[[int], ClientResponse[T]]) -> list[ClientResponse[T]]:
+        """
+        Retrieves every page of a paged API resource.
+
+        Args:
+            get_page (Callable[[int], ClientResponse[T]]): A function to retrieve a page by number.
+
+        Returns:
+            list[ClientResponse[T]]: Every page in order.
+        """
+        return list(self.iter_pages(get_page))
+
+    def iter_pages(self, get_page: Callable[[int], ClientResponse[T]]) -> Iterator[ClientResponse[T]]:
+        """
+        Retrieves every page of a paged API resource, yielding each page in order as soon as it
+        and the pages before it have arrived.
+
+        The first page is fetched on its own to find the total number of pages from its count.
+        If there is more than one worker, the remaining pages are then fetched concurrently, with
+        no more pages in flight or waiting to be yielded than there are workers.  Any pages beyond
+        those expected, for example if data was added while fetching, are followed one at a time.
+
+        Args:
+            get_page (Callable[[int], ClientResponse[T]]): A function to retrieve a page by number.
+
+        Yields:
+            ClientResponse[T]: The next page.
+        """
+        response: ClientResponse[T] = get_page(1)
+        yield response
+        page: int = 1
+
+        page_count: int = count_pages(response)
+        if self.max_workers > 1 and page_count > 2:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, page_count - 1)) as executor:
+                pending_pages: deque[Future[ClientResponse[T]]] = deque()
+                next_page: int = 2
+                while pending_pages or next_page <= page_count:
+                    while next_page <= page_count and len(pending_pages) < self.max_workers:
+                        pending_pages.append(executor.submit(get_page, next_page))
+                        next_page += 1
+
+                    response = pending_pages.popleft().result()
+                    yield response
+            page = page_count
+
+        while response.next is not None:
+            page += 1
+            response = get_page(page)
+            yield response
 
     def build_query_string(self, parameters: dict[str, str]) -> str:
         """
@@ -305,22 +389,489 @@ class OctopusEnergyClient(OctopusEnergyClientBase):
         Returns:
             str: The query string.
         """
-        return f'?{'&'.join([f'{key}={value}' for key, value in parameters.items()])}'
+        return build_query_string(parameters)
 
     def get(self, url) -> Response:
         """
         Sends an HTTP GET request to the specified URL.
 
-        It is configured with authorisation for the Octopus Energy API and a default timeout of
-        10 seconds.
+        It is sent through the pooled session, reusing an open connection where possible,
+        and is configured with authorisation for the Octopus Energy API and a default timeout of
+        10 seconds.  The request scheduler keeps it within the rate limits and retries it if it
+        fails transiently.
+
+        Args:
+            url (str): The URL to send the request to.
+
+        Returns:
+            Response: The successful response from the URL.
+        """
+        return self.scheduler.send(lambda: self.session.get(url=url,
+                                                            auth=(self.api_key, ''),
+                                                            timeout=DEFAULT_TIMEOUT))
+
+class AsyncOctopusEnergyClientBase(metaclass=ABCMeta):
+    """
+    Base class for asynchronous clients for the Octopus Energy API.
+
+    Clients can be used as asynchronous context managers to release any resources they hold on
+    exit.
+    """
+    async def __aenter__(self):
+        """
+        Enters the client context.
+
+        Returns:
+            AsyncOctopusEnergyClientBase: The client.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the client context, releasing any resources held by the client.
+        """
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Releases any resources held by the client.
+
+        By default there is nothing to release.
+        """
+
+    @abstractmethod
+    async def get_account(self) -> Account:
+        """
+        Retrieves account data from the Octopus Energy API.
+
+        Returns:
+            Account: The account data.
+        """
+
+    @abstractmethod
+    async def get_consumption(self,
+                              from_date: datetime = None,
+                              to_date: datetime = None,
+                              grouping: ConsumptionGrouping = 'half-hour'
+        ) -> ConsumptionSeries:
+        """
+        Retrieves consumption data from the Octopus Energy API.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            ConsumptionSeries: The consumption data.
+        """
+
+    @abstractmethod
+    async def get_products(self,
+                           availability_date: datetime = None,
+                           filtering: ProductFiltering = None
+        ) -> list[Product]:
+        """
+        Retrieves product data from the Octopus Energy API.
+
+        Returns:
+            list[Product]: A list of product data.
+        """
+
+class AsyncOctopusEnergyClient(AsyncOctopusEnergyClientBase):
+    """
+    An asynchronous client for interacting with the Octopus Energy API.
+
+    Requests are sent through a pooled asynchronous HTTP client so connections are kept alive and
+    reused across pages.  Data spanning multiple pages is fetched concurrently, up to the maximum
+    number of workers, once the first page has given the total number of pages.
+    """
+
+    def __init__(self,
+                 api_key: str,
+                 account_number: str = None,
+                 meter_mpan: str = None,
+                 meter_serial: str = None,
+                 pool_size: int = DEFAULT_POOL_SIZE,
+                 http_client: httpx.AsyncClient = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS,
+                 decoder: PageDecoder = None,
+                 scheduler: RequestScheduler = None
+    ):
+        """
+        Initializes an instance of the AsyncOctopusEnergyClient class.
+
+        Args:
+            api_key (str): The API key for accessing the Octopus Energy API.
+            account_number (str, optional): The Octopus Energy account number.
+                Defaults to None.
+            meter_mpan (str, optional): The Meter Point Administration Number (MPAN) for the meter.
+                Defaults to None.
+            meter_serial (str, optional): The serial number for the meter.
+                Defaults to None.
+            pool_size (int, optional): The maximum number of connections to keep alive in the pool.
+                Defaults to DEFAULT_POOL_SIZE.
+            http_client (httpx.AsyncClient, optional): An existing asynchronous HTTP client to send
+                requests through.  The HTTP client is not closed with the client.  Defaults to
+                None, creating a new pooled HTTP client owned by the client.
+            max_workers (int, optional): The maximum number of pages to fetch concurrently.
+                A value of 1 fetches pages one at a time.  Defaults to DEFAULT_MAX_WORKERS.
+            decoder (PageDecoder, optional): The decoder for response bodies.
+                Defaults to None, using the fastest installed JSON library.
+            scheduler (RequestScheduler, optional): The scheduler to send requests through,
+                which can be shared between clients to share its limits.  Defaults to None,
+                creating a scheduler with the default limits.
+        """
+        if max_workers < 1:
+            raise ValueError('The maximum number of workers must be at least 1.')
+
+        self.api_key: str = api_key
+        self.meter_mpan: str = meter_mpan
+        self.meter_serial: str = meter_serial
+        self.account_number: str = account_number
+        self.owns_http_client: bool = http_client is None
+        self.http_client: httpx.AsyncClient = (http_client if http_client is not None
+                                               else create_async_http_client(pool_size))
+        self.max_workers: int = max_workers
+        self.decoder: PageDecoder = decoder if decoder is not None else create_decoder()
+        self.scheduler: RequestScheduler = scheduler if scheduler is not None else RequestScheduler()
+
+    async def aclose(self) -> None:
+        """
+        Closes the HTTP client and its pooled connections if it is owned by the client.
+        """
+        if self.owns_http_client:
+            await self.http_client.aclose()
+
+    async def get_account(self) -> Account:
+        """
+        Retrieves account data from the Octopus Energy API.
+
+        Returns:
+            Account: The account data.
+        """
+        response: httpx.Response = await self.get(build_account_uri(self.account_number))
+        return Account(**self.decoder.decode(response.content))
+
+    async def get_consumption(self,
+                              from_date: datetime = None,
+                              to_date: datetime = None,
+                              grouping: ConsumptionGrouping = 'half-hour'
+        ) -> ConsumptionSeries:
+        """
+        Retrieves consumption data from the Octopus Energy API.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            ConsumptionSeries: The consumption data.
+        """
+        pages = await self.get_all_pages(lambda page: self.get_consumption_page(from_date,
+                                                                                to_date,
+                                                                                grouping,
+                                                                                page))
+        return ConsumptionSeries.concatenate(page.results for page in pages)
+
+    async def get_consumption_page(self,
+                                   from_date: datetime = None,
+                                   to_date: datetime = None,
+                                   grouping: ConsumptionGrouping = 'half-hour',
+                                   page: int = 1
+        ) -> ClientResponse:
+        """
+        Retrieves a specific page of consumption data from the Octopus Energy API.
+
+        Args:
+            from_date (datetime, optional): The start date and time for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+            page (int, optional): The page number of the consumption data.
+                Defaults to 1.
+
+        Returns:
+            ClientResponse[ConsumptionSeries]: The specified page of consumption data.
+        """
+        response: httpx.Response = await self.get(build_consumption_uri(self.meter_mpan,
+                                                                        self.meter_serial,
+                                                                        from_date,
+                                                                        to_date,
+                                                                        grouping,
+                                                                        page))
+        return self.decoder.decode_consumption_page(response.content)
+
+    async def get_products(self,
+                           availability_date: datetime = None,
+                           filtering: ProductFiltering = None
+        ) -> list[Product]:
+        """
+        Retrieves product data from the Octopus Energy API.
+
+        Returns:
+            list[Product]: A list of product data.
+        """
+        pages = await self.get_all_pages(lambda page: self.get_products_page(availability_date,
+                                                                             filtering,
+                                                                             page))
+        return [product for page in pages for product in page.results]
+
+    async def get_products_page(self,
+                                availability_date: datetime = None,
+                                filtering: ProductFiltering = None,
+                                page: int = 1
+        ) -> ClientResponse:
+        """
+        Retrieves a specific page of product data from the Octopus Energy API.
+
+        Args:
+            availability_date (datetime, optional): The date and time the product is available.
+                Defaults to None.
+            filtering (ProductFiltering, optional): The filtering of the products.
+                Defaults to None.
+            page (int, optional): The page number of the product data.
+                Defaults to 1.
+
+        Returns:
+            ClientResponse[Product]: The specified page of product data.
+        """
+        response: httpx.Response = await self.get(build_products_uri(availability_date,
+                                                                     filtering,
+                                                                     page))
+        return self.decoder.decode_products_page(response.content)
+
+    async def get_all_pages(self,
+                            get_page: Callable[[int], Awaitable[ClientResponse[T]]]
+        ) -> list[ClientResponse[T]]:
+        """
+        Retrieves every page of a paged API resource.
+
+        The first page is fetched on its own to find the total number of pages from its count.
+        The remaining pages are then fetched concurrently, with at most the maximum number of
+        workers in flight, and merged back in page order.  Any pages beyond those expected are
+        followed one at a time.
+
+        Args:
+            get_page (Callable[[int], Awaitable[ClientResponse[T]]]): A function to retrieve a
+                page by number.
+
+        Returns:
+            list[ClientResponse[T]]: Every page in order.
+        """
+        response: ClientResponse[T] = await get_page(1)
+        responses: list[ClientResponse[T]] = [response]
+        page: int = 1
+
+        page_count: int = count_pages(response)
+        if page_count > 1:
+            semaphore = asyncio.Semaphore(self.max_workers)
+
+            async def get_bounded_page(page_number: int) -> ClientResponse[T]:
+                async with semaphore:
+                    return await get_page(page_number)
+
+            responses += await asyncio.gather(*[get_bounded_page(page_number)
+                                                for page_number in range(2, page_count + 1)])
+            response = responses[-1]
+            page = page_count
+
+        while response.next is not None:
+            page += 1
+            response = await get_page(page)
+            responses.append(response)
+
+        return responses
+
+    async def get(self, url) -> httpx.Response:
+        """
+        Sends an asynchronous HTTP GET request to the specified URL.
+
+        It is sent through the pooled HTTP client, reusing an open connection where possible,
+        and is configured with authorisation for the Octopus Energy API and a default timeout of
+        10 seconds.  The request scheduler keeps it within the rate limits and retries it if it
+        fails transiently.
 
         Args:
             url (str): The URL to send the request to.
 
         Returns:
-            Response: The response from the URL.
+            httpx.Response: The successful response from the URL.
         """
-        return get(url=url, auth=(self.api_key, ''), timeout=10)
+        return await self.scheduler.send_async(lambda: self.http_client.get(url,
+                                                                            auth=(self.api_key, ''),
+                                                                            timeout=DEFAULT_TIMEOUT))
+
+def build_account_uri(account_number: str) -> str:
+    """
+    Builds the URI for account data.
+
+    Args:
+        account_number (str): The Octopus Energy account number.
+
+    Returns:
+        str: The URI for the account data.
+    """
+    return f'{BASE_URI}/accounts/{account_number}'
+
+def build_consumption_uri(meter_mpan: str,
+                          meter_serial: str,
+                          from_date: datetime = None,
+                          to_date: datetime = None,
+                          grouping: ConsumptionGrouping = 'half-hour',
+                          page: int = 1
+    ) -> str:
+    """
+    Builds the URI for a page of consumption data.
+
+    Args:
+        meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+        meter_serial (str): The serial number for the meter.
+        from_date (datetime, optional): The start date and time for the consumption data.
+            Defaults to None.
+        to_date (datetime, optional): The end date for the consumption data.
+            Defaults to None.
+        grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+            Defaults to 'half-hour'.
+        page (int, optional): The page number of the consumption data.
+            Defaults to 1.
+
+    Returns:
+        str: The URI for the page of consumption data.
+    """
+    base_request_uri: str = f'{BASE_URI}/electricity-meter-points/{meter_mpan}/meters/{meter_serial}/consumption'
+    parameters: dict[str, str] = {}
+    if from_date:
+        parameters['period_from'] = from_date.isoformat()
+    if to_date:
+        parameters['period_to'] = to_date.isoformat()
+    if page:
+        parameters['page'] = page
+    if grouping != 'half-hour':
+        parameters['group_by'] = grouping
+
+    url_parameters: str = ''
+    if len(parameters) > 0:
+        url_parameters = build_query_string(parameters)
+
+    return f'{base_request_uri}{url_parameters}'
+
+def build_products_uri(availability_date: datetime = None,
+                       filtering: ProductFiltering = None,
+                       page: int = 1
+    ) -> str:
+    """
+    Builds the URI for a page of product data.
+
+    Args:
+        availability_date (datetime, optional): The date and time the product is available.
+            Defaults to None.
+        filtering (ProductFiltering, optional): The filtering of the products.
+            Defaults to None.
+        page (int, optional): The page number of the product data.
+            Defaults to 1.
+
+    Returns:
+        str: The URI for the page of product data.
+    """
+    base_request_uri: str = f'{BASE_URI}/products'
+    parameters: dict[str, str] = {}
+    if filtering and ProductFiltering.VARIABLE in filtering:
+        parameters['is_variable'] = TRUE
+    if filtering and ProductFiltering.GREEN in filtering:
+        parameters['is_green'] = TRUE
+    if filtering and ProductFiltering.TRACKER in filtering:
+        parameters['is_tracker'] = TRUE
+    if filtering and ProductFiltering.PREPAY in filtering:
+        parameters['is_prepay'] = TRUE
+    if filtering and ProductFiltering.BUSINESS in filtering:
+        parameters['is_business'] = TRUE
+    if availability_date:
+        parameters['available_at'] = availability_date.isoformat()
+    if page:
+        parameters['page'] = page
+
+    url_parameters: str = ''
+    if len(parameters) > 0:
+        url_parameters = build_query_string(parameters)
+
+    return f'{base_request_uri}{url_parameters}'
+
+def build_query_string(parameters: dict[str, str]) -> str:
+    """
+    Builds a query string from the specified parameters.
+
+    Values are percent-encoded so that dates and times with a UTC offset are sent intact.
+
+    Args:
+        parameters (dict[str, str]): The parameters to build the query string from.
+
+    Returns:
+        str: The query string.
+    """
+    return f'?{'&'.join([f'{key}={quote(str(value), safe=':')}' for key, value in parameters.items()])}'
+
+def count_pages(response: ClientResponse) -> int:
+    """
+    Counts the total number of pages for a paged API resource from its first page.
+
+    Args:
+        response (ClientResponse): The first page of the resource.
+
+    Returns:
+        int: The total number of pages, or 1 if the first page is the only page or the page
+        size cannot be determined.
+    """
+    if response.next is None or len(response.results) == 0:
+        return 1
+
+    return math.ceil(response.count / len(response.results))
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE) -> Session:
+    """
+    Creates an HTTP session with a pool of keep-alive connections.
+
+    Args:
+        pool_size (int, optional): The maximum number of connections to keep alive in the pool.
+            Defaults to DEFAULT_POOL_SIZE.
+
+    Returns:
+        Session: The HTTP session.
+    """
+    if pool_size < 1:
+        raise ValueError('The connection pool size must be at least 1.')
+
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session = Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def create_async_http_client(pool_size: int = DEFAULT_POOL_SIZE) -> httpx.AsyncClient:
+    """
+    Creates an asynchronous HTTP client with a pool of keep-alive connections.
+
+    Args:
+        pool_size (int, optional): The maximum number of connections to keep alive in the pool.
+            Defaults to DEFAULT_POOL_SIZE.
+
+    Returns:
+        httpx.AsyncClient: The asynchronous HTTP client.
+    """
+    if pool_size < 1:
+        raise ValueError('The connection pool size must be at least 1.')
+
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    return httpx.AsyncClient(limits=limits)
 
 class OctopusEnergyClientFactory:
     """
@@ -328,18 +879,27 @@ class OctopusEnergyClientFactory:
     """
 
     def create(self,
-               client_type: Literal['API'] = 'API',
+               client_type: Literal['API', 'REPLAY', 'FILE'] = 'API',
                api_key: str = None,
                account_number: str = None,
                meter_mpan: str = None,
-               meter_serial: str = None
-        ) -> OctopusEnergyClientBase:
+               meter_serial: str = None,
+               pool_size: int = DEFAULT_POOL_SIZE,
+               max_workers: int = DEFAULT_MAX_WORKERS,
+               asynchronous: bool = False,
+               decoder_type: DecoderType = None,
+               scheduler: RequestScheduler = None,
+               fixture_directory: str = None,
+               page_size: int = DEFAULT_REPLAY_PAGE_SIZE,
+               latency: float = 0.0
+        ) -> OctopusEnergyClientBase | AsyncOctopusEnergyClientBase:
         """
         Creates an Octopus Energy client.
 
         Args:
-            client_type (Literal['API'], optional): The type of client to create.
-                Defaults to API.
+            client_type (Literal['API', 'REPLAY', 'FILE'], optional): The type of client to
+                create.  REPLAY, or its alias FILE, creates a client which replays responses from
+                recorded fixtures or synthetic data without a network.  Defaults to API.
             api_key (str): The API key for accessing the Octopus Energy API.
                 Defaults to None.
             account_number (str, optional): The Octopus Energy account number.
@@ -348,18 +908,71 @@ class OctopusEnergyClientFactory:
                 Defaults to None.
             meter_serial (str, optional): The serial number for the meter.
                 Defaults to None.
+            pool_size (int, optional): The maximum number of connections to keep alive in the pool.
+                Defaults to DEFAULT_POOL_SIZE.
+            max_workers (int, optional): The maximum number of pages to fetch concurrently.
+                Defaults to DEFAULT_MAX_WORKERS.
+            asynchronous (bool, optional): A value indicating whether to create an asynchronous
+                client.  Defaults to False.
+            decoder_type (DecoderType, optional): The JSON library to decode response bodies
+                with.  Defaults to None, using the fastest installed library.
+            scheduler (RequestScheduler, optional): The scheduler to send requests through,
+                setting the rate limit, concurrency and retries.  Defaults to None, creating a
+                scheduler with the default limits.
+            fixture_directory (str, optional): The directory of recorded fixtures for a replay
+                client.  Defaults to None, replaying synthetic data.
+            page_size (int, optional): The number of results in each page for a replay client.
+                Defaults to DEFAULT_REPLAY_PAGE_SIZE.
+            latency (float, optional): The delay in seconds before each response for a replay
+                client.  Defaults to 0.0.
 
         Returns:
-            OctopusEnergyClientBase: The Octopus Energy client.
+            OctopusEnergyClientBase | AsyncOctopusEnergyClientBase: The Octopus Energy client.
         """
         match client_type:
             case 'API':
                 if not all([api_key, account_number, meter_mpan, meter_serial]):
                     raise ValueError('The API client requires an API key, account number, meter MPAN and serial number.')
 
+                if asynchronous:
+                    return AsyncOctopusEnergyClient(api_key,
+                                                    account_number,
+                                                    meter_mpan,
+                                                    meter_serial,
+                                                    pool_size,
+                                                    max_workers=max_workers,
+                                                    decoder=create_decoder(decoder_type),
+                                                    scheduler=scheduler)
+
+                return OctopusEnergyClient(api_key,
+                                           account_number,
+                                           meter_mpan,
+                                           meter_serial,
+                                           pool_size,
+                                           max_workers=max_workers,
+                                           decoder=create_decoder(decoder_type),
+                                           scheduler=scheduler)
+            case 'REPLAY' | 'FILE':
+                replay_session = ReplaySession(fixture_directory, page_size, latency, meter_mpan, meter_serial)
+                api_key = api_key if api_key is not None else ''
+
+                if asynchronous:
+                    return AsyncOctopusEnergyClient(api_key,
+                                                    account_number,
+                                                    meter_mpan,
+                                                    meter_serial,
+                                                    http_client=create_replay_http_client(replay_session),
+                                                    max_workers=max_workers,
+                                                    decoder=create_decoder(decoder_type),
+                                                    scheduler=scheduler)
+
                 return OctopusEnergyClient(api_key,
                                            account_number,
                                            meter_mpan,
-                                           meter_serial)
+                                           meter_serial,
+                                           session=replay_session,
+                                           max_workers=max_workers,
+                                           decoder=create_decoder(decoder_type),
+                                           scheduler=scheduler)
             case _:
                 pass
@@ -0,0 +1,225 @@
+"""
+Functions for working with the dates and times of Octopus Energy API data.
+"""
+
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+import numpy as np
+
+HALF_HOUR_SECONDS: int = 30 * 60
+DAY_SECONDS: int = 24 * 60 * 60
+LOCAL_TIMEZONE: ZoneInfo = ZoneInfo('Europe/London')
+
+def to_timestamp(value: datetime) -> int:
+    """
+    Converts a date and time to a Unix timestamp.
+
+    Dates and times without time zone information are treated as local UK time, matching how
+    they are interpreted by the Octopus Energy API.
+
+    Args:
+        value (datetime): The date and time.
+
+    Returns:
+        int: The Unix timestamp in seconds.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=LOCAL_TIMEZONE)
+
+    return int(value.timestamp())
+
+def from_timestamp(timestamp: int) -> datetime:
+    """
+    Converts a Unix timestamp to a date and time in UTC.
+
+    Args:
+        timestamp (int): The Unix timestamp in seconds.
+
+    Returns:
+        datetime: The date and time in UTC.
+    """
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+def to_local_datetime(timestamp: int) -> datetime:
+    """
+    Converts a Unix timestamp to a date and time in local UK time.
+
+    Args:
+        timestamp (int): The Unix timestamp in seconds.
+
+    Returns:
+        datetime: The date and time in local UK time.
+    """
+    return datetime.fromtimestamp(timestamp, tz=LOCAL_TIMEZONE)
+
+def parse_timestamp(value: str) -> int:
+    """
+    Parses an ISO-8601 date and time, as returned by the Octopus Energy API, to a Unix timestamp.
+
+    Args:
+        value (str): The date and time in ISO-8601 format.
+
+    Returns:
+        int: The Unix timestamp in seconds.
+    """
+    return to_timestamp(datetime.fromisoformat(value))
+
+def parse_timestamps(values: Sequence[str]) -> np.ndarray:
+    """
+    Parses ISO-8601 dates and times, as returned by the Octopus Energy API, to Unix timestamps.
+
+    Dates and times of the form returned by the API, with whole seconds and a 'Z' or '+HH:MM'
+    UTC offset, are parsed together by NumPy, with each distinct offset parsed only once.  Any
+    other form falls back to parsing each date and time individually.
+
+    Args:
+        values (Sequence[str]): The dates and times in ISO-8601 format.
+
+    Returns:
+        np.ndarray: The Unix timestamps in seconds.
+    """
+    try:
+        local_timestamps = np.array([value[:19] for value in values], dtype='datetime64[s]').astype(np.int64)
+        utc_offsets = np.fromiter((parse_utc_offset(value[19:]) for value in values), np.int64, len(values))
+    except ValueError:
+        return np.fromiter((parse_timestamp(value) for value in values), np.int64, len(values))
+
+    return local_timestamps - utc_offsets
+
+@lru_cache(maxsize=16)
+def parse_utc_offset(value: str) -> int:
+    """
+    Parses a 'Z' or '+HH:MM' ISO-8601 UTC offset to seconds.
+
+    Args:
+        value (str): The UTC offset.
+
+    Returns:
+        int: The UTC offset in seconds.
+    """
+    if value == 'Z':
+        return 0
+
+    if len(value) != 6 or value[0] not in '+-' or value[3] != ':':
+        raise ValueError(f'Unsupported UTC offset: {value}')
+
+    seconds = int(value[1:3]) * 3600 + int(value[4:6]) * 60
+    return seconds if value[0] == '+' else -seconds
+
+def format_timestamp(timestamp: int) -> str:
+    """
+    Formats a Unix timestamp as an ISO-8601 date and time in local UK time, matching the format
+    returned by the Octopus Energy API.
+
+    Args:
+        timestamp (int): The Unix timestamp in seconds.
+
+    Returns:
+        str: The date and time in ISO-8601 format.
+    """
+    return to_local_datetime(timestamp).isoformat()
+
+def format_timestamps(timestamps: np.ndarray) -> list[str]:
+    """
+    Formats Unix timestamps as ISO-8601 dates and times in local UK time, matching the format
+    returned by the Octopus Energy API.
+
+    The dates and times are formatted together by NumPy, with each distinct UTC offset
+    formatted only once.
+
+    Args:
+        timestamps (np.ndarray): The Unix timestamps in seconds.
+
+    Returns:
+        list[str]: The dates and times in ISO-8601 format.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    if len(timestamps) == 0:
+        return []
+
+    utc_offsets = get_utc_offsets(timestamps)
+    offsets, offset_indexes = np.unique(utc_offsets, return_inverse=True)
+    offset_suffixes = np.array([format_utc_offset(offset) for offset in offsets.tolist()])
+
+    local_times = np.datetime_as_string((timestamps + utc_offsets).astype('datetime64[s]'), unit='s')
+    return np.char.add(local_times, offset_suffixes[offset_indexes]).tolist()
+
+def get_utc_offsets(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Gets the UTC offsets of local UK time at Unix timestamps.
+
+    The offset is looked up once per distinct day, at its start and end, and only looked up for
+    each timestamp on days when the offset changes.
+
+    Args:
+        timestamps (np.ndarray): The Unix timestamps in seconds.
+
+    Returns:
+        np.ndarray: The UTC offsets in seconds.
+    """
+    days, day_indexes = np.unique(timestamps // DAY_SECONDS, return_inverse=True)
+    day_starts = days * DAY_SECONDS
+    day_start_offsets = np.fromiter((get_utc_offset(start) for start in day_starts.tolist()), np.int64, len(days))
+    day_end_offsets = np.fromiter((get_utc_offset(start + DAY_SECONDS - 1) for start in day_starts.tolist()),
+                                  np.int64,
+                                  len(days))
+
+    utc_offsets = day_start_offsets[day_indexes]
+    is_changing = (day_start_offsets != day_end_offsets)[day_indexes]
+    if is_changing.any():
+        utc_offsets[is_changing] = [get_utc_offset(timestamp) for timestamp in timestamps[is_changing].tolist()]
+
+    return utc_offsets
+
+def get_utc_offset(timestamp: int) -> int:
+    """
+    Gets the UTC offset of local UK time at a Unix timestamp.
+
+    Args:
+        timestamp (int): The Unix timestamp in seconds.
+
+    Returns:
+        int: The UTC offset in seconds.
+    """
+    return int(to_local_datetime(timestamp).utcoffset().total_seconds())
+
+def format_utc_offset(seconds: int) -> str:
+    """
+    Formats a UTC offset in seconds as a '+HH:MM' ISO-8601 UTC offset.
+
+    Args:
+        seconds (int): The UTC offset in seconds.
+
+    Returns:
+        str: The UTC offset.
+    """
+    sign = '+' if seconds >= 0 else '-'
+    hours, minutes = divmod(abs(seconds) // 60, 60)
+    return f'{sign}{hours:02d}:{minutes:02d}'
+
+def floor_half_hour(timestamp: int) -> int:
+    """
+    Rounds a Unix timestamp down to the start of its half-hour slot.
+
+    Args:
+        timestamp (int): The Unix timestamp in seconds.
+
+    Returns:
+        int: The Unix timestamp of the start of the half-hour slot.
+    """
+    return timestamp - timestamp % HALF_HOUR_SECONDS
+
+def ceil_half_hour(timestamp: int) -> int:
+    """
+    Rounds a Unix timestamp up to the start of the next half-hour slot, unless it is already at
+    the start of a slot.
+
+    Args:
+        timestamp (int): The Unix timestamp in seconds.
+
+    Returns:
+        int: The Unix timestamp of the start of the half-hour slot.
+    """
+    return floor_half_hour(timestamp + HALF_HOUR_SECONDS - 1)
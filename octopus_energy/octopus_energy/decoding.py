@@ -0,0 +1,219 @@
+"""
+Decoders for the JSON bodies of Octopus Energy API responses.
+
+The fastest installed JSON library is used by default: msgspec, then orjson, then the standard
+library json module.
+"""
+
+from abc import ABCMeta, abstractmethod
+import json
+from typing import Any, Literal
+import numpy as np
+from .dates import parse_timestamps
+from .model import (
+    ClientResponse,
+    ConsumptionSeries,
+    Product
+)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DecoderType = Literal['msgspec', 'orjson', 'json']
+
+class PageDecoder(metaclass=ABCMeta):
+    """
+    Base class for decoders of the JSON bodies of Octopus Energy API responses.
+    """
+
+    @abstractmethod
+    def decode(self, content: bytes) -> Any:
+        """
+        Decodes a JSON response body to plain Python objects.
+
+        Args:
+            content (bytes): The response body.
+
+        Returns:
+            Any: The decoded data.
+        """
+
+    @abstractmethod
+    def decode_consumption_page(self, content: bytes) -> ClientResponse[ConsumptionSeries]:
+        """
+        Decodes a page of consumption data from a response body.
+
+        Args:
+            content (bytes): The response body.
+
+        Returns:
+            ClientResponse[ConsumptionSeries]: The page of consumption data, with the results as
+            a ConsumptionSeries.
+        """
+
+    @abstractmethod
+    def decode_products_page(self, content: bytes) -> ClientResponse[Product]:
+        """
+        Decodes a page of product data from a response body.
+
+        Args:
+            content (bytes): The response body.
+
+        Returns:
+            ClientResponse[Product]: The page of product data.
+        """
+
+class JsonPageDecoder(PageDecoder):
+    """
+    A decoder using the standard library json module, which decodes pages to dictionaries before
+    building the results.
+    """
+
+    def decode(self, content: bytes) -> Any:
+        return json.loads(content)
+
+    def decode_consumption_page(self, content: bytes) -> ClientResponse[ConsumptionSeries]:
+        consumption_data = self.decode(content)
+        results_data = consumption_data['results']
+        results = ConsumptionSeries(
+            np.fromiter((entry['consumption'] for entry in results_data), np.float64, len(results_data)),
+            parse_timestamps([entry['interval_start'] for entry in results_data]),
+            parse_timestamps([entry['interval_end'] for entry in results_data]))
+
+        return ClientResponse(consumption_data['count'],
+                              consumption_data['next'],
+                              consumption_data['previous'],
+                              results)
+
+    def decode_products_page(self, content: bytes) -> ClientResponse[Product]:
+        product_data = self.decode(content)
+        results = [Product(**result_entry) for result_entry in product_data['results']]
+
+        return ClientResponse(product_data['count'],
+                              product_data['next'],
+                              product_data['previous'],
+                              results)
+
+class OrjsonPageDecoder(JsonPageDecoder):
+    """
+    A decoder using orjson, which decodes pages to dictionaries before building the results.
+    """
+
+    def decode(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+if msgspec is not None:
+    class ConsumptionEntry(msgspec.Struct):
+        """
+        A consumption entry in a page of consumption data.
+        """
+        consumption: float
+        interval_start: str
+        interval_end: str
+
+    class ConsumptionPage(msgspec.Struct):
+        """
+        A page of consumption data.
+        """
+        count: int
+        next: str | None
+        previous: str | None
+        results: list[ConsumptionEntry]
+
+    class ProductEntry(msgspec.Struct):
+        """
+        A product entry in a page of product data, with fields in the order of the Product class.
+        """
+        code: str
+        full_name: str
+        display_name: str
+        description: str
+        is_variable: bool
+        is_green: bool
+        is_tracker: bool
+        is_prepay: bool
+        is_business: bool
+        is_restricted: bool
+        term: int | None
+        available_from: str | None
+        available_to: str | None
+        links: list[dict[str, str]]
+        brand: str
+        tariffs_active_at: str | None = None
+        direction: str | None = None
+
+    class ProductPage(msgspec.Struct):
+        """
+        A page of product data.
+        """
+        count: int
+        next: str | None
+        previous: str | None
+        results: list[ProductEntry]
+
+class MsgspecPageDecoder(PageDecoder):
+    """
+    A decoder using msgspec, which decodes pages straight into typed structures without building
+    intermediate dictionaries.
+    """
+
+    def __init__(self):
+        """
+        Initialises an instance of the MsgspecPageDecoder class.
+        """
+        self.decoder = msgspec.json.Decoder()
+        self.consumption_page_decoder = msgspec.json.Decoder(ConsumptionPage)
+        self.products_page_decoder = msgspec.json.Decoder(ProductPage)
+
+    def decode(self, content: bytes) -> Any:
+        return self.decoder.decode(content)
+
+    def decode_consumption_page(self, content: bytes) -> ClientResponse[ConsumptionSeries]:
+        page = self.consumption_page_decoder.decode(content)
+        results = ConsumptionSeries(
+            np.fromiter((entry.consumption for entry in page.results), np.float64, len(page.results)),
+            parse_timestamps([entry.interval_start for entry in page.results]),
+            parse_timestamps([entry.interval_end for entry in page.results]))
+
+        return ClientResponse(page.count, page.next, page.previous, results)
+
+    def decode_products_page(self, content: bytes) -> ClientResponse[Product]:
+        page = self.products_page_decoder.decode(content)
+        results = [Product(*msgspec.structs.astuple(entry)) for entry in page.results]
+
+        return ClientResponse(page.count, page.next, page.previous, results)
+
+def create_decoder(decoder_type: DecoderType = None) -> PageDecoder:
+    """
+    Creates a decoder for the JSON bodies of Octopus Energy API responses.
+
+    Args:
+        decoder_type (DecoderType, optional): The JSON library to decode with.
+            Defaults to None, using the fastest installed library.
+
+    Returns:
+        PageDecoder: The decoder.
+    """
+    if decoder_type is None:
+        decoder_type = 'msgspec' if msgspec is not None else 'orjson' if orjson is not None else 'json'
+
+    match decoder_type:
+        case 'msgspec':
+            if msgspec is None:
+                raise ValueError('The msgspec decoder requires the msgspec package to be installed.')
+            return MsgspecPageDecoder()
+        case 'orjson':
+            if orjson is None:
+                raise ValueError('The orjson decoder requires the orjson package to be installed.')
+            return OrjsonPageDecoder()
+        case 'json':
+            return JsonPageDecoder()
+        case _:
+            raise ValueError(f'Unsupported decoder type: {decoder_type}')
@@ -0,0 +1,284 @@
+"""
+Writers exporting Octopus Energy data as tables, for loading into other tools.
+
+Consumption data is written a series at a time straight from its arrays, so long exports can be
+written in chunks as the data arrives without encoding each interval as a JSON object.  CSV and
+newline-delimited JSON are written with the standard library; Parquet and Arrow IPC files need
+the pyarrow package, which is only imported when one of those formats is used.
+"""
+
+from abc import ABCMeta, abstractmethod
+import csv
+import io
+from itertools import repeat
+import json
+from typing import Any, BinaryIO, Literal
+from .dates import LOCAL_TIMEZONE, format_timestamps
+from .model import ConsumptionSeries
+from .serialization import encode_json
+
+ExportFormat = Literal['csv', 'ndjson', 'parquet', 'arrow']
+EXPORT_FORMATS: tuple[str, ...] = ('csv', 'ndjson', 'parquet', 'arrow')
+
+CONSUMPTION_COLUMNS: tuple[str, ...] = ('consumption', 'interval_start', 'interval_end')
+
+class TableWriter(metaclass=ABCMeta):
+    """
+    Base class for writers of tables to a binary file.
+
+    A writer writes either consumption data or records, not both, and must be closed to finish
+    the file.  The file itself is left open.
+    """
+    def __init__(self, file: BinaryIO):
+        """
+        Initialises an instance of the TableWriter class.
+
+        Args:
+            file (BinaryIO): The file to write to.
+        """
+        self.file: BinaryIO = file
+
+    def __enter__(self) -> 'TableWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @abstractmethod
+    def write_consumption(self, consumption: ConsumptionSeries, labels: dict[str, str] = None) -> None:
+        """
+        Writes a row for each interval of a consumption series.
+
+        Args:
+            consumption (ConsumptionSeries): The consumption data.
+            labels (dict[str, str], optional): Columns with the same value for every row, such
+                as the meter the data is for, written before the consumption columns.
+                Defaults to None, for no extra columns.
+        """
+
+    @abstractmethod
+    def write_records(self, records: list[dict[str, Any]]) -> None:
+        """
+        Writes a row for each record.
+
+        Args:
+            records (list[dict[str, Any]]): The records, as dictionaries of plain values with
+                the same keys, such as from serialization.to_plain_value.
+        """
+
+    def close(self) -> None:
+        """
+        Finishes writing the table and flushes the file.
+        """
+        self.file.flush()
+
+class TextTableWriter(TableWriter):
+    """
+    Base class for writers of tables as UTF-8 text.
+    """
+    def __init__(self, file: BinaryIO):
+        """
+        Initialises an instance of the TextTableWriter class.
+
+        Args:
+            file (BinaryIO): The file to write to.
+        """
+        super().__init__(file)
+        self.text_file: io.TextIOWrapper = io.TextIOWrapper(file, encoding='utf-8', newline='')
+
+    def close(self) -> None:
+        self.text_file.flush()
+        self.text_file.detach()
+        super().close()
+
+class CsvTableWriter(TextTableWriter):
+    """
+    A writer of tables as CSV, with a header row, dates and times in ISO-8601 format and any
+    nested values as JSON.
+    """
+    def __init__(self, file: BinaryIO):
+        """
+        Initialises an instance of the CsvTableWriter class.
+
+        Args:
+            file (BinaryIO): The file to write to.
+        """
+        super().__init__(file)
+        self.writer = csv.writer(self.text_file, lineterminator='\n')
+        self.has_header: bool = False
+
+    def write_consumption(self, consumption: ConsumptionSeries, labels: dict[str, str] = None) -> None:
+        labels = labels or {}
+        self.write_header((*labels, *CONSUMPTION_COLUMNS))
+        self.writer.writerows(zip(*(repeat(value) for value in labels.values()),
+                                  consumption.consumption.tolist(),
+                                  format_timestamps(consumption.interval_starts),
+                                  format_timestamps(consumption.interval_ends)))
+
+    def write_records(self, records: list[dict[str, Any]]) -> None:
+        if not records:
+            return
+
+        self.write_header(tuple(records[0]))
+        self.writer.writerows([encode_csv_value(value) for value in record.values()] for record in records)
+
+    def write_header(self, columns: tuple[str, ...]) -> None:
+        """
+        Writes the header row, if it has not already been written.
+
+        Args:
+            columns (tuple[str, ...]): The names of the columns.
+        """
+        if not self.has_header:
+            self.writer.writerow(columns)
+            self.has_header = True
+
+class NdjsonTableWriter(TextTableWriter):
+    """
+    A writer of tables as newline-delimited JSON, with an object per row.
+    """
+    def write_consumption(self, consumption: ConsumptionSeries, labels: dict[str, str] = None) -> None:
+        # Each line is formatted from the columns rather than encoded as an object.  Labels are
+        # encoded once, the formatted dates and times need no escaping and the repr of a float
+        # is its JSON representation.
+        prefix = ''.join(f'{json.dumps(name)}:{json.dumps(value)},' for name, value in (labels or {}).items())
+        self.text_file.writelines(
+            f'{{{prefix}"consumption":{value!r},"interval_start":"{start}","interval_end":"{end}"}}\n'
+            for value, start, end in zip(consumption.consumption.tolist(),
+                                         format_timestamps(consumption.interval_starts),
+                                         format_timestamps(consumption.interval_ends)))
+
+    def write_records(self, records: list[dict[str, Any]]) -> None:
+        self.text_file.writelines(f'{encode_json(record)}\n' for record in records)
+
+class ArrowTableWriter(TableWriter):
+    """
+    A writer of tables as Arrow IPC files, with consumption as 64-bit floats and interval starts
+    and ends as timestamps in local UK time.
+    """
+    def __init__(self, file: BinaryIO):
+        """
+        Initialises an instance of the ArrowTableWriter class.
+
+        Args:
+            file (BinaryIO): The file to write to.
+        """
+        super().__init__(file)
+        self.pyarrow = import_pyarrow()
+        self.writer = None
+
+    def write_consumption(self, consumption: ConsumptionSeries, labels: dict[str, str] = None) -> None:
+        pa = self.pyarrow
+        timestamp_type = pa.timestamp('s', tz=LOCAL_TIMEZONE.key)
+        columns = {name: pa.repeat(pa.scalar(value, pa.string()), len(consumption))
+                   for name, value in (labels or {}).items()}
+        columns['consumption'] = pa.array(consumption.consumption, pa.float64())
+        columns['interval_start'] = pa.array(consumption.interval_starts, pa.int64()).cast(timestamp_type)
+        columns['interval_end'] = pa.array(consumption.interval_ends, pa.int64()).cast(timestamp_type)
+        self.write_table(pa.table(columns))
+
+    def write_records(self, records: list[dict[str, Any]]) -> None:
+        if records:
+            self.write_table(self.pyarrow.Table.from_pylist(records))
+
+    def write_table(self, table) -> None:
+        """
+        Writes an Arrow table, starting the file with its schema if nothing has been written.
+
+        Args:
+            table (pyarrow.Table): The table.
+        """
+        if self.writer is None:
+            self.writer = self.create_writer(table.schema)
+
+        self.writer.write_table(table)
+
+    def create_writer(self, schema):
+        """
+        Creates the writer of the file.
+
+        Args:
+            schema (pyarrow.Schema): The schema of the tables to write.
+
+        Returns:
+            pyarrow.ipc.RecordBatchFileWriter: The writer.
+        """
+        return self.pyarrow.ipc.new_file(self.file, schema)
+
+    def close(self) -> None:
+        if self.writer is None:
+            self.writer = self.create_writer(self.pyarrow.schema([]))
+
+        self.writer.close()
+        super().close()
+
+class ParquetTableWriter(ArrowTableWriter):
+    """
+    A writer of tables as Parquet files, with a row group for each series or list of records
+    written.
+    """
+    def create_writer(self, schema):
+        """
+        Creates the writer of the file.
+
+        Args:
+            schema (pyarrow.Schema): The schema of the tables to write.
+
+        Returns:
+            pyarrow.parquet.ParquetWriter: The writer.
+        """
+        import pyarrow.parquet # pylint: disable=import-outside-toplevel
+
+        return pyarrow.parquet.ParquetWriter(self.file, schema)
+
+def create_table_writer(export_format: ExportFormat, file: BinaryIO) -> TableWriter:
+    """
+    Creates a writer of tables in a format.
+
+    Args:
+        export_format (ExportFormat): The format to write.
+        file (BinaryIO): The file to write to.
+
+    Returns:
+        TableWriter: The writer.
+    """
+    match export_format:
+        case 'csv':
+            return CsvTableWriter(file)
+        case 'ndjson':
+            return NdjsonTableWriter(file)
+        case 'parquet':
+            return ParquetTableWriter(file)
+        case 'arrow':
+            return ArrowTableWriter(file)
+        case _:
+            raise ValueError(f'Unsupported export format: {export_format}')
+
+def import_pyarrow():
+    """
+    Imports the pyarrow package.
+
+    Returns:
+        module: The pyarrow package.
+    """
+    try:
+        import pyarrow # pylint: disable=import-outside-toplevel
+    except ImportError as error:
+        raise ValueError('The Parquet and Arrow formats require the pyarrow package to be installed.') from error
+
+    return pyarrow
+
+def encode_csv_value(value: Any) -> Any:
+    """
+    Encodes a plain value for a CSV cell, with lists and dictionaries as JSON.
+
+    Args:
+        value (Any): The value.
+
+    Returns:
+        Any: The value to write.
+    """
+    if isinstance(value, (list, dict)):
+        return encode_json(value)
+
+    return value
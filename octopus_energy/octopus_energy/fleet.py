@@ -0,0 +1,296 @@
+"""
+Fetching of consumption data for a fleet of meters across accounts.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import csv
+from datetime import datetime
+import threading
+from typing import Callable
+import numpy as np
+from requests import Session
+from .cache import ConsumptionCache
+from .client import OctopusEnergyClient, create_session
+from .dates import to_local_datetime
+from .decoding import PageDecoder, create_decoder
+from .model import ConsumptionGrouping, ConsumptionSeries
+from .repository import OctopusEnergyRepository
+from .scheduling import RequestScheduler
+
+DEFAULT_FLEET_WORKERS: int = 16
+METER_FIELDS: tuple[str, ...] = ('api_key', 'account_number', 'meter_mpan', 'meter_serial')
+
+class Meter:
+    """
+    Represents an electricity meter and the credentials to access its data.
+    """
+    def __init__(self, api_key: str, account_number: str, meter_mpan: str, meter_serial: str):
+        """
+        Initialises an instance of the Meter class.
+
+        Args:
+            api_key (str): The API key for accessing the Octopus Energy API.
+            account_number (str): The Octopus Energy account number.
+            meter_mpan (str): The Meter Point Administration Number (MPAN) for the meter.
+            meter_serial (str): The serial number for the meter.
+        """
+        self.api_key: str = api_key
+        self.account_number: str = account_number
+        self.meter_mpan: str = meter_mpan
+        self.meter_serial: str = meter_serial
+
+class MeterConsumption:
+    """
+    Represents the consumption data fetched for a meter in a fleet, or the error fetching it.
+    """
+    def __init__(self, meter: Meter, consumption: ConsumptionSeries = None, error: Exception = None):
+        """
+        Initialises an instance of the MeterConsumption class.
+
+        Args:
+            meter (Meter): The meter.
+            consumption (ConsumptionSeries, optional): The consumption data.
+                Defaults to None, if it could not be fetched.
+            error (Exception, optional): The error fetching the consumption data.
+                Defaults to None, if it was fetched.
+        """
+        self.meter: Meter = meter
+        self.consumption: ConsumptionSeries = consumption
+        self.error: Exception = error
+
+class FleetConsumptionTable:
+    """
+    Represents the consumption data for a fleet of meters as a single columnar table, with a
+    row per interval per meter.
+    """
+    def __init__(self, results: list[MeterConsumption]):
+        """
+        Initialises an instance of the FleetConsumptionTable class.
+
+        Meters whose consumption data could not be fetched have no rows.
+
+        Args:
+            results (list[MeterConsumption]): The consumption data for each meter.
+        """
+        series = [result.consumption for result in results if result.consumption is not None]
+        meters = [result.meter for result in results if result.consumption is not None]
+        lengths = [len(consumption) for consumption in series]
+
+        self.meter_mpans: np.ndarray = np.repeat(np.array([meter.meter_mpan for meter in meters], dtype=object),
+                                                 lengths)
+        self.meter_serials: np.ndarray = np.repeat(np.array([meter.meter_serial for meter in meters], dtype=object),
+                                                   lengths)
+        combined: ConsumptionSeries = ConsumptionSeries.concatenate(series)
+        self.consumption: np.ndarray = combined.consumption
+        self.interval_starts: np.ndarray = combined.interval_starts
+        self.interval_ends: np.ndarray = combined.interval_ends
+
+    def __len__(self) -> int:
+        return len(self.consumption)
+
+    def to_columns(self) -> dict[str, list]:
+        """
+        Converts the table to a dictionary of columns of plain values.
+
+        Returns:
+            dict[str, list]: The columns, with interval starts and ends as dates and times.
+        """
+        return {
+            'meter_mpan': self.meter_mpans.tolist(),
+            'meter_serial': self.meter_serials.tolist(),
+            'consumption': self.consumption.tolist(),
+            'interval_start': [to_local_datetime(start) for start in self.interval_starts.tolist()],
+            'interval_end': [to_local_datetime(end) for end in self.interval_ends.tolist()]
+        }
+
+class OctopusEnergyFleet:
+    """
+    Fetches consumption data for many meters, across accounts and API keys, concurrently.
+
+    Every meter's requests share one pooled HTTP session, so connections are reused across
+    meters, while each API key has its own request scheduler, so the rate limit of each key is
+    respected however many of its meters are fetched at once.  If a consumption cache is
+    provided, it is shared by every meter.
+    """
+
+    def __init__(self,
+                 max_workers: int = DEFAULT_FLEET_WORKERS,
+                 session: Session = None,
+                 cache: ConsumptionCache = None,
+                 decoder: PageDecoder = None,
+                 create_scheduler: Callable[[], RequestScheduler] = RequestScheduler
+    ):
+        """
+        Initialises an instance of the OctopusEnergyFleet class.
+
+        Args:
+            max_workers (int, optional): The maximum number of meters to fetch concurrently.
+                Defaults to DEFAULT_FLEET_WORKERS.
+            session (Session, optional): An existing HTTP session to send requests through.
+                The session is not closed with the fleet.  Defaults to None, creating a new
+                pooled session with a connection per worker.
+            cache (ConsumptionCache, optional): The consumption cache.
+                Defaults to None, fetching all consumption data from the API.
+            decoder (PageDecoder, optional): The decoder for response bodies.
+                Defaults to None, using the fastest installed JSON library.
+            create_scheduler (Callable[[], RequestScheduler], optional): A function to create
+                the request scheduler for each API key.  Defaults to RequestScheduler.
+        """
+        if max_workers < 1:
+            raise ValueError('The maximum number of workers must be at least 1.')
+
+        self.max_workers: int = max_workers
+        self.owns_session: bool = session is None
+        self.session: Session = session if session is not None else create_session(max_workers)
+        self.cache: ConsumptionCache = cache
+        self.decoder: PageDecoder = decoder if decoder is not None else create_decoder()
+        self.create_scheduler: Callable[[], RequestScheduler] = create_scheduler
+        self.schedulers: dict[str, RequestScheduler] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def __enter__(self):
+        """
+        Enters the fleet context.
+
+        Returns:
+            OctopusEnergyFleet: The fleet.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Exits the fleet context, closing the HTTP session if it is owned by the fleet.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the HTTP session and its pooled connections if it is owned by the fleet.
+        """
+        if self.owns_session:
+            self.session.close()
+
+    def get_consumption(self,
+                        meters: list[Meter],
+                        from_date: datetime = None,
+                        to_date: datetime = None,
+                        grouping: ConsumptionGrouping = 'half-hour'
+        ) -> list[MeterConsumption]:
+        """
+        Gets consumption data for every meter in the fleet between two dates.
+
+        An error fetching one meter's consumption data is recorded in its result rather than
+        stopping the others.
+
+        Args:
+            meters (list[Meter]): The meters.
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            list[MeterConsumption]: The consumption data for each meter, in the order of the meters.
+        """
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(meters), 1))) as executor:
+            return list(executor.map(lambda meter: self.get_meter_consumption(meter,
+                                                                             from_date,
+                                                                             to_date,
+                                                                             grouping),
+                                     meters))
+
+    def get_consumption_table(self,
+                              meters: list[Meter],
+                              from_date: datetime = None,
+                              to_date: datetime = None,
+                              grouping: ConsumptionGrouping = 'half-hour'
+        ) -> FleetConsumptionTable:
+        """
+        Gets consumption data for every meter in the fleet between two dates as a single table.
+
+        Args:
+            meters (list[Meter]): The meters.
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            FleetConsumptionTable: The consumption data for the meters that could be fetched.
+        """
+        return FleetConsumptionTable(self.get_consumption(meters, from_date, to_date, grouping))
+
+    def get_meter_consumption(self,
+                              meter: Meter,
+                              from_date: datetime = None,
+                              to_date: datetime = None,
+                              grouping: ConsumptionGrouping = 'half-hour'
+        ) -> MeterConsumption:
+        """
+        Gets consumption data for a meter in the fleet between two dates.
+
+        Args:
+            meter (Meter): The meter.
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            MeterConsumption: The consumption data for the meter, or the error fetching it.
+        """
+        client = OctopusEnergyClient(meter.api_key,
+                                     meter.account_number,
+                                     meter.meter_mpan,
+                                     meter.meter_serial,
+                                     session=self.session,
+                                     max_workers=1,
+                                     decoder=self.decoder,
+                                     scheduler=self.get_scheduler(meter.api_key))
+        repository = OctopusEnergyRepository(client, self.cache)
+        try:
+            return MeterConsumption(meter, repository.get_consumption(from_date, to_date, grouping))
+        except Exception as error:
+            return MeterConsumption(meter, error=error)
+
+    def get_scheduler(self, api_key: str) -> RequestScheduler:
+        """
+        Gets the request scheduler for an API key, creating it on first use.
+
+        Args:
+            api_key (str): The API key.
+
+        Returns:
+            RequestScheduler: The request scheduler shared by every meter using the API key.
+        """
+        with self.lock:
+            if api_key not in self.schedulers:
+                self.schedulers[api_key] = self.create_scheduler()
+            return self.schedulers[api_key]
+
+def load_meters(path: str) -> list[Meter]:
+    """
+    Loads a fleet of meters from a CSV file.
+
+    The file must have a header row with api_key, account_number, meter_mpan and meter_serial
+    columns.
+
+    Args:
+        path (str): The path of the CSV file.
+
+    Returns:
+        list[Meter]: The meters, in the order of the file.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as meters_file:
+        reader = csv.DictReader(meters_file)
+        missing_fields = [field for field in METER_FIELDS if field not in (reader.fieldnames or [])]
+        if missing_fields:
+            raise ValueError(f'The meters file is missing the columns: {', '.join(missing_fields)}')
+
+        return [Meter(*(row[field].strip() for field in METER_FIELDS)) for row in reader]
@@ -2,19 +2,195 @@
 Types for working with data from the Octopus Energy API.
 """
 
-from typing import Literal
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import datetime
+from typing import Literal, get_args, overload
 from enum import Flag
+import numpy as np
+from .dates import to_local_datetime, to_timestamp
 
 ConsumptionGrouping = Literal['half-hour', 'hour', 'day', 'week', 'month', 'quarter']
+CONSUMPTION_GROUPINGS: tuple[ConsumptionGrouping, ...] = get_args(ConsumptionGrouping)
+
+class ClientResponse[T]:
+    """
+    Represents a response from the Octopus Energy API.
+    """
+
+    def __init__(self, count: int, next: str, previous: str, results: Sequence[T]):
+        """
+        Initialises an instance of the ClientResponse class.
+
+        Args:
+            count (int): The count of entries in the response.
+            next (str): The URL for the next page of data if available, otherwise None.
+            previous (str): The URL for the previous page of data if available, otherwise None.
+            results (Sequence[T]): The data entries.
+        """
+        self.count: int = count
+        self.next: str = next
+        self.previous: str = previous
+        self.results: Sequence[T] = results
 
 class Consumption:
     """
     Represents consumption data for a given time interval.
+
+    The interval start and end are dates and times, which are only formatted as ISO-8601 strings
+    when the data is output.  ISO-8601 strings are also accepted and parsed once on creation.
     """
-    def __init__(self, consumption: float, interval_start, interval_end):
+    def __init__(self, consumption: float, interval_start: datetime | str, interval_end: datetime | str):
         self.consumption: float = consumption
-        self.interval_start: str = interval_start
-        self.interval_end: str = interval_end
+        self.interval_start: datetime = parse_datetime(interval_start)
+        self.interval_end: datetime = parse_datetime(interval_end)
+
+class ConsumptionSeries(Sequence[Consumption]):
+    """
+    Represents consumption data for a series of time intervals, stored in contiguous arrays.
+
+    Consumption values are held as 64-bit floats and interval starts and ends as 64-bit Unix
+    timestamps, rather than as an object and two dates and times per interval.  Iterating over
+    or indexing the series gives Consumption views of the intervals, so it can be used wherever
+    a list of consumption data is expected.
+    """
+    def __init__(self,
+                 consumption: Iterable[float] = (),
+                 interval_starts: Iterable[int] = (),
+                 interval_ends: Iterable[int] = ()
+        ):
+        """
+        Initialises an instance of the ConsumptionSeries class.
+
+        Args:
+            consumption (Iterable[float], optional): The consumption value for each interval.
+                Defaults to no intervals.
+            interval_starts (Iterable[int], optional): The Unix timestamp of the start of each
+                interval.  Defaults to no intervals.
+            interval_ends (Iterable[int], optional): The Unix timestamp of the end of each
+                interval.  Defaults to no intervals.
+        """
+        self.consumption: np.ndarray = np.asarray(consumption, dtype=np.float64)
+        self.interval_starts: np.ndarray = np.asarray(interval_starts, dtype=np.int64)
+        self.interval_ends: np.ndarray = np.asarray(interval_ends, dtype=np.int64)
+
+        if not len(self.consumption) == len(self.interval_starts) == len(self.interval_ends):
+            raise ValueError('Consumption values, interval starts and interval ends must have the same length.')
+
+    @classmethod
+    def from_consumption(cls, consumption_data: Iterable[Consumption]) -> 'ConsumptionSeries':
+        """
+        Creates a series from consumption data.
+
+        Args:
+            consumption_data (Iterable[Consumption]): The consumption data.
+
+        Returns:
+            ConsumptionSeries: The consumption series.
+        """
+        entries = list(consumption_data)
+        return cls(np.fromiter((entry.consumption for entry in entries), np.float64, len(entries)),
+                   np.fromiter((to_timestamp(entry.interval_start) for entry in entries), np.int64, len(entries)),
+                   np.fromiter((to_timestamp(entry.interval_end) for entry in entries), np.int64, len(entries)))
+
+    @classmethod
+    def concatenate(cls, series: Iterable['ConsumptionSeries']) -> 'ConsumptionSeries':
+        """
+        Joins consumption series end to end.
+
+        Args:
+            series (Iterable[ConsumptionSeries]): The consumption series to join.
+
+        Returns:
+            ConsumptionSeries: The joined consumption series.
+        """
+        series = list(series)
+        if len(series) == 1:
+            return series[0]
+
+        return cls(np.concatenate([entry.consumption for entry in series] or [[]]),
+                   np.concatenate([entry.interval_starts for entry in series] or [[]]),
+                   np.concatenate([entry.interval_ends for entry in series] or [[]]))
+
+    def __len__(self) -> int:
+        return len(self.consumption)
+
+    @overload
+    def __getitem__(self, index: int) -> Consumption: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> 'ConsumptionSeries': ...
+
+    def __getitem__(self, index: int | slice) -> 'Consumption | ConsumptionSeries':
+        if isinstance(index, slice):
+            return ConsumptionSeries(self.consumption[index],
+                                     self.interval_starts[index],
+                                     self.interval_ends[index])
+
+        return Consumption(float(self.consumption[index]),
+                           to_local_datetime(int(self.interval_starts[index])),
+                           to_local_datetime(int(self.interval_ends[index])))
+
+    def __iter__(self) -> Iterator[Consumption]:
+        for consumption, interval_start, interval_end in zip(self.consumption.tolist(),
+                                                             self.interval_starts.tolist(),
+                                                             self.interval_ends.tolist()):
+            yield Consumption(consumption,
+                              to_local_datetime(interval_start),
+                              to_local_datetime(interval_end))
+
+class ConsumptionSummary:
+    """
+    Represents summary statistics for consumption data between two dates.
+    """
+    def __init__(self,
+                 count: int,
+                 total: float,
+                 mean: float,
+                 median: float,
+                 p95: float,
+                 maximum: Consumption,
+                 minimum: Consumption,
+                 interval_start: datetime,
+                 interval_end: datetime
+        ):
+        """
+        Initialises an instance of the ConsumptionSummary class.
+
+        Args:
+            count (int): The number of periods.
+            total (float): The total consumption.
+            mean (float): The mean consumption per period, or None if there are no periods.
+            median (float): The median consumption per period, or None if there are no periods.
+            p95 (float): The 95th percentile of consumption per period, or None if there are no
+                periods.
+            maximum (Consumption): The period with maximum consumption, or None if there are no
+                periods.
+            minimum (Consumption): The period with minimum consumption, or None if there are no
+                periods.
+            interval_start (datetime): The start of the summarised data.
+            interval_end (datetime): The end of the summarised data.
+        """
+        self.count: int = count
+        self.total: float = total
+        self.mean: float = mean
+        self.median: float = median
+        self.p95: float = p95
+        self.maximum: Consumption = maximum
+        self.minimum: Consumption = minimum
+        self.interval_start: datetime = interval_start
+        self.interval_end: datetime = interval_end
+
+def parse_datetime(value: datetime | str) -> datetime:
+    """
+    Parses a date and time from an ISO-8601 string, if it is not already a date and time.
+
+    Args:
+        value (datetime | str): The date and time, or an ISO-8601 string, or None.
+
+    Returns:
+        datetime: The date and time, or None.
+    """
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
 
 class Link:
     """
@@ -0,0 +1,486 @@
+"""
+Replay of Octopus Energy API responses from recorded fixtures or synthetic data, for working and
+benchmarking without a network.
+
+A fixture directory can hold any of the following files, each with either the body of an API
+response or, for consumption and products, just its list of results:
+
+- account.json: The account.
+- consumption.json: Every half-hourly consumption entry, in any order.
+- products.json: Every product.
+
+Any data without a fixture is generated synthetically and deterministically.
+"""
+
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlparse
+import httpx
+import numpy as np
+from requests import HTTPError
+from .dates import (
+    HALF_HOUR_SECONDS,
+    ceil_half_hour,
+    floor_half_hour,
+    format_timestamp,
+    parse_timestamp,
+    parse_timestamps
+)
+from .model import ConsumptionSeries
+from .resampling import resample_consumption
+
+ACCOUNT_FIXTURE_FILENAME: str = 'account.json'
+CONSUMPTION_FIXTURE_FILENAME: str = 'consumption.json'
+PRODUCTS_FIXTURE_FILENAME: str = 'products.json'
+DEFAULT_REPLAY_PAGE_SIZE: int = 100
+DEFAULT_SYNTHETIC_DAYS: int = 30
+DEFAULT_SYNTHETIC_PRODUCT_COUNT: int = 60
+PRODUCT_FLAGS: tuple[str, ...] = ('is_variable', 'is_green', 'is_tracker', 'is_prepay', 'is_business')
+
+class ReplayResponse:
+    """
+    Represents a replayed HTTP response, with the parts of a requests response used by the client.
+    """
+    def __init__(self, url: str, status_code: int, content: bytes):
+        """
+        Initialises an instance of the ReplayResponse class.
+
+        Args:
+            url (str): The URL the response is for.
+            status_code (int): The HTTP status code.
+            content (bytes): The response body.
+        """
+        self.url: str = url
+        self.status_code: int = status_code
+        self.headers: dict[str, str] = {'Content-Type': 'application/json'}
+        self.content: bytes = content
+
+    @property
+    def text(self) -> str:
+        """
+        Gets the response body as text.
+
+        Returns:
+            str: The response body.
+        """
+        return self.content.decode()
+
+    def raise_for_status(self) -> None:
+        """
+        Raises an error if the response has an error status.
+        """
+        if self.status_code >= 400:
+            raise HTTPError(f'{self.status_code} Error for url: {self.url}', response=self)
+
+class ReplaySession:
+    """
+    A stand-in for an HTTP session which replays Octopus Energy API responses from recorded
+    fixtures or synthetic data.
+
+    Consumption is filtered by period, grouped and paged as the API does, newest first, and
+    products are filtered by their flags and availability.  Each request can be delayed to
+    simulate network latency.  The session can be used in place of a requests session by the
+    synchronous client and, through an httpx mock transport, by the asynchronous client.
+    """
+
+    def __init__(self,
+                 fixture_directory: str = None,
+                 page_size: int = DEFAULT_REPLAY_PAGE_SIZE,
+                 latency: float = 0.0,
+                 meter_mpan: str = None,
+                 meter_serial: str = None
+    ):
+        """
+        Initialises an instance of the ReplaySession class.
+
+        Args:
+            fixture_directory (str, optional): The directory of recorded fixtures.
+                Defaults to None, generating all data synthetically.
+            page_size (int, optional): The number of results in each page.
+                Defaults to DEFAULT_REPLAY_PAGE_SIZE.
+            latency (float, optional): The delay in seconds before each response.
+                Defaults to 0.0.
+            meter_mpan (str, optional): The MPAN of the meter in the synthetic account.
+                Defaults to None.
+            meter_serial (str, optional): The serial number of the meter in the synthetic account.
+                Defaults to None.
+        """
+        if page_size < 1:
+            raise ValueError('The page size must be at least 1.')
+        if latency < 0:
+            raise ValueError('The latency must not be negative.')
+
+        self.fixture_directory: str = fixture_directory
+        self.page_size: int = page_size
+        self.latency: float = latency
+        self.meter_mpan: str = meter_mpan
+        self.meter_serial: str = meter_serial
+        self.lock: threading.Lock = threading.Lock()
+        self.fixtures: dict[str, Any] = {}
+
+    def get(self, url: str, auth: tuple[str, str] = None, timeout: float = None) -> ReplayResponse:
+        """
+        Replays the response to an HTTP GET request.
+
+        Args:
+            url (str): The URL of the request.
+            auth (tuple[str, str], optional): The authorisation, which is ignored.
+                Defaults to None.
+            timeout (float, optional): The timeout, which is ignored.
+                Defaults to None.
+
+        Returns:
+            ReplayResponse: The replayed response.
+        """
+        if self.latency:
+            time.sleep(self.latency)
+
+        return ReplayResponse(url, *self.respond(url))
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Replays the response to an asynchronous HTTP request, for use with an httpx mock transport.
+
+        Args:
+            request (httpx.Request): The request.
+
+        Returns:
+            httpx.Response: The replayed response.
+        """
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        status_code, content = self.respond(str(request.url))
+        return httpx.Response(status_code, content=content, headers={'Content-Type': 'application/json'})
+
+    def close(self) -> None:
+        """
+        Closes the session, which holds no connections.
+        """
+
+    def respond(self, url: str) -> tuple[int, bytes]:
+        """
+        Builds the status code and body of the response to a URL.
+
+        Args:
+            url (str): The URL of the request.
+
+        Returns:
+            tuple[int, bytes]: The HTTP status code and the response body.
+        """
+        parsed_url = urlparse(url)
+        path_parts = [part for part in parsed_url.path.split('/') if part]
+        parameters = {key: values[0] for key, values in parse_qs(parsed_url.query).items()}
+
+        match path_parts:
+            case ['v1', 'accounts', account_number]:
+                data = self.get_account(account_number)
+            case ['v1', 'electricity-meter-points', _, 'meters', _, 'consumption']:
+                data = self.get_consumption_page(parameters)
+            case ['v1', 'products']:
+                data = self.get_products_page(parameters)
+            case _:
+                return 404, json.dumps({'detail': 'Not found.'}).encode()
+
+        if data is None:
+            return 404, json.dumps({'detail': 'Invalid page.'}).encode()
+
+        return 200, json.dumps(data).encode()
+
+    def get_account(self, account_number: str) -> dict[str, Any]:
+        """
+        Gets the body of an account response.
+
+        Args:
+            account_number (str): The account number.
+
+        Returns:
+            dict[str, Any]: The account data.
+        """
+        account_data = self.load_fixture(ACCOUNT_FIXTURE_FILENAME)
+        if account_data is not None:
+            return account_data
+
+        return create_synthetic_account(account_number, self.meter_mpan, self.meter_serial)
+
+    def get_consumption_page(self, parameters: dict[str, str]) -> dict[str, Any] | None:
+        """
+        Gets the body of a page of consumption data.
+
+        Args:
+            parameters (dict[str, str]): The query string parameters.
+
+        Returns:
+            dict[str, Any] | None: The page of consumption data, or None if the page does not
+            exist.
+        """
+        from_timestamp = parse_timestamp(parameters['period_from']) if 'period_from' in parameters else None
+        to_timestamp = parse_timestamp(parameters['period_to']) if 'period_to' in parameters else None
+
+        consumption_data = self.get_consumption(from_timestamp, to_timestamp)
+        consumption_data = resample_consumption(consumption_data, parameters.get('group_by', 'half-hour'))
+        newest_first = np.argsort(-consumption_data.interval_starts, kind='stable')
+        consumption = np.round(consumption_data.consumption[newest_first], 3).tolist()
+        interval_starts = consumption_data.interval_starts[newest_first].tolist()
+        interval_ends = consumption_data.interval_ends[newest_first].tolist()
+
+        return self.build_page(len(consumption),
+                               int(parameters.get('page', 1)),
+                               lambda start, end: [
+                                   {
+                                       'consumption': consumption[index],
+                                       'interval_start': format_timestamp(interval_starts[index]),
+                                       'interval_end': format_timestamp(interval_ends[index])
+                                   }
+                                   for index in range(start, end)
+                               ])
+
+    def get_consumption(self, from_timestamp: int = None, to_timestamp: int = None) -> ConsumptionSeries:
+        """
+        Gets the half-hourly consumption data between two Unix timestamps.
+
+        Args:
+            from_timestamp (int, optional): The start of the consumption data.
+                Defaults to None, starting from the first fixture entry or DEFAULT_SYNTHETIC_DAYS
+                before the end of synthetic data.
+            to_timestamp (int, optional): The end of the consumption data.
+                Defaults to None, ending at the last fixture entry or now for synthetic data.
+
+        Returns:
+            ConsumptionSeries: The consumption data.
+        """
+        fixture_data = self.load_fixture(CONSUMPTION_FIXTURE_FILENAME)
+        if fixture_data is None:
+            to_timestamp = to_timestamp if to_timestamp is not None else floor_half_hour(int(time.time()))
+            from_timestamp = (from_timestamp if from_timestamp is not None
+                              else to_timestamp - DEFAULT_SYNTHETIC_DAYS * 24 * 60 * 60)
+            return create_synthetic_consumption(from_timestamp, to_timestamp)
+
+        mask = np.ones(len(fixture_data), dtype=bool)
+        if from_timestamp is not None:
+            mask &= fixture_data.interval_starts >= from_timestamp
+        if to_timestamp is not None:
+            mask &= fixture_data.interval_starts < to_timestamp
+
+        return ConsumptionSeries(fixture_data.consumption[mask],
+                                 fixture_data.interval_starts[mask],
+                                 fixture_data.interval_ends[mask])
+
+    def get_products_page(self, parameters: dict[str, str]) -> dict[str, Any] | None:
+        """
+        Gets the body of a page of product data.
+
+        Args:
+            parameters (dict[str, str]): The query string parameters.
+
+        Returns:
+            dict[str, Any] | None: The page of product data, or None if the page does not exist.
+        """
+        products_data = self.load_fixture(PRODUCTS_FIXTURE_FILENAME)
+        if products_data is None:
+            products_data = create_synthetic_products(DEFAULT_SYNTHETIC_PRODUCT_COUNT)
+
+        availability_timestamp = (parse_timestamp(parameters['available_at']) if 'available_at' in parameters
+                                  else int(time.time()))
+        products_data = [
+            product_data for product_data in products_data
+            if all(product_data[flag] for flag in PRODUCT_FLAGS if parameters.get(flag) == 'true')
+            and is_product_available(product_data, availability_timestamp)
+        ]
+
+        return self.build_page(len(products_data),
+                               int(parameters.get('page', 1)),
+                               lambda start, end: products_data[start:end])
+
+    def build_page(self,
+                   count: int,
+                   page: int,
+                   get_results: Callable[[int, int], list[dict[str, Any]]]
+        ) -> dict[str, Any] | None:
+        """
+        Builds the body of a page of a paged API resource.
+
+        Args:
+            count (int): The total number of results.
+            page (int): The page number.
+            get_results (Callable[[int, int], list[dict[str, Any]]]): A function to get the results
+                between two positions.
+
+        Returns:
+            dict[str, Any] | None: The page, or None if the page does not exist.
+        """
+        page_count = max(1, math.ceil(count / self.page_size))
+        if page < 1 or page > page_count:
+            return None
+
+        start = (page - 1) * self.page_size
+        return {
+            'count': count,
+            'next': f'?page={page + 1}' if page < page_count else None,
+            'previous': f'?page={page - 1}' if page > 1 else None,
+            'results': get_results(start, min(start + self.page_size, count))
+        }
+
+    def load_fixture(self, filename: str) -> Any:
+        """
+        Loads a fixture, caching it for later requests.
+
+        Consumption fixtures are loaded as a ConsumptionSeries and product fixtures as a list of
+        product data.
+
+        Args:
+            filename (str): The filename of the fixture.
+
+        Returns:
+            Any: The fixture data, or None if there is no fixture.
+        """
+        if self.fixture_directory is None:
+            return None
+
+        with self.lock:
+            if filename not in self.fixtures:
+                path = os.path.join(self.fixture_directory, filename)
+                fixture_data = None
+                if os.path.exists(path):
+                    with open(path, 'r', encoding='utf-8') as fixture_file:
+                        fixture_data = json.load(fixture_file)
+                    if filename != ACCOUNT_FIXTURE_FILENAME and isinstance(fixture_data, dict):
+                        fixture_data = fixture_data['results']
+                    if filename == CONSUMPTION_FIXTURE_FILENAME:
+                        fixture_data = ConsumptionSeries(
+                            [entry['consumption'] for entry in fixture_data],
+                            parse_timestamps([entry['interval_start'] for entry in fixture_data]),
+                            parse_timestamps([entry['interval_end'] for entry in fixture_data]))
+                self.fixtures[filename] = fixture_data
+
+            return self.fixtures[filename]
+
+def create_replay_http_client(session: ReplaySession) -> httpx.AsyncClient:
+    """
+    Creates an asynchronous HTTP client which replays responses from a replay session.
+
+    Args:
+        session (ReplaySession): The replay session.
+
+    Returns:
+        httpx.AsyncClient: The asynchronous HTTP client.
+    """
+    return httpx.AsyncClient(transport=httpx.MockTransport(session.handle_async_request))
+
+def is_product_available(product_data: dict[str, Any], timestamp: int) -> bool:
+    """
+    Determines whether a product is available at a Unix timestamp.
+
+    Args:
+        product_data (dict[str, Any]): The product data.
+        timestamp (int): The Unix timestamp.
+
+    Returns:
+        bool: A value indicating whether the product is available.
+    """
+    available_from = product_data.get('available_from')
+    available_to = product_data.get('available_to')
+    return ((available_from is None or parse_timestamp(available_from) <= timestamp)
+            and (available_to is None or timestamp < parse_timestamp(available_to)))
+
+def create_synthetic_consumption(from_timestamp: int, to_timestamp: int) -> ConsumptionSeries:
+    """
+    Creates synthetic half-hourly consumption data between two Unix timestamps.
+
+    Consumption follows a daily profile, peaking in the evening, with deterministic variation so
+    the same slot always has the same consumption.
+
+    Args:
+        from_timestamp (int): The start of the consumption data.
+        to_timestamp (int): The end of the consumption data.
+
+    Returns:
+        ConsumptionSeries: The consumption data.
+    """
+    interval_starts = np.arange(ceil_half_hour(from_timestamp), to_timestamp, HALF_HOUR_SECONDS, dtype=np.int64)
+    slots = interval_starts // HALF_HOUR_SECONDS
+    hours = (interval_starts % (24 * 60 * 60)) / (60 * 60)
+    profile = 0.1 + 0.4 * (1 + np.sin(2 * np.pi * (hours - 12) / 24)) / 2
+    variation = (slots * 2654435761 % 1000) / 5000
+    return ConsumptionSeries(np.round(profile + variation, 3), interval_starts, interval_starts + HALF_HOUR_SECONDS)
+
+def create_synthetic_products(product_count: int) -> list[dict[str, Any]]:
+    """
+    Creates synthetic product data with a mix of flags.
+
+    Args:
+        product_count (int): The number of products.
+
+    Returns:
+        list[dict[str, Any]]: The product data.
+    """
+    return [
+        {
+            'code': f'REPLAY-{index:03}',
+            'direction': 'IMPORT',
+            'full_name': f'Replay Product {index}',
+            'display_name': f'Replay {index}',
+            'description': 'A synthetic product replayed without a network.',
+            'is_variable': index % 2 == 0,
+            'is_green': index % 3 == 0,
+            'is_tracker': index % 5 == 0,
+            'is_prepay': index % 7 == 0,
+            'is_business': index % 11 == 0,
+            'is_restricted': False,
+            'term': None if index % 2 == 0 else 12,
+            'available_from': '2020-01-01T00:00:00Z',
+            'available_to': None,
+            'links': [
+                {
+                    'href': f'https://api.octopus.energy/v1/products/REPLAY-{index:03}/',
+                    'method': 'GET',
+                    'rel': 'self'
+                }
+            ],
+            'brand': 'OCTOPUS_ENERGY'
+        }
+        for index in range(product_count)
+    ]
+
+def create_synthetic_account(account_number: str, meter_mpan: str = None, meter_serial: str = None) -> dict[str, Any]:
+    """
+    Creates synthetic account data with a single property and electricity meter.
+
+    Args:
+        account_number (str): The account number.
+        meter_mpan (str, optional): The MPAN of the meter.
+            Defaults to None.
+        meter_serial (str, optional): The serial number of the meter.
+            Defaults to None.
+
+    Returns:
+        dict[str, Any]: The account data.
+    """
+    return {
+        'number': account_number,
+        'properties': [
+            {
+                'moved_in_at': '2020-01-01T00:00:00Z',
+                'moved_out_at': None,
+                'address_line_1': '1 Replay Street',
+                'town': 'London',
+                'postcode': 'SW1A 1AA',
+                'electricity_meter_points': [
+                    {
+                        'mpan': meter_mpan,
+                        'profile_class': 1,
+                        'consumption_standard': 2900,
+                        'meters': [{'serial_number': meter_serial, 'registers': []}],
+                        'agreements': [],
+                        'is_export': False
+                    }
+                ],
+                'gas_meter_points': []
+            }
+        ]
+    }
@@ -2,29 +2,64 @@
 A repository for working with data from the Octopus Energy API.
 """
 
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime
-from .client import OctopusEnergyClientBase
+import time
+import numpy as np
+from .cache import ConsumptionCache, SyncResult
+from .catalogue import ProductCatalogue
+from .client import AsyncOctopusEnergyClientBase, OctopusEnergyClientBase
+from .dates import (
+    HALF_HOUR_SECONDS,
+    ceil_half_hour,
+    format_timestamp,
+    from_timestamp,
+    to_local_datetime,
+    to_timestamp
+)
 from .model import (
+    CONSUMPTION_GROUPINGS,
     Account,
     Consumption,
     ConsumptionGrouping,
+    ConsumptionSeries,
+    ConsumptionSummary,
     Product,
     ProductFiltering
 )
+from .resampling import resample_consumption
 
 class OctopusEnergyRepository:
     """
     A repository for working with data from the Octopus Energy API.
+
+    If a consumption cache is provided, half-hourly consumption data is served from the cache
+    and only the slots missing from it, or stale, are fetched from the API.  Coarser groupings
+    are resampled from the cached half-hourly data.
+
+    If a product catalogue is provided, all products are fetched once and kept for the time to
+    live of the catalogue, with queries for products answered from it.
     """
 
-    def __init__(self, client: OctopusEnergyClientBase):
+    def __init__(self,
+                 client: OctopusEnergyClientBase,
+                 cache: ConsumptionCache = None,
+                 catalogue: ProductCatalogue = None
+    ):
         """
         Initializes an instance of the OctopusEnergyRepository class.
 
         Args:
             client (OctopusEnergyClientBase): The Octopus Energy client.
+            cache (ConsumptionCache, optional): The consumption cache.
+                Defaults to None, fetching all consumption data from the API.
+            catalogue (ProductCatalogue, optional): The product catalogue.
+                Defaults to None, fetching all product data from the API.
         """
         self.client: OctopusEnergyClientBase = client
+        self.cache: ConsumptionCache = cache
+        self.catalogue: ProductCatalogue = catalogue
 
     def get_account(self) -> Account:
         """
@@ -39,7 +74,7 @@ class OctopusEnergyRepository:
                         from_date: datetime = None,
                         to_date: datetime = None,
                         grouping: ConsumptionGrouping = 'half-hour'
-        ) -> list[Consumption]:
+        ) -> ConsumptionSeries:
         """
         Gets consumption data in set intervals between two dates.
 
@@ -52,9 +87,140 @@ class OctopusEnergyRepository:
                 Defaults to 'half-hour'.
 
         Returns:
-            list[Consumption]: A list of consumption data.
+            ConsumptionSeries: The consumption data, newest first as returned by the API.
+        """
+        if not is_cacheable(self.cache, from_date, grouping):
+            return self.client.get_consumption(from_date, to_date, grouping)
+
+        meter_mpan, meter_serial = self.client.meter_mpan, self.client.meter_serial
+        start_timestamp, end_timestamp = get_cache_range(from_date, to_date)
+        for range_start, range_end in self.cache.find_missing_ranges(meter_mpan,
+                                                                     meter_serial,
+                                                                     start_timestamp,
+                                                                     end_timestamp):
+            consumption_data = self.client.get_consumption(from_timestamp(range_start),
+                                                           from_timestamp(range_end))
+            self.cache.store_consumption(meter_mpan, meter_serial, range_start, range_end, consumption_data)
+
+        consumption_data = self.cache.get_consumption(meter_mpan, meter_serial, start_timestamp, end_timestamp)
+        return to_api_order(resample_consumption(consumption_data, grouping))
+
+    def iter_consumption(self,
+                         from_date: datetime = None,
+                         to_date: datetime = None,
+                         grouping: ConsumptionGrouping = 'half-hour'
+        ) -> Iterator[ConsumptionSeries]:
+        """
+        Gets consumption data in set intervals between two dates in chunks, yielding each chunk
+        as soon as it is available so the data does not need to be held in memory all at once.
+
+        Without a cache, each page is yielded as it arrives from the API.  With a cache,
+        half-hourly data is served newest first in windows of as many slots as the client fetches
+        in one round of concurrent pages, each fetching only the slots missing from the cache.
+        Larger windows would fetch more pages at once, but hold more data in memory and delay the
+        first chunk; smaller ones would leave the client's workers idle.  Coarser groupings are
+        small enough to be resampled and yielded in a single chunk.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Yields:
+            ConsumptionSeries: The next chunk of consumption data.
         """
-        return self.client.get_consumption(from_date, to_date, grouping)
+        if not is_cacheable(self.cache, from_date, grouping):
+            yield from self.client.iter_consumption(from_date, to_date, grouping)
+            return
+
+        if grouping != 'half-hour':
+            yield self.get_consumption(from_date, to_date, grouping)
+            return
+
+        start_timestamp, end_timestamp = get_cache_range(from_date, to_date)
+        window_seconds = self.client.page_size * self.client.max_workers * HALF_HOUR_SECONDS
+        for window_end in range(end_timestamp, start_timestamp, -window_seconds):
+            window_start = max(window_end - window_seconds, start_timestamp)
+            yield self.get_consumption(from_timestamp(window_start), from_timestamp(window_end))
+
+    def sync_consumption(self,
+                         from_date: datetime = None,
+                         to_date: datetime = None
+        ) -> SyncResult:
+        """
+        Incrementally syncs half-hourly consumption data for the meter into the cache.
+
+        Data is fetched from the high-water mark of the previous sync onward, so each sync only
+        requests data that is new since the last one.  Any gaps in the cached data before the
+        high-water mark are then backfilled, until they are fetched after the end of their
+        settlement period and stay empty.  The first sync of a meter requires a start date.
+
+        Args:
+            from_date (datetime, optional): The start date for the first sync, or the earliest
+                date to check for gaps on later syncs.  Defaults to None, checking for gaps from
+                the earliest cached data.
+            to_date (datetime, optional): The end date for the sync.
+                Defaults to None, using the current time.
+
+        Returns:
+            SyncResult: The counts of new, updated and backfilled half-hour slots.
+        """
+        if self.cache is None:
+            raise ValueError('Syncing consumption data requires a consumption cache.')
+
+        meter_mpan, meter_serial = self.client.meter_mpan, self.client.meter_serial
+        high_water_mark = self.cache.get_high_water_mark(meter_mpan, meter_serial)
+        if high_water_mark is None and from_date is None:
+            raise ValueError('The first sync of a meter requires a start date.')
+
+        sync_start = high_water_mark if high_water_mark is not None else to_timestamp(from_date)
+        _, sync_end = get_cache_range(from_timestamp(sync_start), to_date)
+
+        new_slot_count: int = 0
+        updated_slot_count: int = 0
+        if sync_start < sync_end:
+            consumption_data = self.client.get_consumption(from_timestamp(sync_start),
+                                                           from_timestamp(sync_end))
+            new_slot_count, updated_slot_count = self.cache.store_consumption(meter_mpan,
+                                                                              meter_serial,
+                                                                              sync_start,
+                                                                              sync_end,
+                                                                              consumption_data)
+
+        backfilled_slot_count: int = 0
+        gap_start = to_timestamp(from_date) if from_date else None
+        if gap_start is None:
+            gap_start = self.cache.get_first_interval_start(meter_mpan, meter_serial)
+
+        if high_water_mark is not None and gap_start is not None:
+            for range_start, range_end in self.cache.find_gaps(meter_mpan,
+                                                               meter_serial,
+                                                               gap_start,
+                                                               high_water_mark):
+                consumption_data = self.client.get_consumption(from_timestamp(range_start),
+                                                               from_timestamp(range_end))
+                filled_slot_count, changed_slot_count = self.cache.store_consumption(meter_mpan,
+                                                                                     meter_serial,
+                                                                                     range_start,
+                                                                                     range_end,
+                                                                                     consumption_data)
+                backfilled_slot_count += filled_slot_count
+                updated_slot_count += changed_slot_count
+
+        last_interval_end = self.cache.get_last_interval_end(meter_mpan, meter_serial)
+        new_high_water_mark = max(filter(None, [high_water_mark, last_interval_end]), default=None)
+        if new_high_water_mark is not None:
+            self.cache.set_high_water_mark(meter_mpan, meter_serial, new_high_water_mark)
+
+        return SyncResult(meter_mpan,
+                          meter_serial,
+                          new_slot_count,
+                          updated_slot_count,
+                          backfilled_slot_count,
+                          format_timestamp(new_high_water_mark) if new_high_water_mark is not None else None)
 
     def get_max_consumption(self,
                             from_date: datetime = None,
@@ -75,9 +241,8 @@ class OctopusEnergyRepository:
         Returns:
             Consumption: The period with maximum consumption.
         """
-        consumption_data: list[Consumption] = self.get_consumption(from_date, to_date, grouping)
-        max_consumption = max(consumption_data, key=lambda c: c.consumption)
-        return max_consumption
+        consumption_data: ConsumptionSeries = self.get_consumption(from_date, to_date, grouping)
+        return find_max_consumption(consumption_data)
 
     def get_min_consumption(self,
                             from_date: datetime = None,
@@ -98,9 +263,8 @@ class OctopusEnergyRepository:
         Returns:
             Consumption: The period with minimum consumption.
         """
-        consumption_data: list[Consumption] = self.get_consumption(from_date, to_date, grouping)
-        min_consumption = min(consumption_data, key=lambda c: c.consumption)
-        return min_consumption
+        consumption_data: ConsumptionSeries = self.get_consumption(from_date, to_date, grouping)
+        return find_min_consumption(consumption_data)
 
     def get_total_consumption(self,
                               from_date: datetime = None,
@@ -118,12 +282,31 @@ class OctopusEnergyRepository:
         Returns:
             Consumption: The total consumption.
         """
-        consumption_data: list[Consumption] = self.get_consumption(from_date, to_date)
-        total_consumption: float = sum([c.consumption for c in consumption_data])
-        interval_start = from_date if from_date else min([entry.interval_start for entry in consumption_data])
-        interval_end = to_date if to_date else max([entry.interval_end for entry in consumption_data])
-        consumption = Consumption(total_consumption, interval_start.isoformat(), interval_end.isoformat())
-        return consumption
+        consumption_data: ConsumptionSeries = self.get_consumption(from_date, to_date)
+        return calculate_total_consumption(consumption_data, from_date, to_date)
+
+    def summarise_consumption(self,
+                              from_date: datetime = None,
+                              to_date: datetime = None,
+                              grouping: ConsumptionGrouping = 'half-hour'
+        ) -> ConsumptionSummary:
+        """
+        Gets summary statistics for consumption between two dates from a single fetch.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            ConsumptionSummary: The count, total, mean, median, 95th percentile, maximum and
+            minimum of the consumption.
+        """
+        consumption_data: ConsumptionSeries = self.get_consumption(from_date, to_date, grouping)
+        return summarise_consumption(consumption_data, from_date, to_date)
 
     def get_products(self,
                      availability_date: datetime = None,
@@ -137,5 +320,361 @@ class OctopusEnergyRepository:
                 Defaults to None.
             filtering (ProductFiltering, optional): The filtering of the products.
                 Defaults to ProductFiltering.DEFAULT.
+
+        Returns:
+            list[Product]: The products.
         """
-        return self.client.get_products(availability_date, filtering)
+        if self.catalogue is None:
+            return self.client.get_products(availability_date, filtering)
+
+        if not self.catalogue.is_fresh():
+            self.catalogue.update(self.client.get_products())
+
+        if not self.catalogue.covers(availability_date):
+            return self.client.get_products(availability_date, filtering)
+
+        return self.catalogue.find_products(availability_date, filtering)
+
+class AsyncOctopusEnergyRepository:
+    """
+    An asynchronous repository for working with data from the Octopus Energy API.
+
+    If a consumption cache is provided, half-hourly consumption data is served from the cache
+    and only the slots missing from it, or stale, are fetched from the API, concurrently.  Coarser
+    groupings are resampled from the cached half-hourly data.  The cache is read and written in
+    worker threads so the event loop is not blocked.
+
+    If a product catalogue is provided, all products are fetched once and kept for the time to
+    live of the catalogue, with queries for products answered from it.
+    """
+
+    def __init__(self,
+                 client: AsyncOctopusEnergyClientBase,
+                 cache: ConsumptionCache = None,
+                 catalogue: ProductCatalogue = None
+    ):
+        """
+        Initializes an instance of the AsyncOctopusEnergyRepository class.
+
+        Args:
+            client (AsyncOctopusEnergyClientBase): The asynchronous Octopus Energy client.
+            cache (ConsumptionCache, optional): The consumption cache.
+                Defaults to None, fetching all consumption data from the API.
+            catalogue (ProductCatalogue, optional): The product catalogue.
+                Defaults to None, fetching all product data from the API.
+        """
+        self.client: AsyncOctopusEnergyClientBase = client
+        self.cache: ConsumptionCache = cache
+        self.catalogue: ProductCatalogue = catalogue
+
+    async def get_account(self) -> Account:
+        """
+        Gets an account.
+
+        Returns:
+            Account: The account.
+        """
+        return await self.client.get_account()
+
+    async def get_consumption(self,
+                              from_date: datetime = None,
+                              to_date: datetime = None,
+                              grouping: ConsumptionGrouping = 'half-hour'
+        ) -> ConsumptionSeries:
+        """
+        Gets consumption data in set intervals between two dates.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            ConsumptionSeries: The consumption data, newest first as returned by the API.
+        """
+        if not is_cacheable(self.cache, from_date, grouping):
+            return await self.client.get_consumption(from_date, to_date, grouping)
+
+        meter_mpan, meter_serial = self.client.meter_mpan, self.client.meter_serial
+        start_timestamp, end_timestamp = get_cache_range(from_date, to_date)
+        missing_ranges = await asyncio.to_thread(self.cache.find_missing_ranges,
+                                                 meter_mpan,
+                                                 meter_serial,
+                                                 start_timestamp,
+                                                 end_timestamp)
+
+        async def fetch_range(range_start: int, range_end: int) -> None:
+            consumption_data = await self.client.get_consumption(from_timestamp(range_start),
+                                                                 from_timestamp(range_end))
+            await asyncio.to_thread(self.cache.store_consumption,
+                                    meter_mpan,
+                                    meter_serial,
+                                    range_start,
+                                    range_end,
+                                    consumption_data)
+
+        await asyncio.gather(*[fetch_range(range_start, range_end) for range_start, range_end in missing_ranges])
+
+        consumption_data = await asyncio.to_thread(self.cache.get_consumption,
+                                                   meter_mpan,
+                                                   meter_serial,
+                                                   start_timestamp,
+                                                   end_timestamp)
+        return to_api_order(resample_consumption(consumption_data, grouping))
+
+    async def get_max_consumption(self,
+                                  from_date: datetime = None,
+                                  to_date: datetime = None,
+                                  grouping: ConsumptionGrouping = 'half-hour'
+        ) -> Consumption:
+        """
+        Gets the period with maximum consumption between two dates.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            Consumption: The period with maximum consumption.
+        """
+        consumption_data: ConsumptionSeries = await self.get_consumption(from_date, to_date, grouping)
+        return find_max_consumption(consumption_data)
+
+    async def get_min_consumption(self,
+                                  from_date: datetime = None,
+                                  to_date: datetime = None,
+                                  grouping: ConsumptionGrouping = 'half-hour'
+        ) -> Consumption:
+        """
+        Gets the period with minimum consumption between two dates.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            Consumption: The period with minimum consumption.
+        """
+        consumption_data: ConsumptionSeries = await self.get_consumption(from_date, to_date, grouping)
+        return find_min_consumption(consumption_data)
+
+    async def get_total_consumption(self,
+                                    from_date: datetime = None,
+                                    to_date: datetime = None
+        ) -> Consumption:
+        """
+        Gets the total consumption between two dates.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+
+        Returns:
+            Consumption: The total consumption.
+        """
+        consumption_data: ConsumptionSeries = await self.get_consumption(from_date, to_date)
+        return calculate_total_consumption(consumption_data, from_date, to_date)
+
+    async def summarise_consumption(self,
+                                    from_date: datetime = None,
+                                    to_date: datetime = None,
+                                    grouping: ConsumptionGrouping = 'half-hour'
+        ) -> ConsumptionSummary:
+        """
+        Gets summary statistics for consumption between two dates from a single fetch.
+
+        Args:
+            from_date (datetime, optional): The start date for the consumption data.
+                Defaults to None.
+            to_date (datetime, optional): The end date for the consumption data.
+                Defaults to None.
+            grouping (ConsumptionGrouping, optional): The grouping of the consumption data.
+                Defaults to 'half-hour'.
+
+        Returns:
+            ConsumptionSummary: The count, total, mean, median, 95th percentile, maximum and
+            minimum of the consumption.
+        """
+        consumption_data: ConsumptionSeries = await self.get_consumption(from_date, to_date, grouping)
+        return summarise_consumption(consumption_data, from_date, to_date)
+
+    async def get_products(self,
+                           availability_date: datetime = None,
+                           filtering: ProductFiltering = ProductFiltering.DEFAULT
+        ) -> list[Product]:
+        """
+        Gets all products.
+
+        Args:
+            availability_date (datetime, optional): The date to filter products by availability.
+                Defaults to None.
+            filtering (ProductFiltering, optional): The filtering of the products.
+                Defaults to ProductFiltering.DEFAULT.
+
+        Returns:
+            list[Product]: The products.
+        """
+        if self.catalogue is None:
+            return await self.client.get_products(availability_date, filtering)
+
+        if not self.catalogue.is_fresh():
+            self.catalogue.update(await self.client.get_products())
+
+        if not self.catalogue.covers(availability_date):
+            return await self.client.get_products(availability_date, filtering)
+
+        return self.catalogue.find_products(availability_date, filtering)
+
+def is_cacheable(cache: ConsumptionCache,
+                 from_date: datetime,
+                 grouping: ConsumptionGrouping
+    ) -> bool:
+    """
+    Determines whether a consumption request can be served from the cache.
+
+    Only half-hourly data over a range with a start date is cached, but any grouping of it can be
+    served by resampling the cached data.
+
+    Args:
+        cache (ConsumptionCache): The consumption cache, if any.
+        from_date (datetime): The start date for the consumption data.
+        grouping (ConsumptionGrouping): The grouping of the consumption data.
+
+    Returns:
+        bool: A value indicating whether the request can be served from the cache.
+    """
+    return cache is not None and from_date is not None and grouping in CONSUMPTION_GROUPINGS
+
+def get_cache_range(from_date: datetime, to_date: datetime = None) -> tuple[int, int]:
+    """
+    Gets the range of Unix timestamps to serve from the cache for a consumption request.
+
+    The range ends at the current half-hour slot at the latest, as there is no data beyond it.
+
+    Args:
+        from_date (datetime): The start date for the consumption data.
+        to_date (datetime, optional): The end date for the consumption data.
+            Defaults to None, using the current time.
+
+    Returns:
+        tuple[int, int]: The start, inclusive, and end, exclusive, Unix timestamps.
+    """
+    latest_timestamp = ceil_half_hour(int(time.time()))
+    start_timestamp = to_timestamp(from_date)
+    end_timestamp = min(to_timestamp(to_date), latest_timestamp) if to_date else latest_timestamp
+    return start_timestamp, max(start_timestamp, end_timestamp)
+
+def to_api_order(consumption_data: ConsumptionSeries) -> ConsumptionSeries:
+    """
+    Orders consumption data in time order newest first, as it is returned by the API, so data
+    served from the cache is ordered the same as data fetched from the API.
+
+    Args:
+        consumption_data (ConsumptionSeries): The consumption data in time order.
+
+    Returns:
+        ConsumptionSeries: The consumption data newest first.
+    """
+    return consumption_data[::-1]
+
+def find_max_consumption(consumption_data: ConsumptionSeries) -> Consumption:
+    """
+    Finds the period with maximum consumption.
+
+    Args:
+        consumption_data (ConsumptionSeries): The consumption data.
+
+    Returns:
+        Consumption: The period with maximum consumption.
+    """
+    return consumption_data[int(np.argmax(consumption_data.consumption))]
+
+def find_min_consumption(consumption_data: ConsumptionSeries) -> Consumption:
+    """
+    Finds the period with minimum consumption.
+
+    Args:
+        consumption_data (ConsumptionSeries): The consumption data.
+
+    Returns:
+        Consumption: The period with minimum consumption.
+    """
+    return consumption_data[int(np.argmin(consumption_data.consumption))]
+
+def calculate_total_consumption(consumption_data: ConsumptionSeries,
+                                from_date: datetime = None,
+                                to_date: datetime = None
+    ) -> Consumption:
+    """
+    Calculates the total consumption over a set of periods.
+
+    Args:
+        consumption_data (ConsumptionSeries): The consumption data.
+        from_date (datetime, optional): The start date for the consumption data.
+            Defaults to None, using the earliest period start.
+        to_date (datetime, optional): The end date for the consumption data.
+            Defaults to None, using the latest period end.
+
+    Returns:
+        Consumption: The total consumption.
+    """
+    total_consumption: float = float(np.sum(consumption_data.consumption))
+    interval_start = from_date if from_date else to_local_datetime(int(np.min(consumption_data.interval_starts)))
+    interval_end = to_date if to_date else to_local_datetime(int(np.max(consumption_data.interval_ends)))
+    consumption = Consumption(total_consumption, interval_start, interval_end)
+    return consumption
+
+def summarise_consumption(consumption_data: ConsumptionSeries,
+                          from_date: datetime = None,
+                          to_date: datetime = None
+    ) -> ConsumptionSummary:
+    """
+    Calculates summary statistics for consumption over a set of periods.
+
+    Args:
+        consumption_data (ConsumptionSeries): The consumption data.
+        from_date (datetime, optional): The start date for the consumption data.
+            Defaults to None, using the earliest period start.
+        to_date (datetime, optional): The end date for the consumption data.
+            Defaults to None, using the latest period end.
+
+    Returns:
+        ConsumptionSummary: The summary statistics.
+    """
+    count = len(consumption_data)
+    if count == 0:
+        return ConsumptionSummary(0,
+                                  0.0,
+                                  None,
+                                  None,
+                                  None,
+                                  None,
+                                  None,
+                                  from_date,
+                                  to_date)
+
+    values = consumption_data.consumption
+    total = float(np.sum(values))
+    median, p95 = np.percentile(values, [50, 95])
+    return ConsumptionSummary(count,
+                              total,
+                              total / count,
+                              float(median),
+                              float(p95),
+                              consumption_data[int(np.argmax(values))],
+                              consumption_data[int(np.argmin(values))],
+                              from_date if from_date else to_local_datetime(int(np.min(consumption_data.interval_starts))),
+                              to_date if to_date else to_local_datetime(int(np.max(consumption_data.interval_ends))))
@@ -0,0 +1,123 @@
+"""
+Resampling of half-hourly consumption data into coarser groupings.
+"""
+
+from datetime import datetime, timedelta
+import numpy as np
+from .dates import LOCAL_TIMEZONE
+from .model import ConsumptionGrouping, ConsumptionSeries
+
+HOUR_SECONDS: int = 60 * 60
+
+def resample_consumption(consumption_data: ConsumptionSeries,
+                         grouping: ConsumptionGrouping
+    ) -> ConsumptionSeries:
+    """
+    Resamples half-hourly consumption data into a coarser grouping.
+
+    Periods start on local UK boundaries, so days run from local midnight and are 23 or 25 hours
+    long when the clocks change.  Weeks start on Mondays, and quarters start in January, April,
+    July and October.  As with the Octopus Energy API, periods without any data are omitted.
+
+    Args:
+        consumption_data (ConsumptionSeries): The half-hourly consumption data.
+        grouping (ConsumptionGrouping): The grouping to resample the consumption data into.
+
+    Returns:
+        ConsumptionSeries: The consumption data for each period in time order.
+    """
+    if grouping == 'half-hour' or len(consumption_data) == 0:
+        return consumption_data
+
+    order = np.argsort(consumption_data.interval_starts, kind='stable')
+    interval_starts = consumption_data.interval_starts[order]
+    consumption = consumption_data.consumption[order]
+
+    boundaries = build_period_boundaries(int(interval_starts[0]), int(interval_starts[-1]), grouping)
+    period_indexes = np.searchsorted(boundaries, interval_starts, side='right') - 1
+    period_consumption = np.bincount(period_indexes, weights=consumption, minlength=len(boundaries) - 1)
+    has_data = np.bincount(period_indexes, minlength=len(boundaries) - 1) > 0
+
+    return ConsumptionSeries(period_consumption[has_data],
+                             boundaries[:-1][has_data],
+                             boundaries[1:][has_data])
+
+def build_period_boundaries(from_timestamp: int,
+                            to_timestamp: int,
+                            grouping: ConsumptionGrouping
+    ) -> np.ndarray:
+    """
+    Builds the boundaries of the periods in a grouping that cover two times.
+
+    Args:
+        from_timestamp (int): The Unix timestamp of the earliest time to cover.
+        to_timestamp (int): The Unix timestamp of the latest time to cover.
+        grouping (ConsumptionGrouping): The grouping of the periods.
+
+    Returns:
+        np.ndarray: The Unix timestamps of the period boundaries in time order, from the start of
+        the period containing the earliest time to the end of the period containing the latest.
+    """
+    if grouping == 'hour':
+        # UK time is always a whole number of hours from UTC, so hours can be built in UTC.
+        first_boundary = from_timestamp - from_timestamp % HOUR_SECONDS
+        return np.arange(first_boundary, to_timestamp + HOUR_SECONDS + 1, HOUR_SECONDS, dtype=np.int64)
+
+    boundary = get_period_start(datetime.fromtimestamp(from_timestamp, tz=LOCAL_TIMEZONE), grouping)
+    boundaries: list[int] = [int(boundary.timestamp())]
+    while boundaries[-1] <= to_timestamp:
+        boundary = get_next_period_start(boundary, grouping)
+        boundaries.append(int(boundary.timestamp()))
+
+    return np.array(boundaries, dtype=np.int64)
+
+def get_period_start(value: datetime, grouping: ConsumptionGrouping) -> datetime:
+    """
+    Gets the start of the period in a grouping containing a local UK date and time.
+
+    Args:
+        value (datetime): The local UK date and time.
+        grouping (ConsumptionGrouping): The grouping of the periods.
+
+    Returns:
+        datetime: The local UK date and time of the start of the period.
+    """
+    match grouping:
+        case 'day':
+            start = value.date()
+        case 'week':
+            start = value.date() - timedelta(days=value.weekday())
+        case 'month':
+            start = value.date().replace(day=1)
+        case 'quarter':
+            start = value.date().replace(month=value.month - (value.month - 1) % 3, day=1)
+        case _:
+            raise ValueError(f'Unsupported consumption grouping: {grouping}')
+
+    return datetime(start.year, start.month, start.day, tzinfo=LOCAL_TIMEZONE)
+
+def get_next_period_start(period_start: datetime, grouping: ConsumptionGrouping) -> datetime:
+    """
+    Gets the start of the period in a grouping following the one starting at a local UK date and
+    time.
+
+    Args:
+        period_start (datetime): The local UK date and time of the start of the period.
+        grouping (ConsumptionGrouping): The grouping of the periods.
+
+    Returns:
+        datetime: The local UK date and time of the start of the next period.
+    """
+    match grouping:
+        case 'day':
+            start = period_start.date() + timedelta(days=1)
+        case 'week':
+            start = period_start.date() + timedelta(weeks=1)
+        case 'month' | 'quarter':
+            months = 1 if grouping == 'month' else 3
+            month_index = period_start.year * 12 + period_start.month - 1 + months
+            start = period_start.date().replace(year=month_index // 12, month=month_index % 12 + 1)
+        case _:
+            raise ValueError(f'Unsupported consumption grouping: {grouping}')
+
+    return datetime(start.year, start.month, start.day, tzinfo=LOCAL_TIMEZONE)
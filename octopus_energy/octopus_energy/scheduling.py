@@ -0,0 +1,251 @@
+"""
+Scheduling of requests to the Octopus Energy API within its rate limits.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import random
+import threading
+import time
+from typing import Awaitable, Callable
+from weakref import WeakKeyDictionary
+import httpx
+import requests
+
+DEFAULT_RATE_LIMIT: float = 10.0
+DEFAULT_BURST: int = 10
+DEFAULT_MAX_CONCURRENCY: int = 8
+DEFAULT_MAX_RETRIES: int = 3
+DEFAULT_BACKOFF: float = 0.5
+DEFAULT_MAX_BACKOFF: float = 30.0
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+    requests.ConnectionError,
+    requests.Timeout,
+    httpx.TimeoutException,
+    httpx.NetworkError
+)
+HttpResponse = requests.Response | httpx.Response
+
+class RequestScheduler:
+    """
+    A scheduler for requests to the Octopus Energy API, shared by every thread and client that
+    sends requests through it.
+
+    Requests are released at a steady rate by a token bucket, which allows short bursts, and no
+    more than the maximum concurrency are in flight at once.  Requests that are rate limited,
+    fail with a server error or time out are retried with jittered exponential backoff, waiting
+    for as long as a Retry-After header asks where one is given, up to the maximum backoff, so a
+    server cannot stall a request indefinitely.  Any other error status, or an error status once
+    the retries are used up, is raised.
+    """
+
+    def __init__(self,
+                 rate_limit: float = DEFAULT_RATE_LIMIT,
+                 burst: int = DEFAULT_BURST,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 max_backoff: float = DEFAULT_MAX_BACKOFF,
+                 clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialises an instance of the RequestScheduler class.
+
+        Args:
+            rate_limit (float, optional): The sustained number of requests per second.
+                Defaults to DEFAULT_RATE_LIMIT.
+            burst (int, optional): The number of requests that can be sent at once after idling.
+                Defaults to DEFAULT_BURST.
+            max_concurrency (int, optional): The maximum number of requests in flight at once.
+                Defaults to DEFAULT_MAX_CONCURRENCY.
+            max_retries (int, optional): The maximum number of times to retry a request.
+                Defaults to DEFAULT_MAX_RETRIES.
+            backoff (float, optional): The base delay in seconds before the first retry, doubled
+                for each retry after.  Defaults to DEFAULT_BACKOFF.
+            max_backoff (float, optional): The maximum delay in seconds before a retry, including
+                one asked for by a Retry-After header.  Defaults to DEFAULT_MAX_BACKOFF.
+            clock (Callable[[], float], optional): The monotonic clock in seconds.
+                Defaults to time.monotonic.
+        """
+        if rate_limit <= 0:
+            raise ValueError('The rate limit must be greater than 0.')
+        if burst < 1:
+            raise ValueError('The burst must be at least 1.')
+        if max_concurrency < 1:
+            raise ValueError('The maximum concurrency must be at least 1.')
+        if max_retries < 0:
+            raise ValueError('The maximum number of retries must not be negative.')
+
+        self.rate_limit: float = rate_limit
+        self.burst: int = burst
+        self.max_concurrency: int = max_concurrency
+        self.max_retries: int = max_retries
+        self.backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.clock: Callable[[], float] = clock
+        self.lock: threading.Lock = threading.Lock()
+        self.concurrency: threading.BoundedSemaphore = threading.BoundedSemaphore(max_concurrency)
+        self.async_concurrency: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+        self.tokens: float = float(burst)
+        self.updated_at: float = clock()
+
+    def send(self, request: Callable[[], HttpResponse]) -> HttpResponse:
+        """
+        Sends a request within the rate limit, retrying it if it fails transiently.
+
+        Args:
+            request (Callable[[], HttpResponse]): A function to send the request.
+
+        Returns:
+            HttpResponse: The successful response.
+        """
+        attempt: int = 0
+        while True:
+            time.sleep(self.reserve())
+            with self.concurrency:
+                try:
+                    response = request()
+                except RETRYABLE_EXCEPTIONS:
+                    if attempt >= self.max_retries:
+                        raise
+                    response = None
+
+            delay = self.get_retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            attempt += 1
+            time.sleep(delay)
+
+    async def send_async(self, request: Callable[[], Awaitable[HttpResponse]]) -> HttpResponse:
+        """
+        Sends an asynchronous request within the rate limit, retrying it if it fails transiently.
+
+        Requests from the same event loop wait their turn on a semaphore for that loop, so only
+        those that could be sent wait on the concurrency limit shared with other threads.
+
+        Args:
+            request (Callable[[], Awaitable[HttpResponse]]): A function to send the request.
+
+        Returns:
+            HttpResponse: The successful response.
+        """
+        attempt: int = 0
+        while True:
+            await asyncio.sleep(self.reserve())
+            async with self.get_async_concurrency():
+                await self.acquire_async()
+                try:
+                    response = await request()
+                except RETRYABLE_EXCEPTIONS:
+                    if attempt >= self.max_retries:
+                        raise
+                    response = None
+                finally:
+                    self.concurrency.release()
+
+            delay = self.get_retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def get_async_concurrency(self) -> asyncio.Semaphore:
+        """
+        Gets the semaphore limiting the requests in flight from the running event loop.
+
+        Returns:
+            asyncio.Semaphore: The semaphore for the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            if loop not in self.async_concurrency:
+                self.async_concurrency[loop] = asyncio.Semaphore(self.max_concurrency)
+            return self.async_concurrency[loop]
+
+    async def acquire_async(self) -> None:
+        """
+        Acquires the concurrency limit shared with other threads without blocking the event loop,
+        waiting for it in a worker thread if it is not free.
+        """
+        if self.concurrency.acquire(blocking=False):
+            return
+
+        acquisition = asyncio.ensure_future(asyncio.to_thread(self.concurrency.acquire))
+        try:
+            await asyncio.shield(acquisition)
+        except asyncio.CancelledError:
+            # The worker thread cannot be interrupted, so release the limit once it is acquired.
+            acquisition.add_done_callback(lambda _: self.concurrency.release())
+            raise
+
+    def reserve(self) -> float:
+        """
+        Reserves a token from the bucket for a request.
+
+        Returns:
+            float: The delay in seconds before the request can be sent.
+        """
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate_limit)
+            self.updated_at = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate_limit)
+
+    def get_retry_delay(self, response: HttpResponse | None, attempt: int) -> float | None:
+        """
+        Gets the delay before retrying a request, raising an error if it cannot be retried.
+
+        Args:
+            response (HttpResponse | None): The response, or None if the request timed out or
+                could not connect.
+            attempt (int): The number of retries already made.
+
+        Returns:
+            float | None: The delay in seconds before retrying, or None if the response is
+            successful.
+        """
+        if response is not None and response.status_code not in RETRYABLE_STATUS_CODES:
+            response.raise_for_status()
+            return None
+
+        if attempt >= self.max_retries:
+            response.raise_for_status()
+
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses the value of a Retry-After header.
+
+    Args:
+        value (str | None): The header value, as a number of seconds or an HTTP date.
+
+    Returns:
+        float | None: The delay in seconds, or None if there is no valid value.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
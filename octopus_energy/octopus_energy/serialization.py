@@ -0,0 +1,202 @@
+"""
+Serialization of Octopus Energy data to JSON.
+
+Each known type has a schema naming the fields to serialize, in order, so objects are encoded
+by reading those fields rather than by reflecting over every object.  Consumption series are
+encoded from their arrays, with their dates and times formatted together.  Other packages can
+register schemas for their own types with register_schema.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+import json
+from operator import attrgetter
+from typing import Any, Callable
+import numpy as np
+from .cache import MeterCacheSummary, SyncResult
+from .dates import format_timestamps
+from .model import (
+    Account,
+    Agreement,
+    ClientResponse,
+    Consumption,
+    ConsumptionSeries,
+    ConsumptionSummary,
+    ElectricityMeter,
+    ElectricityMeterPoint,
+    ElectricityMeterRegister,
+    GasMeter,
+    GasMeterPoint,
+    Link,
+    Meter,
+    MeterPoint,
+    Product,
+    Property
+)
+
+PRETTY_INDENT: int = 1
+COMPACT_SEPARATORS: tuple[str, str] = (',', ':')
+
+SCHEMAS: dict[type, tuple[tuple[str, ...], Callable[[Any], tuple]]] = {}
+
+def register_schema(value_type: type, fields: tuple[str, ...]) -> None:
+    """
+    Registers the fields to serialize for a type.
+
+    Args:
+        value_type (type): The type.
+        fields (tuple[str, ...]): The names of the fields to serialize, in order.
+    """
+    getter = attrgetter(*fields)
+    SCHEMAS[value_type] = (fields, getter if len(fields) > 1 else lambda value: (getter(value),))
+
+def to_serializable(value: Any) -> Any:
+    """
+    Converts an object that the json module cannot encode to one it can, without converting any
+    objects the result contains.
+
+    Args:
+        value (Any): The object to convert.
+
+    Returns:
+        Any: The converted object.
+    """
+    schema = SCHEMAS.get(type(value))
+    if schema is not None:
+        fields, getter = schema
+        return dict(zip(fields, getter(value)))
+
+    if isinstance(value, ConsumptionSeries):
+        return [{'consumption': consumption, 'interval_start': interval_start, 'interval_end': interval_end}
+                for consumption, interval_start, interval_end in zip(value.consumption.tolist(),
+                                                                     format_timestamps(value.interval_starts),
+                                                                     format_timestamps(value.interval_ends))]
+
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+
+    if isinstance(value, np.generic):
+        return value.item()
+
+    if isinstance(value, Enum):
+        return value.name
+
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+
+    if hasattr(value, '__dict__'):
+        return vars(value)
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def to_plain_value(value: Any) -> Any:
+    """
+    Converts an object and any objects it contains to dictionaries, lists and plain values,
+    such as for querying.
+
+    Args:
+        value (Any): The object to convert.
+
+    Returns:
+        Any: The converted object.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+
+    if isinstance(value, dict):
+        return {key: to_plain_value(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [to_plain_value(item) for item in value]
+
+    if isinstance(value, ConsumptionSeries):
+        return to_serializable(value)
+
+    return to_plain_value(to_serializable(value))
+
+def encode_json(value: Any, pretty: bool = False) -> str:
+    """
+    Encodes an object as JSON.
+
+    Args:
+        value (Any): The object to encode.
+        pretty (bool, optional): A value indicating whether to indent the JSON for reading.
+            Defaults to False, for compact JSON.
+
+    Returns:
+        str: The JSON string.
+    """
+    if pretty:
+        return json.dumps(value, default=to_serializable, indent=PRETTY_INDENT)
+
+    return json.dumps(value, default=to_serializable, separators=COMPACT_SEPARATORS)
+
+register_schema(ClientResponse, ('count', 'next', 'previous', 'results'))
+register_schema(Consumption, ('consumption', 'interval_start', 'interval_end'))
+register_schema(ConsumptionSummary, ('count',
+                                     'total',
+                                     'mean',
+                                     'median',
+                                     'p95',
+                                     'maximum',
+                                     'minimum',
+                                     'interval_start',
+                                     'interval_end'))
+register_schema(Link, ('href', 'method', 'rel'))
+register_schema(Product, ('code',
+                          'full_name',
+                          'display_name',
+                          'description',
+                          'is_variable',
+                          'is_green',
+                          'is_tracker',
+                          'is_prepay',
+                          'is_business',
+                          'is_restricted',
+                          'term',
+                          'available_from',
+                          'available_to',
+                          'links',
+                          'brand',
+                          'tariffs_active_at',
+                          'direction'))
+register_schema(Agreement, ('tariff_code', 'valid_from', 'valid_to'))
+register_schema(Meter, ('serial_number',))
+register_schema(ElectricityMeterRegister, ('identifier', 'rate', 'is_settlement_register'))
+register_schema(ElectricityMeter, ('serial_number', 'registers'))
+register_schema(GasMeter, ('serial_number',))
+register_schema(MeterPoint, ('consumption_standard', 'meters', 'agreements'))
+register_schema(ElectricityMeterPoint, ('consumption_standard',
+                                        'meters',
+                                        'agreements',
+                                        'mpan',
+                                        'profile_class',
+                                        'is_export'))
+register_schema(GasMeterPoint, ('consumption_standard', 'meters', 'agreements', 'mprn'))
+register_schema(Property, ('moved_in_at',
+                           'moved_out_at',
+                           'address_line_1',
+                           'address_line_2',
+                           'address_line_3',
+                           'town',
+                           'county',
+                           'postcode',
+                           'electricity_meter_points',
+                           'gas_meter_points'))
+register_schema(Account, ('number', 'properties'))
+register_schema(MeterCacheSummary, ('meter_mpan',
+                                    'meter_serial',
+                                    'slot_count',
+                                    'empty_slot_count',
+                                    'interval_start',
+                                    'interval_end',
+                                    'last_fetched_at'))
+register_schema(SyncResult, ('meter_mpan',
+                             'meter_serial',
+                             'new_slot_count',
+                             'updated_slot_count',
+                             'backfilled_slot_count',
+                             'high_water_mark'))
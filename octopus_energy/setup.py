@@ -10,6 +10,17 @@ setup(
     author='Benedict W. Hazel',
     description='Infrastructure and models for working with the Octopus Energy API and data.',
     install_requires=[
+        'httpx',
+        'numpy',
         'requests'
-    ]
+    ],
+    extras_require={
+        'export': [
+            'pyarrow'
+        ],
+        'fast': [
+            'msgspec',
+            'orjson'
+        ]
+    }
 )
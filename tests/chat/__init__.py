@@ -0,0 +1,11 @@
+"""
+Tests for the chat package.
+
+The chat package creates its Octopus Energy client and cache when imported, so the tests replay
+synthetic data with a temporary cache rather than calling the API.
+"""
+import os
+import tempfile
+
+os.environ.setdefault('OEC_OCTOPUS_ENERGY_CLIENT_TYPE', 'REPLAY')
+os.environ.setdefault('OEC_CACHE_DIRECTORY', tempfile.mkdtemp(prefix='octopus-energy-copilot-tests-'))
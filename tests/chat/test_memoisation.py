@@ -0,0 +1,141 @@
+"""
+Tests for the memoisation module.
+"""
+from datetime import datetime, timedelta
+import threading
+import unittest
+from octopus_energy.dates import to_timestamp
+from chat.tools.memoisation import CacheCounts, ToolResultCache
+
+NOW: datetime = datetime(2024, 7, 15, 12, 0)
+
+class Clock:
+    """
+    A clock that only moves when told to.
+    """
+    def __init__(self, now: datetime):
+        self.timestamp = float(to_timestamp(now))
+
+    def __call__(self) -> float:
+        return self.timestamp
+
+    def advance(self, duration: timedelta) -> None:
+        self.timestamp += duration.total_seconds()
+
+class ToolResultCacheTests(unittest.TestCase):
+    """
+    Tests for the ToolResultCache class.
+    """
+    def setUp(self):
+        self.clock = Clock(NOW)
+        self.cache = ToolResultCache(settled_ttl=timedelta(days=1),
+                                     recent_ttl=timedelta(minutes=5),
+                                     settlement_period=timedelta(days=2),
+                                     clock=self.clock)
+        self.calls = []
+
+        def get_total_consumption(from_date: str = None, to_date: str = None, period: str = 'half-hour') -> str:
+            self.calls.append((from_date, to_date, period))
+            return f'{len(self.calls)}'
+
+        self.get_total_consumption = self.cache.memoise(get_total_consumption)
+
+    def test_memoise_reuses_result_for_equivalent_arguments(self):
+        """
+        Tests that a memoised function reuses its result when called again with equivalent
+        arguments, whether dates are given with or without times and defaults given or left out.
+        """
+        first_result = self.get_total_consumption('2024-03-01', '2024-04-01')
+        second_result = self.get_total_consumption(from_date='2024-03-01T00:00:00',
+                                                   to_date='2024-04-01T00:00',
+                                                   period='half-hour')
+
+        self.assertEqual(first_result, second_result)
+        self.assertEqual(1, len(self.calls))
+        self.assertEqual((1, 1), (self.cache.hits, self.cache.misses))
+
+    def test_memoise_calls_function_for_different_arguments(self):
+        """
+        Tests that a memoised function is called again for different arguments.
+        """
+        self.get_total_consumption('2024-03-01', '2024-04-01')
+        self.get_total_consumption('2024-03-01', '2024-04-01', 'day')
+
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual((0, 2), (self.cache.hits, self.cache.misses))
+
+    def test_memoise_keeps_settled_results_longer_than_recent_results(self):
+        """
+        Tests that results for a settled period are kept for the settled TTL, while results for
+        a recent period or one with no end date expire after the recent TTL.
+        """
+        self.get_total_consumption('2024-03-01', '2024-04-01')
+        self.get_total_consumption('2024-07-14', '2024-07-15')
+        self.get_total_consumption('2024-07-01')
+
+        self.clock.advance(timedelta(minutes=10))
+        self.get_total_consumption('2024-03-01', '2024-04-01')
+        self.get_total_consumption('2024-07-14', '2024-07-15')
+        self.get_total_consumption('2024-07-01')
+
+        self.assertEqual(5, len(self.calls))
+        self.assertEqual(1, self.cache.hits)
+
+        self.clock.advance(timedelta(days=1))
+        self.get_total_consumption('2024-03-01', '2024-04-01')
+
+        self.assertEqual(6, len(self.calls))
+
+    def test_memoise_evicts_least_recently_used_results(self):
+        """
+        Tests that the cache drops the least recently used results beyond its maximum size.
+        """
+        self.cache.max_entries = 2
+        self.get_total_consumption('2024-01-01', '2024-02-01')
+        self.get_total_consumption('2024-02-01', '2024-03-01')
+        self.get_total_consumption('2024-01-01', '2024-02-01')
+        self.get_total_consumption('2024-03-01', '2024-04-01')
+
+        self.get_total_consumption('2024-01-01', '2024-02-01')
+        self.get_total_consumption('2024-02-01', '2024-03-01')
+
+        self.assertEqual(4, len(self.calls))
+
+    def test_counting_counts_only_calls_in_its_context(self):
+        """
+        Tests that the counting function counts the hits and misses of calls made in its
+        context, but not those made at the same time in other threads, which still count towards
+        the totals.
+        """
+        other_thread = threading.Thread(target=lambda: self.get_total_consumption('2024-01-01', '2024-02-01'))
+
+        with self.cache.counting(CacheCounts()) as counts:
+            self.get_total_consumption('2024-03-01', '2024-04-01')
+            other_thread.start()
+            other_thread.join()
+            self.get_total_consumption('2024-03-01', '2024-04-01')
+
+        self.get_total_consumption('2024-05-01', '2024-06-01')
+
+        self.assertEqual((1, 1), (counts.hits, counts.misses))
+        self.assertEqual((1, 3), (self.cache.hits, self.cache.misses))
+
+    def test_memoise_does_not_cache_errors(self):
+        """
+        Tests that a memoised function is called again after it raises an error.
+        """
+        calls = []
+
+        def get_account() -> str:
+            calls.append(None)
+            raise RuntimeError('The API is unavailable.')
+
+        memoised_get_account = self.cache.memoise(get_account)
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                memoised_get_account()
+
+        self.assertEqual(2, len(calls))
+
+if __name__ == '__main__':
+    unittest.main()
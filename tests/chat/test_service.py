@@ -0,0 +1,149 @@
+"""
+Tests for the service module.
+"""
+import threading
+import time
+import unittest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import tool
+from chat.service import ChatService
+from chat.tools import tools
+from chat.tools.memoisation import TOOL_RESULT_CACHE
+
+class ScriptedChatModel:
+    """
+    A chat model that calls the given tools and then replies.
+    """
+    def __init__(self, tool_calls: list[dict]):
+        self.tool_calls = tool_calls
+        self.invocations = 0
+
+    def bind_tools(self, _tools):
+        return self
+
+    def invoke(self, _messages):
+        self.invocations += 1
+        if self.invocations == 1:
+            return AIMessage('', tool_calls=self.tool_calls)
+        return AIMessage('Done.')
+
+@tool
+def wait(seconds: float) -> str:
+    """
+    Waits for a number of seconds.
+    """
+    time.sleep(seconds)
+    return f'Waited {seconds} seconds on {threading.current_thread().name}.'
+
+@tool
+def fail() -> str:
+    """
+    Fails.
+    """
+    raise RuntimeError('The API is unavailable.')
+
+@tool
+@TOOL_RESULT_CACHE.memoise
+def echo(text: str) -> str:
+    """
+    Echoes some text.
+    """
+    return text
+
+@tool
+def use_cache_elsewhere() -> str:
+    """
+    Uses the tool result cache from another thread, as another chat session would.
+    """
+    other_session = threading.Thread(target=lambda: TOOL_RESULT_CACHE.get(('other session',)))
+    other_session.start()
+    other_session.join()
+    return 'Done.'
+
+def create_tool_call(name: str, index: int, **args) -> dict:
+    """
+    Creates a tool call as made by a chat model.
+    """
+    return {'name': name, 'args': args, 'id': f'call-{index}', 'type': 'tool_call'}
+
+class ChatServiceTests(unittest.TestCase):
+    """
+    Tests for the ChatService class.
+    """
+    def create_chat_service(self, tool_calls: list[dict], tool_timeout: float = 5.0) -> ChatService:
+        """
+        Creates a chat service with a scripted chat model and the test tools.
+        """
+        chat_service = ChatService(ScriptedChatModel(tool_calls), tool_timeout=tool_timeout)
+        chat_service.tools = {'wait': wait, 'fail': fail, 'echo': echo, 'use_cache_elsewhere': use_cache_elsewhere}
+        return chat_service
+
+    def get_tool_messages(self, chat_service: ChatService) -> list[ToolMessage]:
+        """
+        Gets the tool messages in the chat history.
+        """
+        return [message for message in chat_service.chat_history if isinstance(message, ToolMessage)]
+
+    def test_post_message_runs_tools_concurrently_in_call_order(self):
+        """
+        Tests that the post_message function runs the tools called by the model concurrently,
+        adding their outputs to the chat history in the order they were called.
+        """
+        tool_calls = [create_tool_call('wait', index, seconds=seconds) for index, seconds in enumerate([0.3, 0.1, 0.2])]
+        chat_service = self.create_chat_service(tool_calls)
+
+        started_at = time.monotonic()
+        debug_messages = list(chat_service.post_message('How much did I use?'))
+        elapsed = time.monotonic() - started_at
+
+        tool_messages = self.get_tool_messages(chat_service)
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(['call-0', 'call-1', 'call-2'], [message.tool_call_id for message in tool_messages])
+        self.assertTrue(tool_messages[0].content.startswith('Waited 0.3 seconds'))
+        self.assertEqual(5, len(debug_messages))
+        self.assertTrue(debug_messages[-1].startswith('Tool Result Cache:'))
+        self.assertEqual('Done.', chat_service.chat_history[-1].content)
+
+    def test_post_message_reports_failed_and_timed_out_tools(self):
+        """
+        Tests that the post_message function gives an error message for a tool that fails or
+        times out, without stopping the other tools.
+        """
+        tool_calls = [create_tool_call('fail', 0),
+                      create_tool_call('wait', 1, seconds=1.0),
+                      create_tool_call('wait', 2, seconds=0.0),
+                      create_tool_call('missing', 3)]
+        chat_service = self.create_chat_service(tool_calls, tool_timeout=0.2)
+
+        list(chat_service.post_message('How much did I use?'))
+
+        tool_messages = self.get_tool_messages(chat_service)
+        self.assertEqual(['error', 'error', 'success', 'error'], [message.status for message in tool_messages])
+        self.assertIn('The API is unavailable.', tool_messages[0].content)
+        self.assertIn('did not finish within 0.2 seconds', tool_messages[1].content)
+        self.assertEqual('Done.', chat_service.chat_history[-1].content)
+
+    def test_post_message_reports_tool_result_cache_counts_for_the_turn(self):
+        """
+        Tests that the post_message function reports the hits and misses of the tool result cache
+        for the tools called in the turn, not those of other sessions at the same time, as well as
+        the totals.
+        """
+        TOOL_RESULT_CACHE.get(('earlier turn',))
+        hits, misses = TOOL_RESULT_CACHE.hits, TOOL_RESULT_CACHE.misses
+        chat_service = self.create_chat_service([create_tool_call('echo', 0, text='Hello.'),
+                                                 create_tool_call('use_cache_elsewhere', 1)])
+
+        debug_messages = list(chat_service.post_message('Say hello.'))
+
+        self.assertEqual(f'Tool Result Cache: 0 hits, 1 misses this turn ({hits} hits, {misses + 2} misses in total)',
+                         debug_messages[-1])
+
+    def test_tools_returns_same_dictionary(self):
+        """
+        Tests that the tools function builds the dictionary of tools once.
+        """
+        self.assertIs(tools(), tools())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Tests for the lazy module.
+"""
+import unittest
+import click
+from click.testing import CliRunner
+from cli.lazy import LazyGroup, load_command
+from cli.main import main
+
+@click.command()
+def lazy_command():
+    """
+    A command that is loaded lazily.
+    """
+    click.echo('lazy command run')
+
+class LazyTests(unittest.TestCase):
+    """
+    Tests for the lazy module.
+    """
+    def setUp(self):
+        self.group = LazyGroup(name='root',
+                               lazy_commands={'lazy': (f'{__name__}:lazy_command', 'A lazy command.')})
+
+    def test_load_command_imports_command(self):
+        """
+        Tests that the load_command function imports a command from its import path.
+        """
+        self.assertIs(load_command(f'{__name__}:lazy_command'), lazy_command)
+
+    def test_help_lists_lazy_commands_without_loading_them(self):
+        """
+        Tests that the help of a LazyGroup lists lazy commands with their short help without
+        loading them.
+        """
+        result = CliRunner().invoke(self.group, ['--help'])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('A lazy command.', result.output)
+        self.assertNotIn('lazy', self.group.commands)
+
+    def test_lazy_command_is_loaded_when_run(self):
+        """
+        Tests that a lazy command is loaded and run when it is invoked.
+        """
+        result = CliRunner().invoke(self.group, ['lazy'])
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output.strip(), 'lazy command run')
+        self.assertIs(self.group.commands['lazy'], lazy_command)
+
+    def test_main_help_does_not_load_commands(self):
+        """
+        Tests that the help of the CLI's root command lists every command without loading any.
+        """
+        result = CliRunner().invoke(main, ['--help'])
+
+        self.assertEqual(result.exit_code, 0)
+        for name in main.lazy_commands:
+            self.assertIn(name, result.output)
+        self.assertEqual(main.commands, {})
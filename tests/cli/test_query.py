@@ -0,0 +1,79 @@
+"""
+Tests for the query module.
+"""
+import unittest
+import jmespath
+from octopus_energy.dates import parse_timestamp
+from octopus_energy.model import ConsumptionSeries
+from octopus_energy.serialization import to_plain_value
+from cli.query import compile_query, search
+
+QUERIES: list[str] = [
+    '@',
+    '[*]',
+    '[*].consumption',
+    '[].interval_start',
+    '[*].interval_end',
+    '[?consumption > `0.3`]',
+    '[?`0.3` <= consumption]',
+    '[?consumption >= `0.25` && consumption < `1`].consumption',
+    '[?consumption == `0.5` || !(consumption > `0.2`)]',
+    '[?consumption > `0.3`].{start: interval_start, kwh: consumption}',
+    '[?consumption > `5`]',
+    'max_by(@, &consumption)',
+    'min_by(@, &consumption).interval_start',
+    'max_by([?consumption < `0.5`], &consumption)',
+    'max_by([?consumption > `5`], &consumption).consumption',
+    'sort_by(@, &consumption)',
+    'sort_by(@, &consumption)[-2:].consumption',
+    'sort_by(@, &consumption)[0]',
+    '[3]',
+    '[10]',
+    '[::-1].consumption',
+    '[*].consumption | max(@)',
+    'length(@)',
+    '[?interval_start > `"2024-07-01T00:30:00+01:00"`]',
+    '[].consumption[0]'
+]
+
+class QueryTests(unittest.TestCase):
+    """
+    Tests for the query module.
+    """
+    def setUp(self):
+        start = parse_timestamp('2024-07-01T00:00:00+01:00')
+        self.series = ConsumptionSeries([0.5, 0.25, 0.75, 0.25, 0.1],
+                                        [start + 1800 * index for index in range(5)],
+                                        [start + 1800 * (index + 1) for index in range(5)])
+
+    def test_search_on_consumption_series_matches_jmespath(self):
+        """
+        Tests that the search function returns the same result for a consumption series as
+        JMESPath does for the series as plain values, whether or not the query is pushed down.
+        """
+        for query in QUERIES:
+            with self.subTest(query=query):
+                expected_result = jmespath.search(query, to_plain_value(self.series))
+
+                actual_result = to_plain_value(search(query, self.series))
+
+                self.assertEqual(expected_result, actual_result)
+
+    def test_search_pushes_filter_down_to_consumption_series(self):
+        """
+        Tests that the search function returns a consumption series for a filter on consumption,
+        rather than converting the series to plain values.
+        """
+        result = search('[?consumption > `0.3`]', self.series)
+
+        self.assertIsInstance(result, ConsumptionSeries)
+        self.assertEqual([0.5, 0.75], result.consumption.tolist())
+
+    def test_compile_query_caches_compiled_queries(self):
+        """
+        Tests that the compile_query function returns the same compiled query for the same query.
+        """
+        self.assertIs(compile_query('[*].consumption'), compile_query('[*].consumption'))
+
+if __name__ == '__main__':
+    unittest.main()
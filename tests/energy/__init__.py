@@ -0,0 +1,10 @@
+"""
+Tests for the energy package.
+
+The unit registry caches pint's parsed definitions on disk, so the tests cache them in a
+temporary folder rather than the user's cache folder.
+"""
+import os
+import tempfile
+
+os.environ.setdefault('OEC_UNIT_REGISTRY_CACHE_FOLDER', tempfile.mkdtemp(prefix='octopus-energy-copilot-tests-'))
@@ -2,6 +2,7 @@
 Tests for the conversion module.
 """
 import unittest
+import numpy as np
 from pint import Quantity, set_application_registry
 from pint.errors import DimensionalityError
 from energy import UNIT_REGISTRY
@@ -10,7 +11,9 @@ from energy.conversion import (
     calculate_power_for_energy,
     co2_emission_factor,
     convert_to_co2,
-    convert_value
+    convert_to_co2_many,
+    convert_value,
+    convert_values
 )
 
 class ConversionTests(unittest.TestCase):
@@ -173,5 +176,66 @@ class ConversionTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             convert_to_co2(energy)
 
+    def test_convert_values_with_array_returns_converted_values(self):
+        """
+        Tests that the convert_values function returns the converted values when given an array.
+        """
+        converted_values: np.ndarray = convert_values(np.array([1000, 3600]), 'kJ', 'kWh')
+
+        np.testing.assert_allclose(converted_values, [1000 / 3600, 1])
+
+    def test_convert_values_with_quantity_returns_converted_values(self):
+        """
+        Tests that the convert_values function returns the converted values when given an array quantity.
+        """
+        set_application_registry(UNIT_REGISTRY)
+        values: Quantity = Quantity(np.array([1000, 3600]), 'kJ')
+
+        converted_values: np.ndarray = convert_values(values, None, 'kWh')
+
+        np.testing.assert_allclose(converted_values, [1000 / 3600, 1])
+
+    def test_convert_values_with_incompatible_units_raises_error(self):
+        """
+        Tests that the convert_values function raises an error when given incompatible units.
+        """
+        with self.assertRaises(DimensionalityError):
+            convert_values(np.array([1000]), 'kJ', 'kg')
+
+    def test_convert_to_co2_many_returns_converted_values(self):
+        """
+        Tests that the convert_to_co2_many function returns the same values as the convert_to_co2 function.
+        """
+        set_application_registry(UNIT_REGISTRY)
+        energy: np.ndarray = np.array([0.0, 0.5, 1000])
+
+        converted_co2: np.ndarray = convert_to_co2_many(energy)
+
+        expected_co2: list[float] = [convert_to_co2(Quantity(value, 'kWh')) for value in energy]
+        np.testing.assert_allclose(converted_co2, expected_co2)
+
+    def test_convert_to_co2_many_with_quantity_returns_converted_values(self):
+        """
+        Tests that the convert_to_co2_many function returns the converted values when given an array quantity.
+        """
+        set_application_registry(UNIT_REGISTRY)
+        energy: Quantity = Quantity(np.array([3600, 7200]), 'MJ')
+
+        converted_co2: np.ndarray = convert_to_co2_many(energy)
+
+        np.testing.assert_allclose(converted_co2, [207.07, 414.14])
+
+    def test_convert_to_co2_many_with_invalid_energy_unit_raises_error(self):
+        """
+        Tests that the convert_to_co2_many function raises an error when given an invalid energy unit.
+        """
+        set_application_registry(UNIT_REGISTRY)
+
+        with self.assertRaises(ValueError):
+            convert_to_co2_many(Quantity(np.array([1000]), 'kg'))
+
+        with self.assertRaises(ValueError):
+            convert_to_co2_many(np.array([1000]), 'kg')
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,144 @@
+"""
+Tests for the factors module.
+"""
+import unittest
+from pint import Quantity, set_application_registry
+from pint.errors import DimensionalityError
+from energy import UNIT_REGISTRY
+from energy.conversion import (
+    calculate_energy_for_power,
+    calculate_power_for_energy,
+    convert_to_co2,
+    convert_value
+)
+from energy.factors import (
+    UNIT_FACTORS,
+    calculate_energy_for_power_value,
+    calculate_power_for_energy_value,
+    convert_unit_value,
+    convert_value_to_co2
+)
+from energy.units import DURATION_UNIT_MAP, ENERGY_UNIT_MAP, POWER_UNIT_MAP
+
+class FactorsTests(unittest.TestCase):
+    """
+    Tests for the factors module.
+    """
+    def setUp(self):
+        set_application_registry(UNIT_REGISTRY)
+
+    def test_unit_factors_match_pint(self):
+        """
+        Tests that the factor of every known unit matches pint's definition of the unit.
+        """
+        for unit, unit_factor in UNIT_FACTORS.items():
+            with self.subTest(unit=unit):
+                quantity: Quantity = Quantity(1, unit_factor.symbol)
+
+                self.assertTrue(quantity.check(unit_factor.dimension))
+                self.assertAlmostEqual(unit_factor.factor,
+                                       quantity.to_base_units().magnitude,
+                                       delta=unit_factor.factor * 1e-12)
+
+    def test_unit_factors_cover_unit_maps(self):
+        """
+        Tests that there is a factor for every unit in the unit maps.
+        """
+        for unit_map in (DURATION_UNIT_MAP, ENERGY_UNIT_MAP, POWER_UNIT_MAP):
+            for unit, unit_quantity in unit_map.items():
+                with self.subTest(unit=unit):
+                    self.assertAlmostEqual(1.0,
+                                           convert_value(1 * unit_quantity, Quantity(1, UNIT_FACTORS[unit].symbol)))
+
+    def test_convert_unit_value_matches_convert_value(self):
+        """
+        Tests that the convert_unit_value function returns the same value as the convert_value function.
+        """
+        converted_value: float = convert_unit_value(1000, 'kJ', 'kWh')
+
+        expected_value: float = convert_value(Quantity(1000, 'kJ'), Quantity(1, 'kWh'))
+        self.assertAlmostEqual(expected_value, converted_value)
+
+    def test_convert_unit_value_with_incompatible_units_raises_error(self):
+        """
+        Tests that the convert_unit_value function raises an error when given incompatible units.
+        """
+        with self.assertRaises(DimensionalityError):
+            convert_unit_value(1000, 'kJ', 'kg')
+
+    def test_convert_unit_value_with_unknown_unit_raises_error(self):
+        """
+        Tests that the convert_unit_value function raises an error when given an unknown unit.
+        """
+        with self.assertRaises(ValueError):
+            convert_unit_value(1000, 'kJ', 'furlong')
+
+    def test_calculate_power_for_energy_value_matches_calculate_power_for_energy(self):
+        """
+        Tests that the calculate_power_for_energy_value function returns the same value as the
+        calculate_power_for_energy function.
+        """
+        power: float = calculate_power_for_energy_value(1000, 'kJ', 30, 'min', 'hp')
+
+        expected_power: float = calculate_power_for_energy(Quantity(1000, 'kJ'),
+                                                           Quantity(30, 'min'),
+                                                           Quantity(1, 'hp'))
+        self.assertAlmostEqual(expected_power, power)
+
+    def test_calculate_power_for_energy_value_with_invalid_values_raises_error(self):
+        """
+        Tests that the calculate_power_for_energy_value function raises an error when given an
+        invalid unit or duration.
+        """
+        for arguments in ((1000, 'kW', 1, 'h', 'kW'),
+                          (1000, 'kJ', 1, 'kg', 'kW'),
+                          (1000, 'kJ', 0, 'h', 'kW'),
+                          (1000, 'kJ', 1, 'h', 'kWh')):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(ValueError):
+                    calculate_power_for_energy_value(*arguments)
+
+    def test_calculate_energy_for_power_value_matches_calculate_energy_for_power(self):
+        """
+        Tests that the calculate_energy_for_power_value function returns the same value as the
+        calculate_energy_for_power function.
+        """
+        energy: float = calculate_energy_for_power_value(0.2778, 'kW', 1, 'h', 'kJ')
+
+        expected_energy: float = calculate_energy_for_power(Quantity(0.2778, 'kW'),
+                                                            Quantity(1, 'h'),
+                                                            Quantity(1, 'kJ'))
+        self.assertAlmostEqual(expected_energy, energy)
+
+    def test_calculate_energy_for_power_value_with_invalid_units_raises_error(self):
+        """
+        Tests that the calculate_energy_for_power_value function raises an error when given an
+        invalid unit.
+        """
+        for arguments in ((1, 'kJ', 1, 'h', 'kJ'),
+                          (1, 'kW', 1, 'kg', 'kJ'),
+                          (1, 'kW', 1, 'h', 'kW')):
+            with self.subTest(arguments=arguments):
+                with self.assertRaises(ValueError):
+                    calculate_energy_for_power_value(*arguments)
+
+    def test_convert_value_to_co2_matches_convert_to_co2(self):
+        """
+        Tests that the convert_value_to_co2 function returns the same value as the convert_to_co2 function.
+        """
+        for unit in ('kWh', 'MJ'):
+            with self.subTest(unit=unit):
+                converted_co2: float = convert_value_to_co2(1000, unit)
+
+                expected_co2: float = convert_to_co2(Quantity(1000, unit))
+                self.assertAlmostEqual(expected_co2, converted_co2)
+
+    def test_convert_value_to_co2_with_invalid_energy_unit_raises_error(self):
+        """
+        Tests that the convert_value_to_co2 function raises an error when given an invalid energy unit.
+        """
+        with self.assertRaises(ValueError):
+            convert_value_to_co2(1000, 'kg')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for the shared unit registry of the energy package.
+"""
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import energy
+
+class UnitRegistryTests(unittest.TestCase):
+    """
+    Tests for the UNIT_REGISTRY attribute.
+    """
+    def test_unit_registry_is_shared_across_imports(self):
+        """
+        Tests that the unit registry is created once and shared by every import of the package.
+        """
+        unit_registry = energy.UNIT_REGISTRY
+
+        self.assertIs(unit_registry, energy.UNIT_REGISTRY)
+        self.assertIs(unit_registry, importlib.import_module('energy').UNIT_REGISTRY)
+
+    def test_import_does_not_create_unit_registry(self):
+        """
+        Tests that importing the package does not create the unit registry or import pint, and
+        that the registry caches its definitions in the configured folder.
+        """
+        with tempfile.TemporaryDirectory() as cache_folder:
+            completed = subprocess.run(
+                [sys.executable, '-c',
+                 'import sys, energy; '
+                 'print("UNIT_REGISTRY" in vars(energy), "pint" in sys.modules); '
+                 'energy.UNIT_REGISTRY.kWh'],
+                capture_output=True,
+                check=True,
+                cwd=cache_folder,
+                env={**os.environ, 'OEC_UNIT_REGISTRY_CACHE_FOLDER': cache_folder},
+                text=True)
+
+            self.assertEqual('False False', completed.stdout.strip())
+            self.assertNotEqual([], os.listdir(cache_folder))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Tests for the cache module.
+"""
+import unittest
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from octopus_energy.cache import ConsumptionCache
+from octopus_energy.dates import HALF_HOUR_SECONDS, to_timestamp
+from octopus_energy.model import ConsumptionSeries
+
+MPAN = 'mpan'
+SERIAL = 'serial'
+START = to_timestamp(datetime(2024, 1, 1, tzinfo=timezone.utc))
+DAY_SECONDS = 48 * HALF_HOUR_SECONDS
+
+def create_consumption(from_timestamp: int, to_timestamp: int) -> ConsumptionSeries:
+    """
+    Creates half-hourly consumption data between two timestamps.
+    """
+    slots = np.arange(from_timestamp, to_timestamp, HALF_HOUR_SECONDS)
+    return ConsumptionSeries(np.ones(len(slots)), slots, slots + HALF_HOUR_SECONDS)
+
+class ConsumptionCacheTests(unittest.TestCase):
+    """
+    Tests for the ConsumptionCache class.
+    """
+    def setUp(self):
+        self.cache = ConsumptionCache(':memory:')
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_find_missing_ranges_with_empty_cache_returns_whole_range(self):
+        """
+        Tests that the find_missing_ranges function returns the whole range when nothing is cached.
+        """
+        missing_ranges = self.cache.find_missing_ranges(MPAN, SERIAL, START, START + DAY_SECONDS)
+
+        self.assertEqual([(START, START + DAY_SECONDS)], missing_ranges)
+
+    def test_find_missing_ranges_with_cached_range_returns_only_uncached_range(self):
+        """
+        Tests that the find_missing_ranges function excludes settled slots that are cached.
+        """
+        fetched_at = START + 10 * DAY_SECONDS
+        self.cache.store_consumption(MPAN, SERIAL, START, START + DAY_SECONDS,
+                                     create_consumption(START, START + DAY_SECONDS), fetched_at)
+
+        missing_ranges = self.cache.find_missing_ranges(MPAN, SERIAL, START, START + 3 * DAY_SECONDS,
+                                                        now=fetched_at)
+
+        self.assertEqual([(START + DAY_SECONDS, START + 3 * DAY_SECONDS)], missing_ranges)
+
+    def test_find_missing_ranges_with_unsettled_slots_returns_stale_slots(self):
+        """
+        Tests that the find_missing_ranges function returns unsettled slots after the refresh interval.
+        """
+        fetched_at = START + DAY_SECONDS
+        self.cache.store_consumption(MPAN, SERIAL, START, START + DAY_SECONDS,
+                                     create_consumption(START, START + DAY_SECONDS), fetched_at)
+        refresh_seconds = int(self.cache.refresh_interval.total_seconds())
+
+        fresh_ranges = self.cache.find_missing_ranges(MPAN, SERIAL, START, START + DAY_SECONDS,
+                                                      now=fetched_at + refresh_seconds - 1)
+        stale_ranges = self.cache.find_missing_ranges(MPAN, SERIAL, START, START + DAY_SECONDS,
+                                                      now=fetched_at + refresh_seconds)
+
+        self.assertEqual([], fresh_ranges)
+        self.assertEqual([(START, START + DAY_SECONDS)], stale_ranges)
+
+    def test_store_consumption_records_empty_slots_as_cached(self):
+        """
+        Tests that slots without data in a fetched range are not reported as missing again.
+        """
+        fetched_at = START + 10 * DAY_SECONDS
+        self.cache.store_consumption(MPAN, SERIAL, START, START + DAY_SECONDS,
+                                     create_consumption(START, START + HALF_HOUR_SECONDS), fetched_at)
+
+        missing_ranges = self.cache.find_missing_ranges(MPAN, SERIAL, START, START + DAY_SECONDS,
+                                                        now=fetched_at)
+        consumption = self.cache.get_consumption(MPAN, SERIAL, START, START + DAY_SECONDS)
+
+        self.assertEqual([], missing_ranges)
+        self.assertEqual(1, len(consumption))
+
+    def test_purge_with_meter_removes_only_meter_data(self):
+        """
+        Tests that the purge function removes the cached data for the given meter only.
+        """
+        consumption = create_consumption(START, START + DAY_SECONDS)
+        self.cache.store_consumption(MPAN, SERIAL, START, START + DAY_SECONDS, consumption)
+        self.cache.store_consumption('other', SERIAL, START, START + DAY_SECONDS, consumption)
+
+        removed_slot_count = self.cache.purge(meter_mpan=MPAN)
+
+        self.assertEqual(48, removed_slot_count)
+        self.assertEqual(['other'], [summary.meter_mpan for summary in self.cache.get_summaries()])
+
+if __name__ == '__main__':
+    unittest.main()
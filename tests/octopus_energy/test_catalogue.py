@@ -0,0 +1,91 @@
+"""
+Tests for the catalogue module.
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from octopus_energy.catalogue import ProductCatalogue
+from octopus_energy.model import Product, ProductFiltering
+
+FETCHED_AT = 1727737200
+
+def create_product(code: str,
+                   is_variable: bool = False,
+                   is_green: bool = False,
+                   is_tracker: bool = False,
+                   available_from: str = '2024-01-01T00:00:00Z',
+                   available_to: str = None
+    ) -> Product:
+    """
+    Creates a product with the given flags and availability.
+    """
+    return Product(code, code, code, code, is_variable, is_green, is_tracker, False, False, False, 12,
+                   available_from, available_to, [], 'OCTOPUS_ENERGY')
+
+PRODUCTS = [
+    create_product('VAR', is_variable=True),
+    create_product('VAR-GREEN', is_variable=True, is_green=True),
+    create_product('TRACKER', is_variable=True, is_tracker=True, available_to='2024-12-01T00:00:00Z'),
+    create_product('FIXED', available_from='2024-11-01T00:00:00Z')
+]
+
+class ProductCatalogueTests(unittest.TestCase):
+    """
+    Tests for the ProductCatalogue class.
+    """
+    def setUp(self):
+        self.catalogue = ProductCatalogue()
+        self.catalogue.update(PRODUCTS, FETCHED_AT)
+
+    def test_find_products_intersects_filtering_flags(self):
+        """
+        Tests that the find_products function returns products with every requested flag set.
+        """
+        at = datetime(2024, 11, 15, tzinfo=timezone.utc)
+        cases = {
+            ProductFiltering.DEFAULT: ['VAR', 'VAR-GREEN', 'TRACKER', 'FIXED'],
+            ProductFiltering.VARIABLE: ['VAR', 'VAR-GREEN', 'TRACKER'],
+            ProductFiltering.VARIABLE | ProductFiltering.GREEN: ['VAR-GREEN'],
+            ProductFiltering.GREEN | ProductFiltering.TRACKER: []
+        }
+
+        for filtering, codes in cases.items():
+            with self.subTest(filtering=filtering):
+                self.assertEqual(codes, [product.code for product in self.catalogue.find_products(at, filtering)])
+
+    def test_find_products_filters_by_availability_date(self):
+        """
+        Tests that the find_products function returns only products available on the date.
+        """
+        products = self.catalogue.find_products(datetime(2024, 12, 15, tzinfo=timezone.utc))
+
+        self.assertEqual(['VAR', 'VAR-GREEN', 'FIXED'], [product.code for product in products])
+
+    def test_is_fresh_expires_after_ttl(self):
+        """
+        Tests that the is_fresh function reports the catalogue as stale once its TTL has passed.
+        """
+        ttl_seconds = int(self.catalogue.ttl.total_seconds())
+
+        self.assertTrue(self.catalogue.is_fresh(FETCHED_AT + ttl_seconds - 1))
+        self.assertFalse(self.catalogue.is_fresh(FETCHED_AT + ttl_seconds))
+        self.assertFalse(ProductCatalogue().is_fresh())
+
+    def test_update_with_path_persists_catalogue(self):
+        """
+        Tests that a catalogue with a path is loaded from disk by a new instance.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'products.json')
+            ProductCatalogue(path).update(PRODUCTS, FETCHED_AT)
+
+            catalogue = ProductCatalogue(path, timedelta(hours=1))
+
+            self.assertEqual(FETCHED_AT, catalogue.fetched_at)
+            self.assertEqual(['VAR-GREEN'],
+                             [product.code for product in catalogue.find_products(
+                                 datetime(2024, 11, 15, tzinfo=timezone.utc), ProductFiltering.GREEN)])
+
+if __name__ == '__main__':
+    unittest.main()
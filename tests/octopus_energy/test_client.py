@@ -0,0 +1,200 @@
+"""
+Tests for the client module.
+"""
+import json
+import unittest
+from urllib.parse import parse_qs, urlparse
+import httpx
+from octopus_energy.client import BASE_URI, AsyncOctopusEnergyClient, OctopusEnergyClient
+from octopus_energy.dates import HALF_HOUR_SECONDS, format_timestamp
+from octopus_energy.model import ConsumptionSeries
+
+START = 1704067200
+
+class FakeResponse:
+    """
+    A fake HTTP response with a JSON body.
+    """
+    def __init__(self, data: dict):
+        self.status_code = 200
+        self.headers = {}
+        self.text = json.dumps(data)
+        self.content = self.text.encode()
+
+    def raise_for_status(self):
+        """
+        Does nothing, as the response is always successful.
+        """
+
+class FakeConsumptionSession:
+    """
+    A fake HTTP session serving pages of consumption data.
+    """
+    def __init__(self, entry_count: int, page_size: int):
+        self.entry_count = entry_count
+        self.page_size = page_size
+        self.requested_pages = []
+        self.is_closed = False
+
+    def get(self, url: str, auth, timeout) -> FakeResponse:
+        """
+        Serves the requested page of consumption data.
+        """
+        return FakeResponse(self.get_page_data(url))
+
+    def close(self) -> None:
+        """
+        Records that the session was closed.
+        """
+        self.is_closed = True
+
+    def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serves the requested page of consumption data to an asynchronous HTTP client.
+        """
+        return httpx.Response(200, json=self.get_page_data(str(request.url)))
+
+    def get_page_data(self, url: str) -> dict:
+        """
+        Gets the data for the requested page of consumption data.
+        """
+        page = int(parse_qs(urlparse(url).query)['page'][0])
+        self.requested_pages.append(page)
+        start = (page - 1) * self.page_size
+        end = min(start + self.page_size, self.entry_count)
+        return {
+            'count': self.entry_count,
+            'next': f'{url}&next' if end < self.entry_count else None,
+            'previous': None,
+            'results': [
+                {
+                    'consumption': float(index),
+                    'interval_start': format_timestamp(START + index * HALF_HOUR_SECONDS),
+                    'interval_end': format_timestamp(START + (index + 1) * HALF_HOUR_SECONDS)
+                }
+                for index in range(start, end)
+            ]
+        }
+
+class OctopusEnergyClientTests(unittest.TestCase):
+    """
+    Tests for the OctopusEnergyClient class.
+    """
+    def test_get_consumption_with_multiple_workers_returns_all_pages_in_order(self):
+        """
+        Tests that the get_consumption function merges concurrently fetched pages in page order.
+        """
+        session = FakeConsumptionSession(entry_count=950, page_size=100)
+        client = OctopusEnergyClient('key', meter_mpan='mpan', meter_serial='serial',
+                                     session=session, max_workers=4)
+
+        consumption: ConsumptionSeries = client.get_consumption()
+
+        self.assertEqual(list(range(950)), [c.consumption for c in consumption])
+        self.assertEqual(list(range(1, 11)), sorted(session.requested_pages))
+
+    def test_get_consumption_with_single_worker_follows_next_pages(self):
+        """
+        Tests that the get_consumption function fetches pages one at a time with a single worker.
+        """
+        session = FakeConsumptionSession(entry_count=250, page_size=100)
+        client = OctopusEnergyClient('key', meter_mpan='mpan', meter_serial='serial',
+                                     session=session, max_workers=1)
+
+        consumption: ConsumptionSeries = client.get_consumption()
+
+        self.assertEqual(list(range(250)), [c.consumption for c in consumption])
+        self.assertEqual([1, 2, 3], session.requested_pages)
+
+    def test_get_consumption_with_single_page_requests_only_first_page(self):
+        """
+        Tests that the get_consumption function requests no further pages when there is only one.
+        """
+        session = FakeConsumptionSession(entry_count=20, page_size=100)
+        client = OctopusEnergyClient('key', meter_mpan='mpan', meter_serial='serial',
+                                     session=session)
+
+        consumption: ConsumptionSeries = client.get_consumption()
+
+        self.assertEqual(20, len(consumption))
+        self.assertEqual([1], session.requested_pages)
+
+    def test_iter_consumption_yields_each_page_before_fetching_far_ahead(self):
+        """
+        Tests that the iter_consumption function yields pages in order without fetching more
+        pages ahead than there are workers.
+        """
+        session = FakeConsumptionSession(entry_count=950, page_size=100)
+        client = OctopusEnergyClient('key', meter_mpan='mpan', meter_serial='serial',
+                                     session=session, max_workers=2)
+
+        chunks = client.iter_consumption()
+        first_chunk: ConsumptionSeries = next(chunks)
+        second_chunk: ConsumptionSeries = next(chunks)
+
+        self.assertEqual(list(range(100)), first_chunk.consumption.tolist())
+        self.assertEqual(list(range(100, 200)), second_chunk.consumption.tolist())
+        self.assertLessEqual(len(session.requested_pages), 4)
+        self.assertEqual(8, len(list(chunks)))
+
+    def test_close_does_not_close_external_session(self):
+        """
+        Tests that closing the client leaves a session it does not own open.
+        """
+        session = FakeConsumptionSession(entry_count=0, page_size=100)
+        with OctopusEnergyClient('key', session=session) as client:
+            self.assertFalse(client.owns_session)
+
+        self.assertFalse(session.is_closed)
+
+    def test_get_consumption_sends_every_page_through_injected_session(self):
+        """
+        Tests that the get_consumption function requests every page through the session the
+        client was given.
+        """
+        session = FakeConsumptionSession(entry_count=250, page_size=100)
+        with OctopusEnergyClient('key', meter_mpan='mpan', meter_serial='serial',
+                                 session=session, max_workers=1) as client:
+            consumption: ConsumptionSeries = client.get_consumption()
+
+            self.assertIs(session, client.session)
+
+        self.assertEqual(250, len(consumption))
+        self.assertEqual([1, 2, 3], session.requested_pages)
+
+    def test_close_closes_owned_session_and_its_pooled_connections(self):
+        """
+        Tests that closing the client closes the pooled session it created, releasing its
+        connections.
+        """
+        client = OctopusEnergyClient('key', pool_size=2)
+        pool_manager = client.session.get_adapter(BASE_URI).poolmanager
+        pool_manager.connection_from_url(BASE_URI)
+
+        client.close()
+
+        self.assertTrue(client.owns_session)
+        self.assertEqual(2, pool_manager.connection_pool_kw['maxsize'])
+        self.assertEqual(0, len(pool_manager.pools))
+
+class AsyncOctopusEnergyClientTests(unittest.IsolatedAsyncioTestCase):
+    """
+    Tests for the AsyncOctopusEnergyClient class.
+    """
+    async def test_get_consumption_returns_all_pages_in_order(self):
+        """
+        Tests that the get_consumption function merges concurrently fetched pages in page order.
+        """
+        session = FakeConsumptionSession(entry_count=950, page_size=100)
+        transport = httpx.MockTransport(session.handle_async_request)
+        async with httpx.AsyncClient(transport=transport) as http_client:
+            client = AsyncOctopusEnergyClient('key', meter_mpan='mpan', meter_serial='serial',
+                                              http_client=http_client, max_workers=3)
+
+            consumption: ConsumptionSeries = await client.get_consumption()
+
+        self.assertEqual(list(range(950)), [c.consumption for c in consumption])
+        self.assertEqual(list(range(1, 11)), sorted(session.requested_pages))
+
+if __name__ == '__main__':
+    unittest.main()
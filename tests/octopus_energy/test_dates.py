@@ -0,0 +1,56 @@
+"""
+Tests for the dates module.
+"""
+import unittest
+import numpy as np
+from octopus_energy.dates import (
+    HALF_HOUR_SECONDS,
+    format_timestamp,
+    format_timestamps,
+    parse_timestamp,
+    parse_timestamps
+)
+
+class ParseTimestampsTests(unittest.TestCase):
+    """
+    Tests for the parse_timestamps function.
+    """
+    def test_parse_timestamps_with_utc_offsets_matches_parse_timestamp(self):
+        """
+        Tests that the parse_timestamps function parses each form of UTC offset returned by the API.
+        """
+        values = ['2024-03-31T00:30:00Z', '2024-03-31T02:00:00+01:00', '2024-03-31T00:00:00-05:30']
+
+        self.assertEqual([parse_timestamp(value) for value in values], parse_timestamps(values).tolist())
+
+    def test_parse_timestamps_with_other_forms_falls_back_to_parse_timestamp(self):
+        """
+        Tests that the parse_timestamps function parses dates and times with fractional seconds
+        or without a UTC offset.
+        """
+        values = ['2024-07-01T00:00:00.500+01:00', '2024-07-01T00:30:00']
+
+        self.assertEqual([parse_timestamp(value) for value in values], parse_timestamps(values).tolist())
+
+class FormatTimestampsTests(unittest.TestCase):
+    """
+    Tests for the format_timestamps function.
+    """
+    def test_format_timestamps_across_clock_changes_matches_format_timestamp(self):
+        """
+        Tests that the format_timestamps function formats each timestamp as the format_timestamp
+        function does, including on the days the clocks change.
+        """
+        timestamps = np.concatenate([
+            np.arange(parse_timestamp('2024-03-30T22:00:00Z'), parse_timestamp('2024-04-01T02:00:00Z'), HALF_HOUR_SECONDS),
+            np.arange(parse_timestamp('2024-10-26T22:00:00Z'), parse_timestamp('2024-10-28T02:00:00Z'), HALF_HOUR_SECONDS)
+        ])
+
+        self.assertEqual([format_timestamp(timestamp) for timestamp in timestamps.tolist()],
+                         format_timestamps(timestamps))
+
+    def test_format_timestamps_with_no_timestamps_returns_empty_list(self):
+        """
+        Tests that the format_timestamps function returns an empty list when given no timestamps.
+        """
+        self.assertEqual([], format_timestamps(np.array([], dtype=np.int64)))
@@ -0,0 +1,113 @@
+"""
+Tests for the decoding module.
+"""
+import json
+import unittest
+from octopus_energy.decoding import (
+    JsonPageDecoder,
+    MsgspecPageDecoder,
+    OrjsonPageDecoder,
+    create_decoder
+)
+from octopus_energy.model import ConsumptionSeries, Product
+
+CONSUMPTION_PAGE = json.dumps({
+    'count': 2,
+    'next': 'https://api.octopus.energy/v1/next',
+    'previous': None,
+    'results': [
+        {
+            'consumption': 0.25,
+            'interval_start': '2024-04-01T00:00:00+01:00',
+            'interval_end': '2024-04-01T00:30:00+01:00'
+        },
+        {
+            'consumption': 0.5,
+            'interval_start': '2024-01-01T00:00:00Z',
+            'interval_end': '2024-01-01T00:30:00Z'
+        }
+    ]
+}).encode()
+
+PRODUCTS_PAGE = json.dumps({
+    'count': 1,
+    'next': None,
+    'previous': None,
+    'results': [
+        {
+            'code': 'AGILE-24-10-01',
+            'direction': 'IMPORT',
+            'full_name': 'Agile Octopus October 2024 v1',
+            'display_name': 'Agile Octopus',
+            'description': 'With Agile Octopus, you get access to half-hourly energy prices.',
+            'is_variable': True,
+            'is_green': True,
+            'is_tracker': False,
+            'is_prepay': False,
+            'is_business': False,
+            'is_restricted': False,
+            'term': 12,
+            'available_from': '2024-10-01T00:00:00+01:00',
+            'available_to': None,
+            'links': [
+                {
+                    'href': 'https://api.octopus.energy/v1/products/AGILE-24-10-01/',
+                    'method': 'GET',
+                    'rel': 'self'
+                }
+            ],
+            'brand': 'OCTOPUS_ENERGY'
+        }
+    ]
+}).encode()
+
+class PageDecoderTests(unittest.TestCase):
+    """
+    Tests for the page decoders.
+    """
+    def setUp(self):
+        self.decoders = [JsonPageDecoder(), OrjsonPageDecoder(), MsgspecPageDecoder()]
+
+    def test_decode_consumption_page_returns_series(self):
+        """
+        Tests that every decoder decodes a page of consumption data to the same series.
+        """
+        for decoder in self.decoders:
+            with self.subTest(decoder=type(decoder).__name__):
+                page = decoder.decode_consumption_page(CONSUMPTION_PAGE)
+
+                self.assertIsInstance(page.results, ConsumptionSeries)
+                self.assertEqual(2, page.count)
+                self.assertEqual('https://api.octopus.energy/v1/next', page.next)
+                self.assertIsNone(page.previous)
+                self.assertEqual([0.25, 0.5], page.results.consumption.tolist())
+                self.assertEqual([1711926000, 1704067200], page.results.interval_starts.tolist())
+                self.assertEqual([1711927800, 1704069000], page.results.interval_ends.tolist())
+
+    def test_decode_products_page_returns_products(self):
+        """
+        Tests that every decoder decodes a page of product data to the same products.
+        """
+        for decoder in self.decoders:
+            with self.subTest(decoder=type(decoder).__name__):
+                page = decoder.decode_products_page(PRODUCTS_PAGE)
+
+                self.assertEqual(1, len(page.results))
+                self.assertIsInstance(page.results[0], Product)
+                self.assertEqual('AGILE-24-10-01', page.results[0].code)
+                self.assertEqual('IMPORT', page.results[0].direction)
+                self.assertEqual(12, page.results[0].term)
+                self.assertEqual('self', page.results[0].links[0]['rel'])
+
+    def test_create_decoder_without_type_prefers_msgspec(self):
+        """
+        Tests that the create_decoder function uses msgspec when it is installed.
+        """
+        self.assertIsInstance(create_decoder(), MsgspecPageDecoder)
+
+    def test_create_decoder_with_unsupported_type_raises_error(self):
+        """
+        Tests that the create_decoder function raises an error for an unsupported decoder type.
+        """
+        with self.assertRaises(ValueError):
+            create_decoder('yaml')
@@ -0,0 +1,134 @@
+"""
+Tests for the export module.
+"""
+import csv
+import io
+import json
+import unittest
+from octopus_energy.dates import parse_timestamp
+from octopus_energy.export import EXPORT_FORMATS, create_table_writer
+from octopus_energy.model import ConsumptionSeries
+from octopus_energy.serialization import encode_json, to_plain_value
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+class ExportTests(unittest.TestCase):
+    """
+    Tests for the export module.
+    """
+    def setUp(self):
+        # Spans the end of British Summer Time, so the UTC offset changes within the series.
+        start = parse_timestamp('2024-10-27T00:30:00+01:00')
+        self.series = ConsumptionSeries([0.5, 0.25, 0.125],
+                                        [start + 1800 * index for index in range(3)],
+                                        [start + 1800 * (index + 1) for index in range(3)])
+        self.labels = {'meter_mpan': '1234567890', 'meter_serial': '21L4567890'}
+
+    def write_consumption(self, export_format: str, chunks: list[ConsumptionSeries]) -> bytes:
+        """
+        Writes chunks of consumption data with the labels in a format.
+        """
+        file = io.BytesIO()
+        with create_table_writer(export_format, file) as writer:
+            for chunk in chunks:
+                writer.write_consumption(chunk, self.labels)
+        return file.getvalue()
+
+    def test_csv_table_writer_writes_header_once_and_row_per_interval(self):
+        """
+        Tests that the CSV writer writes a single header row and a row for each interval of each
+        chunk, with the dates and times formatted as in JSON output.
+        """
+        content = self.write_consumption('csv', [self.series[:2], self.series[2:]])
+
+        rows = list(csv.reader(io.StringIO(content.decode('utf-8'))))
+        self.assertEqual(['meter_mpan', 'meter_serial', 'consumption', 'interval_start', 'interval_end'], rows[0])
+        self.assertEqual([['1234567890', '21L4567890', str(entry['consumption']), entry['interval_start'], entry['interval_end']]
+                          for entry in to_plain_value(self.series)],
+                         rows[1:])
+
+    def test_ndjson_table_writer_matches_json_encoding(self):
+        """
+        Tests that the NDJSON writer writes each interval as the JSON object it is encoded as,
+        with the labels first.
+        """
+        content = self.write_consumption('ndjson', [self.series[:1], self.series[1:]])
+
+        expected_lines = [encode_json({**self.labels, **entry}) for entry in to_plain_value(self.series)]
+        self.assertEqual(expected_lines, content.decode('utf-8').splitlines())
+
+    def test_ndjson_table_writer_writes_records(self):
+        """
+        Tests that the NDJSON writer writes a line for each record.
+        """
+        records = [{'code': 'AGILE', 'links': [{'rel': 'self'}]}, {'code': 'GO', 'links': []}]
+        file = io.BytesIO()
+
+        with create_table_writer('ndjson', file) as writer:
+            writer.write_records(records)
+
+        self.assertEqual(records, [json.loads(line) for line in file.getvalue().decode('utf-8').splitlines()])
+
+    def test_csv_table_writer_writes_nested_record_values_as_json(self):
+        """
+        Tests that the CSV writer writes lists and dictionaries in records as JSON.
+        """
+        file = io.BytesIO()
+
+        with create_table_writer('csv', file) as writer:
+            writer.write_records([{'code': 'AGILE', 'links': [{'rel': 'self'}], 'term': None}])
+
+        self.assertEqual('code,links,term\nAGILE,"[{""rel"":""self""}]",\n', file.getvalue().decode('utf-8'))
+
+    def test_table_writer_leaves_file_open(self):
+        """
+        Tests that closing a writer does not close the file it writes to.
+        """
+        for export_format in ('csv', 'ndjson'):
+            with self.subTest(export_format=export_format):
+                file = io.BytesIO()
+
+                create_table_writer(export_format, file).close()
+
+                self.assertFalse(file.closed)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_and_parquet_table_writers_write_typed_columns(self):
+        """
+        Tests that the Arrow and Parquet writers write every chunk, with consumption as floats and
+        interval starts and ends as timestamps.
+        """
+        read_table = {
+            'arrow': lambda content: pyarrow.ipc.open_file(pyarrow.BufferReader(content)).read_all(),
+            'parquet': lambda content: pyarrow.parquet.read_table(pyarrow.BufferReader(content))
+        }
+        for export_format, read in read_table.items():
+            with self.subTest(export_format=export_format):
+                table = read(self.write_consumption(export_format, [self.series[:2], self.series[2:]]))
+
+                self.assertEqual(['1234567890'] * 3, table.column('meter_mpan').to_pylist())
+                self.assertEqual(self.series.consumption.tolist(), table.column('consumption').to_pylist())
+                self.assertEqual(self.series.interval_starts.tolist(),
+                                 [int(value.timestamp()) for value in table.column('interval_start').to_pylist()])
+                self.assertTrue(pyarrow.types.is_timestamp(table.schema.field('interval_end').type))
+
+    def test_create_table_writer_supports_every_export_format(self):
+        """
+        Tests that the create_table_writer function creates a writer for every export format and
+        raises an error for an unsupported format.
+        """
+        for export_format in EXPORT_FORMATS:
+            if export_format in ('parquet', 'arrow') and pyarrow is None:
+                continue
+            with self.subTest(export_format=export_format):
+                create_table_writer(export_format, io.BytesIO()).close()
+
+        with self.assertRaises(ValueError):
+            create_table_writer('xml', io.BytesIO())
+
+if __name__ == '__main__':
+    unittest.main()
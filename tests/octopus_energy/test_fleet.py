@@ -0,0 +1,142 @@
+"""
+Tests for the fleet module.
+"""
+import json
+import os
+import tempfile
+import unittest
+from urllib.parse import urlparse
+from octopus_energy.dates import HALF_HOUR_SECONDS, format_timestamp
+from octopus_energy.fleet import Meter, OctopusEnergyFleet, load_meters
+
+START = 1704067200
+
+class FakeResponse:
+    """
+    A fake HTTP response with a JSON body.
+    """
+    def __init__(self, status_code: int, data: dict = None):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = json.dumps(data).encode()
+
+    def raise_for_status(self):
+        """
+        Raises an error if the response has an error status.
+        """
+        if self.status_code >= 400:
+            raise RuntimeError(f'HTTP {self.status_code}')
+
+class FakeFleetSession:
+    """
+    A fake HTTP session serving a page of consumption data for each meter, with the meter's
+    position in its MPAN as the consumption.
+    """
+    def __init__(self):
+        self.requested_keys = []
+
+    def get(self, url: str, auth, timeout) -> FakeResponse:
+        """
+        Serves the consumption data for the meter in the URL, or a 404 for an unknown meter.
+        """
+        self.requested_keys.append(auth[0])
+        meter_mpan = urlparse(url).path.split('/')[3]
+        if not meter_mpan.startswith('mpan-'):
+            return FakeResponse(404)
+
+        consumption = float(meter_mpan.removeprefix('mpan-'))
+        return FakeResponse(200, {
+            'count': 2,
+            'next': None,
+            'previous': None,
+            'results': [
+                {
+                    'consumption': consumption,
+                    'interval_start': format_timestamp(START + index * HALF_HOUR_SECONDS),
+                    'interval_end': format_timestamp(START + (index + 1) * HALF_HOUR_SECONDS)
+                }
+                for index in range(2)
+            ]
+        })
+
+class OctopusEnergyFleetTests(unittest.TestCase):
+    """
+    Tests for the OctopusEnergyFleet class.
+    """
+    def setUp(self):
+        self.session = FakeFleetSession()
+        self.fleet = OctopusEnergyFleet(max_workers=4, session=self.session)
+        self.meters = [Meter(f'key-{index % 2}', 'account', f'mpan-{index}', 'serial') for index in range(6)]
+
+    def test_get_consumption_returns_results_in_meter_order(self):
+        """
+        Tests that the get_consumption function returns each meter's consumption in meter order.
+        """
+        results = self.fleet.get_consumption(self.meters)
+
+        self.assertEqual([float(index) for index in range(6)],
+                         [result.consumption[0].consumption for result in results])
+        self.assertEqual(6, len(self.session.requested_keys))
+
+    def test_get_consumption_with_failing_meter_records_error(self):
+        """
+        Tests that the get_consumption function records an error for a meter without stopping
+        the others.
+        """
+        results = self.fleet.get_consumption([Meter('key', 'account', 'unknown', 'serial'), self.meters[1]])
+
+        self.assertIsNone(results[0].consumption)
+        self.assertIsNotNone(results[0].error)
+        self.assertEqual(2, len(results[1].consumption))
+
+    def test_get_consumption_table_combines_meters_into_columns(self):
+        """
+        Tests that the get_consumption_table function combines every meter's consumption into
+        one row per interval per meter.
+        """
+        table = self.fleet.get_consumption_table(self.meters[:3])
+
+        self.assertEqual(6, len(table))
+        self.assertEqual(['mpan-0', 'mpan-0', 'mpan-1', 'mpan-1', 'mpan-2', 'mpan-2'], table.meter_mpans.tolist())
+        self.assertEqual([0.0, 0.0, 1.0, 1.0, 2.0, 2.0], table.consumption.tolist())
+
+    def test_get_scheduler_shares_scheduler_per_api_key(self):
+        """
+        Tests that the get_scheduler function gives each API key its own shared scheduler.
+        """
+        self.assertIs(self.fleet.get_scheduler('key-0'), self.fleet.get_scheduler('key-0'))
+        self.assertIsNot(self.fleet.get_scheduler('key-0'), self.fleet.get_scheduler('key-1'))
+
+class LoadMetersTests(unittest.TestCase):
+    """
+    Tests for the load_meters function.
+    """
+    def test_load_meters_reads_csv_file(self):
+        """
+        Tests that the load_meters function reads a meter from each row of a CSV file.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'meters.csv')
+            with open(path, 'w', encoding='utf-8') as meters_file:
+                meters_file.write('api_key,account_number,meter_mpan,meter_serial\nkey,account,mpan,serial\n')
+
+            meters = load_meters(path)
+
+        self.assertEqual(1, len(meters))
+        self.assertEqual(('key', 'account', 'mpan', 'serial'),
+                         (meters[0].api_key, meters[0].account_number, meters[0].meter_mpan, meters[0].meter_serial))
+
+    def test_load_meters_with_missing_columns_raises_error(self):
+        """
+        Tests that the load_meters function raises an error for a CSV file missing a column.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'meters.csv')
+            with open(path, 'w', encoding='utf-8') as meters_file:
+                meters_file.write('api_key,meter_mpan\nkey,mpan\n')
+
+            with self.assertRaises(ValueError):
+                load_meters(path)
+
+if __name__ == '__main__':
+    unittest.main()
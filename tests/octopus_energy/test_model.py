@@ -0,0 +1,77 @@
+"""
+Tests for the model module.
+"""
+import unittest
+from datetime import datetime, timezone
+from octopus_energy.dates import HALF_HOUR_SECONDS
+from octopus_energy.model import Consumption, ConsumptionSeries
+
+START = 1704067200
+
+class ConsumptionSeriesTests(unittest.TestCase):
+    """
+    Tests for the ConsumptionSeries class.
+    """
+    def setUp(self):
+        self.series = ConsumptionSeries([0.5, 1.5, 1.0],
+                                        [START, START + HALF_HOUR_SECONDS, START + 2 * HALF_HOUR_SECONDS],
+                                        [START + HALF_HOUR_SECONDS, START + 2 * HALF_HOUR_SECONDS, START + 3 * HALF_HOUR_SECONDS])
+
+    def test_iteration_yields_consumption_views(self):
+        """
+        Tests that iterating over a ConsumptionSeries yields Consumption views with local UK dates.
+        """
+        consumption = list(self.series)
+
+        self.assertEqual(3, len(consumption))
+        self.assertIsInstance(consumption[0], Consumption)
+        self.assertEqual(1.5, consumption[1].consumption)
+        self.assertEqual(datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc), consumption[1].interval_start)
+        self.assertEqual('2024-01-01T01:00:00+00:00', consumption[1].interval_end.isoformat())
+
+    def test_from_consumption_round_trips(self):
+        """
+        Tests that the from_consumption function recreates the arrays of a series.
+        """
+        series = ConsumptionSeries.from_consumption(self.series)
+
+        self.assertEqual(self.series.consumption.tolist(), series.consumption.tolist())
+        self.assertEqual(self.series.interval_starts.tolist(), series.interval_starts.tolist())
+        self.assertEqual(self.series.interval_ends.tolist(), series.interval_ends.tolist())
+
+    def test_slice_returns_series(self):
+        """
+        Tests that slicing a ConsumptionSeries returns a ConsumptionSeries.
+        """
+        series = self.series[1:]
+
+        self.assertIsInstance(series, ConsumptionSeries)
+        self.assertEqual([1.5, 1.0], series.consumption.tolist())
+
+    def test_concatenate_joins_series_in_order(self):
+        """
+        Tests that the concatenate function joins series end to end.
+        """
+        series = ConsumptionSeries.concatenate([self.series[:1], self.series[1:], ConsumptionSeries()])
+
+        self.assertEqual([0.5, 1.5, 1.0], series.consumption.tolist())
+
+    def test_mismatched_lengths_raise_error(self):
+        """
+        Tests that a ConsumptionSeries with arrays of different lengths raises an error.
+        """
+        with self.assertRaises(ValueError):
+            ConsumptionSeries([1.0], [START], [])
+
+class ConsumptionTests(unittest.TestCase):
+    """
+    Tests for the Consumption class.
+    """
+    def test_iso_strings_are_parsed_to_datetimes(self):
+        """
+        Tests that ISO-8601 interval strings are parsed to dates and times on creation.
+        """
+        consumption = Consumption(1.0, '2024-01-01T00:00:00Z', '2024-01-01T00:30:00Z')
+
+        self.assertEqual(datetime(2024, 1, 1, tzinfo=timezone.utc), consumption.interval_start)
+        self.assertEqual(datetime(2024, 1, 1, 0, 30, tzinfo=timezone.utc), consumption.interval_end)
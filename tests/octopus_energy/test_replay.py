@@ -0,0 +1,108 @@
+"""
+Tests for the replay module.
+"""
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from octopus_energy.client import OctopusEnergyClientFactory
+from octopus_energy.dates import HALF_HOUR_SECONDS, format_timestamp, to_timestamp
+from octopus_energy.model import ProductFiltering
+from octopus_energy.replay import ReplaySession
+
+FROM_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+TO_DATE = datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+class ReplayClientTests(unittest.TestCase):
+    """
+    Tests for clients created with the replay client type.
+    """
+    def test_get_consumption_pages_synthetic_data_through_client(self):
+        """
+        Tests that a replay client gets synthetic consumption for the period across pages.
+        """
+        client = OctopusEnergyClientFactory().create('REPLAY', meter_mpan='mpan', meter_serial='serial', page_size=10)
+
+        consumption = client.get_consumption(FROM_DATE, TO_DATE)
+
+        self.assertEqual(96, len(consumption))
+        self.assertEqual(list(range(to_timestamp(FROM_DATE), to_timestamp(TO_DATE), HALF_HOUR_SECONDS)),
+                         sorted(consumption.interval_starts.tolist()))
+
+    def test_get_consumption_with_grouping_resamples_data(self):
+        """
+        Tests that a replay client groups consumption as the API does.
+        """
+        client = OctopusEnergyClientFactory().create('FILE', meter_mpan='mpan', meter_serial='serial')
+
+        half_hourly = client.get_consumption(FROM_DATE, TO_DATE)
+        daily = client.get_consumption(FROM_DATE, TO_DATE, 'day')
+
+        self.assertEqual(2, len(daily))
+        self.assertAlmostEqual(sum(half_hourly.consumption), sum(daily.consumption), places=2)
+
+    def test_get_consumption_asynchronously_matches_synchronous_client(self):
+        """
+        Tests that an asynchronous replay client gets the same consumption as a synchronous one.
+        """
+        factory = OctopusEnergyClientFactory()
+        client = factory.create('REPLAY', meter_mpan='mpan', meter_serial='serial', page_size=7)
+        async_client = factory.create('REPLAY', meter_mpan='mpan', meter_serial='serial', page_size=7,
+                                      asynchronous=True)
+
+        consumption = client.get_consumption(FROM_DATE, TO_DATE)
+        async_consumption = asyncio.run(async_client.get_consumption(FROM_DATE, TO_DATE))
+
+        self.assertEqual(consumption.consumption.tolist(), async_consumption.consumption.tolist())
+
+    def test_get_products_filters_synthetic_products(self):
+        """
+        Tests that a replay client filters products by their flags.
+        """
+        client = OctopusEnergyClientFactory().create('REPLAY', page_size=7)
+
+        products = client.get_products(filtering=ProductFiltering.GREEN | ProductFiltering.VARIABLE)
+
+        self.assertEqual(10, len(products))
+        self.assertTrue(all(product.is_green and product.is_variable for product in products))
+
+    def test_get_consumption_and_account_from_fixtures(self):
+        """
+        Tests that a replay client serves recorded fixtures in place of synthetic data.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'consumption.json'), 'w', encoding='utf-8') as fixture_file:
+                json.dump([
+                    {
+                        'consumption': 0.5,
+                        'interval_start': format_timestamp(to_timestamp(FROM_DATE) + index * HALF_HOUR_SECONDS),
+                        'interval_end': format_timestamp(to_timestamp(FROM_DATE) + (index + 1) * HALF_HOUR_SECONDS)
+                    }
+                    for index in range(4)
+                ], fixture_file)
+            with open(os.path.join(directory, 'account.json'), 'w', encoding='utf-8') as fixture_file:
+                json.dump({'number': 'A-RECORDED', 'properties': []}, fixture_file)
+            client = OctopusEnergyClientFactory().create('REPLAY', account_number='A-1', fixture_directory=directory)
+
+            consumption = client.get_consumption()
+            account = client.get_account()
+
+        self.assertEqual([0.5] * 4, consumption.consumption.tolist())
+        self.assertEqual('A-RECORDED', account.number)
+
+class ReplaySessionTests(unittest.TestCase):
+    """
+    Tests for the ReplaySession class.
+    """
+    def test_get_with_unknown_path_returns_not_found(self):
+        """
+        Tests that the get function replays a 404 for a URL that is not part of the API.
+        """
+        response = ReplaySession().get('https://api.octopus.energy/v1/unknown')
+
+        self.assertEqual(404, response.status_code)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+"""
+Tests for the repository module.
+"""
+import asyncio
+import time
+import unittest
+from datetime import datetime, timezone
+from octopus_energy.cache import ConsumptionCache
+from octopus_energy.catalogue import ProductCatalogue
+from octopus_energy.client import OctopusEnergyClientFactory
+from octopus_energy.dates import HALF_HOUR_SECONDS, to_timestamp
+from octopus_energy.model import ConsumptionSeries, Product, ProductFiltering
+from octopus_energy.repository import AsyncOctopusEnergyRepository, OctopusEnergyRepository, summarise_consumption
+
+START = 1704067200
+
+class FakeClient:
+    """
+    A fake client serving half-hourly consumption data of 1 kWh per slot.
+    """
+    def __init__(self):
+        self.meter_mpan = 'mpan'
+        self.meter_serial = 'serial'
+        self.page_size = 48
+        self.max_workers = 2
+        self.requested_ranges = []
+        self.missing_slots = set()
+        self.product_request_count = 0
+
+    def get_consumption(self, from_date: datetime, to_date: datetime, grouping='half-hour'):
+        """
+        Serves consumption data for every slot in the range that is not missing.
+        """
+        self.requested_ranges.append((from_date, to_date))
+        slots = [slot for slot in range(to_timestamp(from_date), to_timestamp(to_date), HALF_HOUR_SECONDS)
+                 if slot not in self.missing_slots]
+        return ConsumptionSeries([1.0] * len(slots), slots, [slot + HALF_HOUR_SECONDS for slot in slots])
+
+    def get_products(self, availability_date: datetime = None, filtering: ProductFiltering = None):
+        """
+        Serves a green and a non-green product.
+        """
+        self.product_request_count += 1
+        return [Product(code, code, code, code, True, code == 'GREEN', False, False, False, False, 12,
+                        '2024-01-01T00:00:00Z', None, [], 'OCTOPUS_ENERGY')
+                for code in ['GREEN', 'STANDARD']]
+
+class OctopusEnergyRepositoryTests(unittest.TestCase):
+    """
+    Tests for the OctopusEnergyRepository class.
+    """
+    def setUp(self):
+        self.client = FakeClient()
+        self.now = time.time()
+        self.cache = ConsumptionCache(':memory:', clock=lambda: self.now)
+        self.repository = OctopusEnergyRepository(self.client, self.cache, ProductCatalogue())
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_get_consumption_with_cache_fetches_only_missing_ranges(self):
+        """
+        Tests that the get_consumption function only fetches data not already in the cache.
+        """
+        self.repository.get_consumption(datetime(2024, 1, 2, tzinfo=timezone.utc),
+                                        datetime(2024, 1, 3, tzinfo=timezone.utc))
+
+        consumption = self.repository.get_consumption(datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                                      datetime(2024, 1, 3, tzinfo=timezone.utc))
+
+        self.assertEqual(96, len(consumption))
+        self.assertEqual((datetime(2024, 1, 1, tzinfo=timezone.utc),
+                          datetime(2024, 1, 2, tzinfo=timezone.utc)),
+                         self.client.requested_ranges[-1])
+
+    def test_get_consumption_with_cache_resamples_groupings_without_fetching(self):
+        """
+        Tests that the get_consumption function serves coarser groupings from cached data.
+        """
+        self.repository.get_consumption(datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                        datetime(2024, 1, 3, tzinfo=timezone.utc))
+        request_count = len(self.client.requested_ranges)
+
+        consumption = self.repository.get_consumption(datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                                      datetime(2024, 1, 3, tzinfo=timezone.utc),
+                                                      'day')
+
+        self.assertEqual([48.0, 48.0], [entry.consumption for entry in consumption])
+        self.assertEqual(request_count, len(self.client.requested_ranges))
+
+    def test_iter_consumption_with_cache_yields_windows_of_half_hourly_data(self):
+        """
+        Tests that the iter_consumption function yields cached half-hourly data newest first, a
+        window of as many slots as the client fetches at once at a time.
+        """
+        chunks = list(self.repository.iter_consumption(datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                                       datetime(2024, 1, 6, tzinfo=timezone.utc)))
+        interval_starts = ConsumptionSeries.concatenate(chunks).interval_starts
+
+        self.assertEqual([96, 96, 48], [len(chunk) for chunk in chunks])
+        self.assertEqual(3, len(self.client.requested_ranges))
+        self.assertEqual(sorted(interval_starts.tolist(), reverse=True), interval_starts.tolist())
+
+    def test_get_products_with_catalogue_fetches_products_once(self):
+        """
+        Tests that the get_products function answers repeated queries from the product catalogue.
+        """
+        all_products = self.repository.get_products()
+        green_products = self.repository.get_products(filtering=ProductFiltering.GREEN)
+
+        self.assertEqual(['GREEN', 'STANDARD'], [product.code for product in all_products])
+        self.assertEqual(['GREEN'], [product.code for product in green_products])
+        self.assertEqual(1, self.client.product_request_count)
+
+    def test_sync_consumption_fetches_from_high_water_mark_and_backfills_gaps(self):
+        """
+        Tests that the sync_consumption function fetches new data and backfills gaps.
+        """
+        gap_start = to_timestamp(datetime(2024, 1, 1, 12, tzinfo=timezone.utc))
+        self.client.missing_slots = {gap_start, gap_start + HALF_HOUR_SECONDS}
+        self.now = to_timestamp(datetime(2024, 1, 2, 1, tzinfo=timezone.utc))
+        first_sync = self.repository.sync_consumption(datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                                      datetime(2024, 1, 2, tzinfo=timezone.utc))
+        self.client.missing_slots = set()
+
+        self.now = to_timestamp(datetime(2024, 1, 3, 1, tzinfo=timezone.utc))
+        second_sync = self.repository.sync_consumption(to_date=datetime(2024, 1, 3, tzinfo=timezone.utc))
+
+        self.assertEqual(46, first_sync.new_slot_count)
+        self.assertEqual(48, second_sync.new_slot_count)
+        self.assertEqual(2, second_sync.backfilled_slot_count)
+        self.assertEqual(0, second_sync.updated_slot_count)
+        self.assertEqual(datetime(2024, 1, 2, tzinfo=timezone.utc), self.client.requested_ranges[1][0])
+
+    def test_sync_consumption_stops_backfilling_empty_slots_once_settled(self):
+        """
+        Tests that the sync_consumption function fetches a gap that stays empty again until it is
+        settled, and then no more.
+        """
+        gap_start = to_timestamp(datetime(2024, 1, 1, 12, tzinfo=timezone.utc))
+        self.client.missing_slots = {gap_start}
+
+        self.now = to_timestamp(datetime(2024, 1, 2, 1, tzinfo=timezone.utc))
+        self.repository.sync_consumption(datetime(2024, 1, 1, tzinfo=timezone.utc),
+                                         datetime(2024, 1, 2, tzinfo=timezone.utc))
+        self.now = to_timestamp(datetime(2024, 1, 4, tzinfo=timezone.utc))
+        self.repository.sync_consumption(to_date=datetime(2024, 1, 3, tzinfo=timezone.utc))
+        self.now = to_timestamp(datetime(2024, 1, 5, tzinfo=timezone.utc))
+        third_sync = self.repository.sync_consumption(to_date=datetime(2024, 1, 4, tzinfo=timezone.utc))
+
+        gap_requests = [(from_date, to_date) for from_date, to_date in self.client.requested_ranges
+                        if to_timestamp(from_date) <= gap_start < to_timestamp(to_date)]
+        self.assertEqual(2, len(gap_requests))
+        self.assertEqual(0, third_sync.backfilled_slot_count)
+        self.assertEqual(datetime(2024, 1, 3, tzinfo=timezone.utc), self.client.requested_ranges[-1][0])
+
+    def test_sync_consumption_without_start_date_on_first_sync_raises_error(self):
+        """
+        Tests that the sync_consumption function raises an error when a meter is first synced
+        without a start date.
+        """
+        with self.assertRaises(ValueError):
+            self.repository.sync_consumption()
+
+class SummariseConsumptionTests(unittest.TestCase):
+    """
+    Tests for the summarise_consumption function.
+    """
+    def test_summarise_consumption_calculates_statistics(self):
+        """
+        Tests that the summarise_consumption function calculates each statistic.
+        """
+        slots = [START + index * HALF_HOUR_SECONDS for index in range(4)]
+        consumption_data = ConsumptionSeries([0.5, 2.0, 1.0, 0.5],
+                                             slots,
+                                             [slot + HALF_HOUR_SECONDS for slot in slots])
+
+        summary = summarise_consumption(consumption_data)
+
+        self.assertEqual(4, summary.count)
+        self.assertEqual(4.0, summary.total)
+        self.assertEqual(1.0, summary.mean)
+        self.assertEqual(0.75, summary.median)
+        self.assertEqual(2.0, summary.maximum.consumption)
+        self.assertEqual(slots[1], to_timestamp(summary.maximum.interval_start))
+        self.assertEqual(0.5, summary.minimum.consumption)
+        self.assertEqual(slots[0], to_timestamp(summary.interval_start))
+        self.assertEqual(slots[-1] + HALF_HOUR_SECONDS, to_timestamp(summary.interval_end))
+
+    def test_summarise_consumption_with_no_data_returns_empty_summary(self):
+        """
+        Tests that the summarise_consumption function handles empty consumption data.
+        """
+        summary = summarise_consumption(ConsumptionSeries())
+
+        self.assertEqual(0, summary.count)
+        self.assertEqual(0.0, summary.total)
+        self.assertIsNone(summary.maximum)
+
+class AsyncFakeClient(FakeClient):
+    """
+    An asynchronous fake client serving half-hourly consumption data of 1 kWh per slot, taking
+    a short time to respond.
+    """
+    def __init__(self):
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_consumption(self, from_date: datetime, to_date: datetime, grouping='half-hour'):
+        """
+        Serves consumption data for every slot in the range, counting the requests in flight.
+        """
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return super().get_consumption(from_date, to_date, grouping)
+
+class AsyncOctopusEnergyRepositoryTests(unittest.TestCase):
+    """
+    Tests for the AsyncOctopusEnergyRepository class.
+    """
+    def test_get_consumption_with_cache_fetches_missing_ranges_concurrently(self):
+        """
+        Tests that the get_consumption function fetches separate ranges missing from the cache at
+        the same time.
+        """
+        client = AsyncFakeClient()
+        cache = ConsumptionCache(':memory:')
+        cached_slots = [START + 2 * 86400 + index * HALF_HOUR_SECONDS for index in range(96)]
+        cache.store_consumption('mpan', 'serial', cached_slots[0], cached_slots[-1] + HALF_HOUR_SECONDS,
+                                ConsumptionSeries([1.0] * 96, cached_slots,
+                                                  [slot + HALF_HOUR_SECONDS for slot in cached_slots]))
+
+        consumption = asyncio.run(AsyncOctopusEnergyRepository(client, cache).get_consumption(
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 1, 6, tzinfo=timezone.utc)))
+
+        self.assertEqual(240, len(consumption))
+        self.assertEqual(2, len(client.requested_ranges))
+        self.assertEqual(2, client.max_in_flight)
+        cache.close()
+
+class ConsumptionOrderTests(unittest.TestCase):
+    """
+    Tests that consumption data is in the same order whether it is served from the cache or
+    fetched from the API.
+    """
+    def setUp(self):
+        self.from_date = datetime(2024, 1, 1)
+        self.to_date = datetime(2024, 1, 4)
+
+    def test_get_consumption_with_cache_matches_api_order(self):
+        """
+        Tests that the get_consumption function returns cached data newest first, as the API does.
+        """
+        client = OctopusEnergyClientFactory().create('REPLAY', meter_mpan='mpan', meter_serial='serial', page_size=10)
+        for grouping in ['half-hour', 'day']:
+            with self.subTest(grouping=grouping):
+                cache = ConsumptionCache(':memory:')
+                uncached_consumption = OctopusEnergyRepository(client).get_consumption(self.from_date,
+                                                                                      self.to_date,
+                                                                                      grouping)
+
+                cached_consumption = OctopusEnergyRepository(client, cache).get_consumption(self.from_date,
+                                                                                            self.to_date,
+                                                                                            grouping)
+
+                self.assertEqual(uncached_consumption.interval_starts.tolist(),
+                                 cached_consumption.interval_starts.tolist())
+                self.assertGreater(cached_consumption.interval_starts[0], cached_consumption.interval_starts[-1])
+                cache.close()
+
+    def test_async_get_consumption_with_cache_matches_api_order(self):
+        """
+        Tests that the asynchronous get_consumption function returns cached data newest first, as
+        the API does.
+        """
+        async def get_consumption(cache: ConsumptionCache = None) -> ConsumptionSeries:
+            client = OctopusEnergyClientFactory().create('REPLAY',
+                                                         meter_mpan='mpan',
+                                                         meter_serial='serial',
+                                                         page_size=10,
+                                                         asynchronous=True)
+            return await AsyncOctopusEnergyRepository(client, cache).get_consumption(self.from_date, self.to_date)
+
+        cache = ConsumptionCache(':memory:')
+        uncached_consumption = asyncio.run(get_consumption())
+
+        cached_consumption = asyncio.run(get_consumption(cache))
+
+        self.assertEqual(uncached_consumption.interval_starts.tolist(), cached_consumption.interval_starts.tolist())
+        cache.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests for the resampling module.
+"""
+import unittest
+from datetime import datetime
+import numpy as np
+from octopus_energy.dates import HALF_HOUR_SECONDS, to_timestamp
+from octopus_energy.model import ConsumptionSeries
+from octopus_energy.resampling import resample_consumption
+
+def create_consumption(from_date: datetime, to_date: datetime) -> ConsumptionSeries:
+    """
+    Creates half-hourly consumption data of 1 kWh per slot between two local UK dates.
+    """
+    slots = np.arange(to_timestamp(from_date), to_timestamp(to_date), HALF_HOUR_SECONDS)
+    return ConsumptionSeries(np.ones(len(slots)), slots, slots + HALF_HOUR_SECONDS)
+
+class ResampleConsumptionTests(unittest.TestCase):
+    """
+    Tests for the resample_consumption function.
+    """
+    def test_half_hour_grouping_returns_data_unchanged(self):
+        """
+        Tests that the resample_consumption function returns half-hourly data unchanged.
+        """
+        consumption_data = create_consumption(datetime(2024, 1, 1), datetime(2024, 1, 2))
+
+        self.assertIs(consumption_data, resample_consumption(consumption_data, 'half-hour'))
+
+    def test_hour_grouping_sums_pairs_of_slots(self):
+        """
+        Tests that the resample_consumption function sums half-hour slots into hours.
+        """
+        consumption_data = create_consumption(datetime(2024, 1, 1), datetime(2024, 1, 1, 3))
+
+        resampled_data = resample_consumption(consumption_data, 'hour')
+
+        self.assertEqual([2.0, 2.0, 2.0], resampled_data.consumption.tolist())
+
+    def test_day_grouping_follows_local_midnight_across_clock_changes(self):
+        """
+        Tests that the resample_consumption function starts days at local midnight when the clocks change.
+        """
+        consumption_data = create_consumption(datetime(2024, 3, 30), datetime(2024, 4, 1))
+
+        resampled_data = resample_consumption(consumption_data, 'day')
+
+        self.assertEqual([48.0, 46.0], resampled_data.consumption.tolist())
+        self.assertEqual(['2024-03-30T00:00:00+00:00', '2024-03-31T00:00:00+00:00'],
+                         [entry.interval_start.isoformat() for entry in resampled_data])
+        self.assertEqual('2024-04-01T00:00:00+01:00', resampled_data[1].interval_end.isoformat())
+
+    def test_week_grouping_starts_on_monday(self):
+        """
+        Tests that the resample_consumption function starts weeks on Mondays.
+        """
+        consumption_data = create_consumption(datetime(2024, 1, 3), datetime(2024, 1, 10))
+
+        resampled_data = resample_consumption(consumption_data, 'week')
+
+        self.assertEqual([5 * 48.0, 2 * 48.0], resampled_data.consumption.tolist())
+        self.assertEqual(to_timestamp(datetime(2024, 1, 1)), to_timestamp(resampled_data[0].interval_start))
+
+    def test_quarter_grouping_omits_periods_without_data(self):
+        """
+        Tests that the resample_consumption function omits quarters without any data.
+        """
+        consumption_data = ConsumptionSeries.concatenate([
+            create_consumption(datetime(2024, 3, 31, 23), datetime(2024, 4, 1, 1)),
+            create_consumption(datetime(2024, 12, 31, 23), datetime(2025, 1, 1))
+        ])
+
+        resampled_data = resample_consumption(consumption_data, 'quarter')
+
+        self.assertEqual([2.0, 2.0, 2.0], resampled_data.consumption.tolist())
+        self.assertEqual(['2024-01-01T00:00:00+00:00', '2024-04-01T00:00:00+01:00', '2024-10-01T00:00:00+01:00'],
+                         [entry.interval_start.isoformat() for entry in resampled_data])
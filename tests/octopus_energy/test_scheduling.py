@@ -0,0 +1,205 @@
+"""
+Tests for the scheduling module.
+"""
+import asyncio
+import threading
+import unittest
+import httpx
+import requests
+from octopus_energy.scheduling import RequestScheduler, parse_retry_after
+
+def create_response(status_code: int, headers: dict[str, str] = None) -> httpx.Response:
+    """
+    Creates an HTTP response with the given status code and headers.
+    """
+    return httpx.Response(status_code,
+                          headers=headers,
+                          request=httpx.Request('GET', 'https://api.octopus.energy/v1/test'))
+
+class FakeClock:
+    """
+    A fake monotonic clock that only moves when advanced.
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class RequestSchedulerTests(unittest.TestCase):
+    """
+    Tests for the RequestScheduler class.
+    """
+    def test_send_retries_rate_limited_and_server_errors(self):
+        """
+        Tests that the send function retries 429 and 5xx responses until one succeeds.
+        """
+        responses = [create_response(429, {'Retry-After': '0'}), create_response(503), create_response(200)]
+        scheduler = RequestScheduler(backoff=0)
+
+        response = scheduler.send(lambda: responses.pop(0))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual([], responses)
+
+    def test_send_retries_timeouts(self):
+        """
+        Tests that the send function retries requests that time out.
+        """
+        attempts = []
+
+        def request() -> httpx.Response:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise requests.Timeout()
+            return create_response(200)
+
+        response = RequestScheduler(backoff=0).send(request)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(attempts))
+
+    def test_send_with_retries_used_up_raises_error(self):
+        """
+        Tests that the send function raises the error status once the retries are used up.
+        """
+        attempts = []
+
+        def request() -> httpx.Response:
+            attempts.append(1)
+            return create_response(500)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            RequestScheduler(max_retries=2, backoff=0).send(request)
+
+        self.assertEqual(3, len(attempts))
+
+    def test_send_with_client_error_raises_without_retrying(self):
+        """
+        Tests that the send function raises a client error status without retrying it.
+        """
+        attempts = []
+
+        def request() -> httpx.Response:
+            attempts.append(1)
+            return create_response(401)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            RequestScheduler(backoff=0).send(request)
+
+        self.assertEqual(1, len(attempts))
+
+    def test_send_async_retries_server_errors(self):
+        """
+        Tests that the send_async function retries 5xx responses until one succeeds.
+        """
+        responses = [create_response(502), create_response(200)]
+
+        async def request() -> httpx.Response:
+            return responses.pop(0)
+
+        response = asyncio.run(RequestScheduler(backoff=0).send_async(request))
+
+        self.assertEqual(200, response.status_code)
+
+    def test_send_async_limits_requests_in_flight(self):
+        """
+        Tests that the send_async function sends no more than the maximum concurrency of
+        requests at once.
+        """
+        in_flight = []
+        max_in_flight = []
+
+        async def request() -> httpx.Response:
+            in_flight.append(1)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.pop()
+            return create_response(200)
+
+        async def send_all(scheduler: RequestScheduler) -> list[httpx.Response]:
+            return await asyncio.gather(*(scheduler.send_async(request) for _ in range(6)))
+
+        responses = asyncio.run(send_all(RequestScheduler(burst=6, max_concurrency=2)))
+
+        self.assertEqual(6, len(responses))
+        self.assertEqual(2, max(max_in_flight))
+
+    def test_send_async_waits_for_concurrency_held_by_another_thread(self):
+        """
+        Tests that the send_async function waits for the concurrency limit held by another thread
+        without blocking the event loop, and that a cancelled request gives the limit back.
+        """
+        scheduler = RequestScheduler(max_concurrency=1)
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold_concurrency() -> None:
+            with scheduler.concurrency:
+                held.set()
+                release.wait()
+
+        async def request() -> httpx.Response:
+            return create_response(200)
+
+        async def send_while_held() -> tuple[bool, httpx.Response]:
+            cancelled_send = asyncio.ensure_future(scheduler.send_async(request))
+            waiting_send = asyncio.ensure_future(scheduler.send_async(request))
+            await asyncio.sleep(0.05)
+            cancelled_send.cancel()
+            is_waiting = not waiting_send.done()
+            release.set()
+            return is_waiting, await waiting_send
+
+        holder = threading.Thread(target=hold_concurrency)
+        holder.start()
+        held.wait()
+        is_waiting, response = asyncio.run(send_while_held())
+        holder.join()
+
+        self.assertTrue(is_waiting)
+        self.assertEqual(200, response.status_code)
+        self.assertTrue(scheduler.concurrency.acquire(timeout=1))
+
+    def test_get_retry_delay_caps_retry_after_at_max_backoff(self):
+        """
+        Tests that the get_retry_delay function waits as long as a Retry-After header asks, up to
+        the maximum backoff.
+        """
+        scheduler = RequestScheduler(max_backoff=30)
+
+        short_delay = scheduler.get_retry_delay(create_response(429, {'Retry-After': '5'}), 0)
+        long_delay = scheduler.get_retry_delay(create_response(429, {'Retry-After': '86400'}), 0)
+
+        self.assertEqual(5.0, short_delay)
+        self.assertEqual(30.0, long_delay)
+
+    def test_reserve_delays_requests_beyond_burst(self):
+        """
+        Tests that the reserve function releases a burst at once and then paces requests at the
+        rate limit, refilling tokens as time passes.
+        """
+        clock = FakeClock()
+        scheduler = RequestScheduler(rate_limit=2, burst=2, clock=clock)
+
+        delays = [scheduler.reserve() for _ in range(4)]
+        clock.now = 10.0
+
+        self.assertEqual([0.0, 0.0, 0.5, 1.0], delays)
+        self.assertEqual(0.0, scheduler.reserve())
+
+class ParseRetryAfterTests(unittest.TestCase):
+    """
+    Tests for the parse_retry_after function.
+    """
+    def test_parse_retry_after_parses_seconds_and_dates(self):
+        """
+        Tests that the parse_retry_after function parses delays in seconds and past HTTP dates.
+        """
+        self.assertEqual(2.5, parse_retry_after('2.5'))
+        self.assertEqual(0.0, parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'))
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+
+if __name__ == '__main__':
+    unittest.main()
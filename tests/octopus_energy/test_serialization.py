@@ -0,0 +1,90 @@
+"""
+Tests for the serialization module.
+"""
+from datetime import datetime, timezone
+import json
+import unittest
+from octopus_energy.dates import parse_timestamp
+from octopus_energy.model import Account, Consumption, ConsumptionSeries, ConsumptionSummary
+from octopus_energy.serialization import encode_json, register_schema, to_plain_value
+
+class Tariff:
+    """
+    A type that is not registered with the serializer by default.
+    """
+    def __init__(self, name: str, unit_rate: float):
+        self.name = name
+        self.unit_rate = unit_rate
+        self.secret = 'not serialized'
+
+class SerializationTests(unittest.TestCase):
+    """
+    Tests for the serialization module.
+    """
+    def setUp(self):
+        self.series = ConsumptionSeries([0.5, 0.25],
+                                        [parse_timestamp('2024-07-01T00:00:00+01:00'),
+                                         parse_timestamp('2024-07-01T00:30:00+01:00')],
+                                        [parse_timestamp('2024-07-01T00:30:00+01:00'),
+                                         parse_timestamp('2024-07-01T01:00:00+01:00')])
+
+    def test_encode_json_with_consumption_series_matches_consumption(self):
+        """
+        Tests that the encode_json function encodes a consumption series as the list of its
+        consumption data.
+        """
+        encoded_series = encode_json(self.series)
+
+        expected_series = encode_json(list(self.series))
+        self.assertEqual(expected_series, encoded_series)
+        self.assertEqual({'consumption': 0.5,
+                          'interval_start': '2024-07-01T00:00:00+01:00',
+                          'interval_end': '2024-07-01T00:30:00+01:00'},
+                         json.loads(encoded_series)[0])
+
+    def test_encode_json_with_nested_types_uses_schemas(self):
+        """
+        Tests that the encode_json function encodes nested registered types by their schemas,
+        without type tags.
+        """
+        maximum = Consumption(1.5, datetime(2024, 7, 1, tzinfo=timezone.utc), datetime(2024, 7, 1, 0, 30, tzinfo=timezone.utc))
+        summary = ConsumptionSummary(2, 2.0, 1.0, 1.0, 1.5, maximum, maximum, maximum.interval_start, maximum.interval_end)
+
+        decoded_summary = json.loads(encode_json(summary))
+
+        self.assertEqual(['count', 'total', 'mean', 'median', 'p95', 'maximum', 'minimum', 'interval_start', 'interval_end'],
+                         list(decoded_summary))
+        self.assertEqual({'consumption': 1.5,
+                          'interval_start': '2024-07-01T00:00:00+00:00',
+                          'interval_end': '2024-07-01T00:30:00+00:00'},
+                         decoded_summary['maximum'])
+
+    def test_encode_json_is_compact_unless_pretty(self):
+        """
+        Tests that the encode_json function encodes compact JSON unless pretty JSON is requested.
+        """
+        account = Account('A-1', [])
+
+        self.assertEqual('{"number":"A-1","properties":[]}', encode_json(account))
+        self.assertEqual('{\n "number": "A-1",\n "properties": []\n}', encode_json(account, pretty=True))
+
+    def test_register_schema_limits_fields(self):
+        """
+        Tests that registering a schema for a type limits its serialized fields to the schema.
+        """
+        register_schema(Tariff, ('name', 'unit_rate'))
+
+        self.assertEqual('{"name":"Agile","unit_rate":0.25}', encode_json(Tariff('Agile', 0.25)))
+
+    def test_to_plain_value_converts_nested_values(self):
+        """
+        Tests that the to_plain_value function converts objects to dictionaries, lists and plain values.
+        """
+        plain_value = to_plain_value({'series': self.series, 'account': Account('A-1', [])})
+
+        self.assertEqual({'series': json.loads(encode_json(self.series)),
+                          'account': {'number': 'A-1', 'properties': []}},
+                         plain_value)
+
+if __name__ == '__main__':
+    unittest.main()